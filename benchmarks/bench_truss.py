@@ -0,0 +1,81 @@
+"""Scaling benchmark of the truss engine on generated topologies.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_truss --sizes 100 1000 10000 --types pratt warren
+
+Space grids grow with the cube of their size, so they take their own
+``--grid-sizes`` (bays per side).
+
+For every topology and panel count it reports the time to assemble the
+equilibrium matrix, to build and factorize a :class:`~mechanics.truss.TrussSystem`,
+to solve one load case, and the peak memory traced while doing so.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, List, Sequence, Tuple
+
+from mechanics.generators import GENERATORS, space_grid
+from mechanics.truss import TrussModel, TrussSystem, assemble_equilibrium
+
+
+def _timed(action: Callable[[], object]) -> Tuple[object, float]:
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+def measure(model: TrussModel, method: str = "auto") -> Tuple[float, float, float, float, str]:
+    """``(assemble, factorize, solve)`` seconds, peak MiB and the strategy used.
+
+    Memory is traced in a second run because tracemalloc slows the
+    interpreter down and would distort the timings.
+    """
+
+    _, assemble = _timed(lambda: assemble_equilibrium(model))
+    system, factorize = _timed(lambda: TrussSystem(model, method=method))
+    _, solve = _timed(lambda: system.solve(model.loads))
+
+    tracemalloc.start()
+    try:
+        TrussSystem(model, method=method).solve(model.loads)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return assemble, factorize, solve, peak / 2**20, system.strategy
+
+
+def run(
+    types: Sequence[str],
+    sizes: Sequence[int],
+    method: str = "auto",
+    grid_sizes: Sequence[int] = (5, 10, 20),
+) -> List[Tuple]:
+    rows = []
+    for name in types:
+        for size in grid_sizes if name == "grid" else sizes:
+            model = space_grid(size) if name == "grid" else GENERATORS[name](size)
+            rows.append((name, size, model.num_members) + measure(model, method))
+    return rows
+
+
+def main(argv: Sequence[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--types", nargs="+", default=sorted(GENERATORS) + ["grid"], choices=sorted(GENERATORS) + ["grid"])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000], help="panels of the plane trusses")
+    parser.add_argument("--grid-sizes", nargs="+", type=int, default=[5, 10, 20], help="bays per side of the space grid")
+    parser.add_argument("--method", default="auto")
+    args = parser.parse_args(argv)
+
+    header = f"{'type':<7}{'size':>7}{'members':>9}{'assemble s':>12}{'factor s':>11}{'solve s':>10}{'peak MiB':>10}  strategy"
+    print(header)
+    print("-" * len(header))
+    for name, size, members, assemble, factorize, solve, peak, strategy in run(args.types, args.sizes, args.method, args.grid_sizes):
+        print(f"{name:<7}{size:>7}{members:>9}{assemble:>12.4f}{factorize:>11.4f}{solve:>10.4f}{peak:>10.1f}  {strategy}")
+
+
+if __name__ == "__main__":
+    main()
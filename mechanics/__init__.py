@@ -1,8 +1,121 @@
-from .viga import PointLoad, DistributedLoad, compute_beam_analysis, torsor_at
+from .viga import (
+    BeamDiagrams,
+    BeamLoadIndex,
+    PointLoad,
+    DistributedLoad,
+    compute_beam_analysis,
+    compute_beam_diagrams,
+    torsor_at,
+)
+from .storage import MemmapResultSink, StoredResults, open_results
+from .batch import BatchResult, run_beam_batch
+from .stress import (
+    SectionProperties,
+    StressField,
+    composite_section,
+    compute_stress_field,
+    rectangular_section,
+)
+from .sections import CatalogEntry, SectionCatalog, select_section, standard_catalog
+from .truss import (
+    NodeMemberIndex,
+    ReducedTruss,
+    StiffnessSolution,
+    TrussComputationError,
+    TrussDiagnostics,
+    TrussModel,
+    TrussLoadCases,
+    TrussSolution,
+    TrussSystem,
+    diagnose_truss,
+    reduce_truss,
+    solve_truss,
+    solve_truss_stiffness,
+    thermal_elongations,
+)
+from .influence import InfluenceLines, MovingLoadEnvelope, influence_lines
+from .cuts import SectionCutIndex, members_crossing_line
+from .frame import (
+    FrameComputationError,
+    FrameModel,
+    FrameSolution,
+    FrameSystem,
+    MemberDiagrams,
+    solve_frame,
+)
+from .deformed import amplification_factor, frame_deformed_shape, polyline, truss_deformed_shape
+from .gerber import GerberBeamResult, GerberSupport, solve_gerber_beam
+from .generators import howe_truss, k_truss, pratt_truss, space_grid, warren_truss
+from .layout import LayoutResult, ground_structure, optimise_layout
+from .design import MemberChecks, MemberSections, check_members
+from .io import ModelImportError, read_frame, read_truss
 
 __all__ = [
+    "BeamDiagrams",
+    "BeamLoadIndex",
     "PointLoad",
     "DistributedLoad",
     "compute_beam_analysis",
+    "compute_beam_diagrams",
     "torsor_at",
+    "MemmapResultSink",
+    "StoredResults",
+    "open_results",
+    "BatchResult",
+    "run_beam_batch",
+    "SectionProperties",
+    "StressField",
+    "composite_section",
+    "compute_stress_field",
+    "rectangular_section",
+    "CatalogEntry",
+    "SectionCatalog",
+    "select_section",
+    "standard_catalog",
+    "NodeMemberIndex",
+    "ReducedTruss",
+    "StiffnessSolution",
+    "TrussComputationError",
+    "TrussDiagnostics",
+    "TrussModel",
+    "TrussLoadCases",
+    "TrussSolution",
+    "TrussSystem",
+    "diagnose_truss",
+    "reduce_truss",
+    "solve_truss",
+    "solve_truss_stiffness",
+    "thermal_elongations",
+    "InfluenceLines",
+    "MovingLoadEnvelope",
+    "influence_lines",
+    "SectionCutIndex",
+    "members_crossing_line",
+    "FrameComputationError",
+    "FrameModel",
+    "FrameSolution",
+    "FrameSystem",
+    "MemberDiagrams",
+    "solve_frame",
+    "amplification_factor",
+    "frame_deformed_shape",
+    "polyline",
+    "truss_deformed_shape",
+    "GerberBeamResult",
+    "GerberSupport",
+    "solve_gerber_beam",
+    "pratt_truss",
+    "howe_truss",
+    "warren_truss",
+    "k_truss",
+    "space_grid",
+    "LayoutResult",
+    "ground_structure",
+    "optimise_layout",
+    "MemberChecks",
+    "MemberSections",
+    "check_members",
+    "ModelImportError",
+    "read_frame",
+    "read_truss",
 ]
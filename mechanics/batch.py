@@ -0,0 +1,197 @@
+"""Parallel execution of large beam batches.
+
+Configurations are sharded in contiguous chunks across a
+:class:`~concurrent.futures.ProcessPoolExecutor`. Workers write their rows
+directly into output buffers shared with the parent, either
+:mod:`multiprocessing.shared_memory` blocks or the memmaps of a
+:class:`~mechanics.storage.MemmapResultSink`, so only the configurations and
+a small error map cross the process boundary.
+"""
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .storage import DIAGRAM_FIELDS, REACTION_KEYS, MemmapResultSink
+from .viga import compute_beam_diagrams
+
+BeamConfig = Mapping[str, Any]
+
+# Every worker gets about this many chunks so that slow beams (many loads)
+# do not leave cores idle at the end while still amortising the IPC cost of
+# shipping each chunk.
+CHUNKS_PER_WORKER = 4
+
+# (kind, location, shape, dtype, row offset); kind is "shm" or "npy".
+_Target = Tuple[str, str, Tuple[int, ...], str, int]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Diagrams of a batch stacked row by row in input order.
+
+    Rows whose configuration failed are filled with NaN and the error message
+    is kept in :attr:`errors` under the row index.
+    """
+
+    positions: np.ndarray
+    shear: np.ndarray
+    moment: np.ndarray
+    torsor: np.ndarray
+    reactions: np.ndarray
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.shear.shape[0])
+
+
+def _default_chunksize(count: int, workers: int) -> int:
+    return max(1, math.ceil(count / (workers * CHUNKS_PER_WORKER)))
+
+
+def _chunk_bounds(count: int, chunksize: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + chunksize, count)) for start in range(0, count, chunksize)]
+
+
+def _fill_rows(
+    arrays: Mapping[str, np.ndarray],
+    configs: Sequence[BeamConfig],
+    start: int,
+    num_points: int,
+) -> Dict[int, str]:
+    errors: Dict[int, str] = {}
+    for offset, config in enumerate(configs):
+        row = start + offset
+        try:
+            diagrams = compute_beam_diagrams(**{**config, "num_points": num_points})
+        except (TypeError, ValueError) as exc:
+            errors[row] = str(exc)
+            for array in arrays.values():
+                array[row] = np.nan
+            continue
+        for name in DIAGRAM_FIELDS:
+            arrays[name][row] = getattr(diagrams, name)
+        arrays["reactions"][row] = [diagrams.reactions.get(key, 0.0) for key in REACTION_KEYS]
+    return errors
+
+
+def _attach(targets: Mapping[str, _Target]):
+    arrays: Dict[str, np.ndarray] = {}
+    handles: List[shared_memory.SharedMemory] = []
+    for name, (kind, location, shape, dtype, row_offset) in targets.items():
+        if kind == "shm":
+            block = shared_memory.SharedMemory(name=location)
+            handles.append(block)
+            array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        else:
+            array = np.load(location, mmap_mode="r+")
+        arrays[name] = array[row_offset:]
+    return arrays, handles
+
+
+def _run_chunk(
+    targets: Mapping[str, _Target],
+    configs: Sequence[BeamConfig],
+    start: int,
+    num_points: int,
+) -> Dict[int, str]:
+    arrays, handles = _attach(targets)
+    try:
+        errors = _fill_rows(arrays, configs, start, num_points)
+        for array in arrays.values():
+            if isinstance(array, np.memmap):
+                array.flush()
+        return errors
+    finally:
+        del arrays
+        for block in handles:
+            block.close()
+
+
+def _field_shapes(count: int, num_points: int) -> Dict[str, Tuple[int, ...]]:
+    shapes: Dict[str, Tuple[int, ...]] = {name: (count, num_points) for name in DIAGRAM_FIELDS}
+    shapes["reactions"] = (count, len(REACTION_KEYS))
+    return shapes
+
+
+def run_beam_batch(
+    configs: Sequence[BeamConfig],
+    *,
+    num_points: int = 800,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    sink: Optional[MemmapResultSink] = None,
+    labels: Optional[List[str]] = None,
+) -> BatchResult:
+    """Analyse many beams in parallel.
+
+    Each configuration holds the keyword arguments of
+    :func:`~mechanics.viga.compute_beam_analysis`; ``num_points`` is forced to
+    the batch value so that all rows share one shape. When ``sink`` is given the
+    workers write straight into its memmaps and the returned arrays are views
+    over the reserved rows; otherwise the results travel through shared memory
+    and are copied once into regular arrays.
+    """
+
+    configs = list(configs)
+    count = len(configs)
+    workers = max_workers or os.cpu_count() or 1
+    workers = max(1, min(workers, count or 1))
+    chunk = chunksize or _default_chunksize(count, workers)
+    shapes = _field_shapes(count, num_points)
+    dtype = sink.dtype if sink is not None else np.dtype(float)
+
+    if sink is not None and sink.num_points != num_points:
+        raise ValueError(
+            f"Sink stores {sink.num_points} points per diagram, batch uses {num_points}."
+        )
+
+    errors: Dict[int, str] = {}
+    blocks: List[shared_memory.SharedMemory] = []
+    shared_views: Dict[str, np.ndarray] = {}
+    try:
+        if sink is not None:
+            first_row = sink.reserve(count, labels=labels)
+            sink_arrays = sink.arrays()
+            outputs = {name: sink_arrays[name][first_row:first_row + count] for name in shapes}
+            targets: Dict[str, _Target] = {
+                name: ("npy", str(sink_arrays[name].filename), shapes[name], dtype.str, first_row)
+                for name in shapes
+            }
+        else:
+            targets = {}
+            for name, shape in shapes.items():
+                nbytes = max(int(np.prod(shape)) * dtype.itemsize, 1)
+                block = shared_memory.SharedMemory(create=True, size=nbytes)
+                blocks.append(block)
+                shared_views[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+                targets[name] = ("shm", block.name, shape, dtype.str, 0)
+            outputs = shared_views
+
+        if workers == 1 or count <= chunk:
+            errors.update(_fill_rows(outputs, configs, 0, num_points))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_run_chunk, targets, configs[start:stop], start, num_points)
+                    for start, stop in _chunk_bounds(count, chunk)
+                ]
+                for future in futures:
+                    errors.update(future.result())
+
+        if sink is None:
+            outputs = {name: np.array(array) for name, array in shared_views.items()}
+    finally:
+        # Views must be released before the blocks can be closed.
+        shared_views.clear()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return BatchResult(errors=errors, **outputs)
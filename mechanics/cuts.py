@@ -0,0 +1,167 @@
+"""Member lookup for method-of-sections cuts.
+
+A cut is the line ``normal . x = offset``. A member crosses it when the
+offset lies between the projections of its two end nodes onto ``normal``,
+so every cut direction turns the members into intervals. The cuts of the
+desktop tool along ``x`` or ``y`` are the normals ``(1, 0)`` and ``(0, 1)``.
+In a space truss the same test applies to the plane ``normal . x = offset``.
+"""
+from __future__ import annotations
+
+from typing import Any, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .truss import TrussComputationError, TrussModel
+
+# Subtrees this small are stored as flat leaves and scanned: cheaper than
+# building and walking tree nodes for a handful of intervals.
+LEAF_SIZE = 64
+
+
+def _unit_normal(model: TrussModel, normal: Sequence[float]) -> np.ndarray:
+    normal = np.asarray(normal, dtype=float)
+    length = np.linalg.norm(normal)
+    if normal.shape != (model.dim,) or length == 0:
+        raise TrussComputationError(f"A cut normal needs {model.dim} components, not all zero.")
+    return normal / length
+
+
+def _projection_intervals(model: TrussModel, normal: np.ndarray):
+    projections = model.coordinates @ normal
+    ends = projections[model.members]
+    return ends.min(axis=1), ends.max(axis=1)
+
+
+def members_crossing_line(
+    model: TrussModel,
+    point: Sequence[float],
+    normal: Sequence[float],
+    *,
+    tol: float = 0.0,
+) -> np.ndarray:
+    """Rows of the members crossing the line through ``point`` with ``normal``.
+
+    A single vectorized pass; use :class:`SectionCutIndex` for many parallel
+    cuts.
+    """
+
+    normal = _unit_normal(model, normal)
+    lower, upper = _projection_intervals(model, normal)
+    offset = float(np.asarray(point, dtype=float) @ normal)
+    return np.flatnonzero((lower - tol <= offset) & (offset <= upper + tol))
+
+
+class SectionCutIndex:
+    """Centred interval tree over member projections for one cut direction.
+
+    Each tree node keeps the intervals containing its centre twice, sorted
+    by lower bound and by upper bound, so a cut visits ``O(log n)`` nodes and
+    reads each reported member once: ``O(log n + k)`` per query after an
+    ``O(n log n)`` build. Subtrees of at most :data:`LEAF_SIZE` members are
+    scanned directly. A member is reported when the cut passes through it or
+    touches one of its end nodes (within ``tol``).
+    """
+
+    def __init__(self, model: TrussModel, normal: Sequence[float] = (1.0, 0.0), *, tol: float = 0.0) -> None:
+        self.model = model
+        self.normal = _unit_normal(model, normal)
+        lower, upper = _projection_intervals(model, self.normal)
+        self.lower = lower - tol
+        self.upper = upper + tol
+
+        self._centre: List[float] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._by_lower: List[np.ndarray] = []
+        self._lower_sorted: List[np.ndarray] = []
+        self._by_upper: List[np.ndarray] = []
+        self._upper_sorted: List[np.ndarray] = []
+        self._root = self._build(np.arange(model.num_members))
+
+    def _build(self, members: np.ndarray) -> int:
+        if not members.size:
+            return -1
+        lower, upper = self.lower[members], self.upper[members]
+        node = len(self._centre)
+        self._left.append(-1)
+        self._right.append(-1)
+        if members.size <= LEAF_SIZE:
+            # Leaves have no centre; both lists hold all of their members.
+            self._centre.append(np.nan)
+            self._by_lower.append(members)
+            self._lower_sorted.append(lower)
+            self._by_upper.append(members)
+            self._upper_sorted.append(-upper)
+            return node
+
+        centre = float(np.median(0.5 * (lower + upper)))
+        here = (lower <= centre) & (centre <= upper)
+        self._centre.append(centre)
+        spanning = members[here]
+        order = np.argsort(self.lower[spanning], kind="stable")
+        self._by_lower.append(spanning[order])
+        self._lower_sorted.append(self.lower[spanning][order])
+        # Upper bounds are stored negated so both lists sort ascending.
+        order = np.argsort(-self.upper[spanning], kind="stable")
+        self._by_upper.append(spanning[order])
+        self._upper_sorted.append(-self.upper[spanning][order])
+
+        self._left[node] = self._build(members[~here & (upper < centre)])
+        self._right[node] = self._build(members[~here & (lower > centre)])
+        return node
+
+    def query(self, offset: float) -> np.ndarray:
+        """Member rows crossed by the cut ``normal . x = offset``."""
+
+        found = []
+        node = self._root
+        while node >= 0:
+            centre = self._centre[node]
+            if np.isnan(centre):
+                hit = (self._lower_sorted[node] <= offset) & (-self._upper_sorted[node] >= offset)
+                found.append(self._by_lower[node][hit])
+                break
+            if offset < centre:
+                count = np.searchsorted(self._lower_sorted[node], offset, side="right")
+                found.append(self._by_lower[node][:count])
+                node = self._left[node]
+            elif offset > centre:
+                count = np.searchsorted(self._upper_sorted[node], -offset, side="right")
+                found.append(self._by_upper[node][:count])
+                node = self._right[node]
+            else:
+                found.append(self._by_lower[node])
+                break
+        return np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.intp)
+
+    def query_point(self, point: Sequence[float]) -> np.ndarray:
+        """Members crossed by the cut through ``point``."""
+
+        return self.query(float(np.asarray(point, dtype=float) @ self.normal))
+
+    def query_many(self, offsets: Any) -> List[np.ndarray]:
+        """Members crossed by each cut of a sweep."""
+
+        return [self.query(float(offset)) for offset in np.asarray(offsets, dtype=float).ravel()]
+
+
+def miembros_cortados(
+    nodos: Sequence[Mapping[str, Any]],
+    miembros: Sequence[Mapping[str, Any]],
+    corte: float,
+    eje: str,
+    index: Optional[SectionCutIndex] = None,
+) -> List[int]:
+    """Positions in ``miembros`` of the members crossing the cut ``eje = corte``.
+
+    Dictionary front-end of ``calcular_seccion_armadura`` and
+    ``calcular_seccion_bastidor``; as in the desktop tool, any ``eje`` other
+    than ``"x"`` (or ``"z"`` in a space truss) cuts along ``y``.
+    """
+
+    if index is None:
+        model = TrussModel.from_dicts(nodos, miembros)
+        axis = {"x": 0, "z": 2}.get(eje, 1) if model.dim == 3 else (0 if eje == "x" else 1)
+        index = SectionCutIndex(model, np.eye(model.dim)[axis])
+    return index.query(float(corte)).tolist()
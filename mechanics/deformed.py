@@ -0,0 +1,98 @@
+"""Deformed-shape geometry of solved trusses and frames for plotting.
+
+Every function works on all members at once and returns plain arrays: a
+``(members, points, dim)`` block of member polylines, which is what
+``matplotlib.collections.LineCollection`` takes, or through :func:`polyline`
+a single NaN-separated ``(rows, dim)`` array for one ``plot`` call or a web
+client.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .frame import FrameModel, FrameSolution
+from .truss import TrussModel
+
+
+def amplification_factor(coordinates: Any, displacements: Any, fraction: float = 0.05) -> float:
+    """Scale that draws the largest displacement as ``fraction`` of the model size.
+
+    Returns 1 when nothing moves.
+    """
+
+    coordinates = np.asarray(coordinates, dtype=float)
+    displacements = np.asarray(displacements, dtype=float)[:, : coordinates.shape[1]]
+    size = float(np.max(np.ptp(coordinates, axis=0))) if coordinates.size else 0.0
+    largest = float(np.max(np.linalg.norm(displacements, axis=1))) if displacements.size else 0.0
+    if largest == 0.0 or size == 0.0:
+        return 1.0
+    return fraction * size / largest
+
+
+def truss_deformed_shape(model: TrussModel, displacements: Any, *, scale: float = 1.0) -> np.ndarray:
+    """``(members, 2, dim)`` end points of every member on the displaced nodes.
+
+    ``displacements`` is ``(nodes, dim)``, e.g. one case of
+    :attr:`~mechanics.truss.TrussLoadCases.displacements`. Pin-jointed
+    members stay straight, so two points per member are exact.
+    """
+
+    displaced = model.coordinates + scale * np.asarray(displacements, dtype=float)
+    return displaced[model.members]
+
+
+def frame_deformed_shape(
+    model: FrameModel,
+    solution: FrameSolution,
+    *,
+    scale: float = 1.0,
+    num_points: int = 11,
+    cubic: bool = True,
+) -> np.ndarray:
+    """``(members, num_points, 2)`` deflected member axes.
+
+    With ``cubic`` the transverse deflection is the Hermite cubic of the end
+    displacements and rotations plus the fixed-end deflection of the member
+    load, ``q s² (L - s)² / 24 EI``, which is exact for uniform loads;
+    released ends use the member's own rotation. Otherwise members are drawn
+    straight between the displaced nodes.
+    """
+
+    t = np.linspace(0.0, 1.0, max(num_points, 2) if cubic else 2)[None, :]
+    L = solution.lengths[:, None]
+    u1, v1, r1, u2, v2, r2 = (solution.end_displacements[:, [i]] for i in range(6))
+
+    axial = u1 * (1.0 - t) + u2 * t
+    if cubic:
+        t2, t3 = t * t, t * t * t
+        transverse = (
+            (1.0 - 3.0 * t2 + 2.0 * t3) * v1
+            + (t - 2.0 * t2 + t3) * L * r1
+            + (3.0 * t2 - 2.0 * t3) * v2
+            + (t3 - t2) * L * r2
+        )
+        q = solution.distributed[:, [1]]
+        EI = model.flexural_stiffness[:, None]
+        s = t * L
+        transverse = transverse + q * s * s * (L - s) ** 2 / (24.0 * EI)
+    else:
+        transverse = v1 * (1.0 - t) + v2 * t
+
+    d = model.member_directions()
+    n = np.column_stack([-d[:, 1], d[:, 0]])
+    start = model.coordinates[model.members[:, 0]]
+    along = t * L + scale * axial
+    across = scale * transverse
+    return start[:, None, :] + along[:, :, None] * d[:, None, :] + across[:, :, None] * n[:, None, :]
+
+
+def polyline(segments: Any) -> np.ndarray:
+    """Join ``(members, points, dim)`` polylines into one NaN-separated array."""
+
+    segments = np.asarray(segments, dtype=float)
+    members, points, dim = segments.shape
+    joined = np.full((members, points + 1, dim), np.nan)
+    joined[:, :points] = segments
+    return joined.reshape(-1, dim)[:-1] if members else joined.reshape(-1, dim)
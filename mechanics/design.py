@@ -0,0 +1,188 @@
+"""Design checks of axially loaded members: stress, utilisation and buckling.
+
+The checks take the member forces of a solved truss, the member lengths and
+a per-member table of section and material properties, and run on all
+members at once; the worst members are then picked with one partial sort,
+so even very large models are checked and reported in a few array
+operations. Compression members are checked against the Euler load
+``π² E I / (K L)²`` about the weak axis as well as the material strength.
+No partial safety factors are applied: utilisations compare the forces with
+characteristic resistances.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+
+from .sections import SectionCatalog
+
+REPORT_DTYPE = np.dtype(
+    [
+        ("member", np.intp),
+        ("force", float),
+        ("stress", float),
+        ("slenderness", float),
+        ("utilisation", float),
+        ("buckling", bool),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class MemberSections:
+    """Section and material of every member, in SI units.
+
+    ``inertia`` is the smaller second moment of area, the one Euler buckling
+    follows, and ``effective_length_factor`` is ``K`` in the buckling length
+    ``K L``.
+    """
+
+    area: np.ndarray
+    inertia: np.ndarray
+    elastic_modulus: np.ndarray
+    strength: np.ndarray
+    effective_length_factor: np.ndarray
+
+    @classmethod
+    def from_arrays(
+        cls,
+        area: Any,
+        inertia: Any,
+        elastic_modulus: Any,
+        strength: Any,
+        effective_length_factor: Any = 1.0,
+        *,
+        num_members: int = 1,
+    ) -> "MemberSections":
+        """Table from per-member arrays; scalars are broadcast to ``num_members``."""
+
+        columns = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (area, inertia, elastic_modulus, strength, effective_length_factor)
+            ),
+            np.empty(num_members),
+        )[:-1]
+        if any(np.any(column <= 0) for column in columns):
+            raise ValueError("Section and material properties must be positive.")
+        return cls(*(np.array(column) for column in columns))
+
+    @classmethod
+    def from_catalog(
+        cls,
+        catalog: SectionCatalog,
+        sections: Sequence[Any],
+        *,
+        effective_length_factor: Any = 1.0,
+    ) -> "MemberSections":
+        """Table of catalog profiles, one name or catalog row per member.
+
+        Each distinct name is looked up once, however many members use it.
+        Euler buckling uses the weak-axis inertia of each profile.
+        """
+
+        sections = np.asarray(sections)
+        if sections.dtype.kind in "iu":
+            rows = sections.astype(np.intp).ravel()
+        else:
+            names, inverse = np.unique(sections.astype(str), return_inverse=True)
+            rows = np.asarray([catalog.index_of(name) for name in names], dtype=np.intp)[inverse.ravel()]
+        return cls.from_arrays(
+            catalog.area[rows],
+            np.minimum(catalog.iy[rows], catalog.iz[rows]),
+            catalog.elastic_modulus[rows],
+            catalog.strength[rows],
+            effective_length_factor,
+            num_members=rows.size,
+        )
+
+    @property
+    def num_members(self) -> int:
+        return int(self.area.size)
+
+
+@dataclass(frozen=True)
+class MemberChecks:
+    """Checks of every member.
+
+    ``stress`` is ``N / A`` (tension positive), ``critical_load`` the Euler
+    load and ``slenderness`` ``K L / r``. ``stress_utilisation`` is
+    ``|σ| / f`` and ``buckling_utilisation`` ``-N / Ncr`` for compression
+    members (zero in tension); ``utilisation`` is the larger of the two, and
+    members above 1 fail.
+    """
+
+    forces: np.ndarray
+    lengths: np.ndarray
+    stress: np.ndarray
+    slenderness: np.ndarray
+    critical_load: np.ndarray
+    stress_utilisation: np.ndarray
+    buckling_utilisation: np.ndarray
+    utilisation: np.ndarray
+
+    @property
+    def failing(self) -> np.ndarray:
+        """Indices of the members with a utilisation above 1."""
+
+        return np.flatnonzero(self.utilisation > 1.0)
+
+    @property
+    def buckling_governs(self) -> np.ndarray:
+        return self.buckling_utilisation > self.stress_utilisation
+
+    def worst(self, count: int = 10) -> np.ndarray:
+        """Indices of the ``count`` most utilised members, most utilised first."""
+
+        count = min(max(int(count), 0), self.utilisation.size)
+        if count == 0:
+            return np.empty(0, dtype=np.intp)
+        top = np.argpartition(-self.utilisation, count - 1)[:count]
+        return top[np.argsort(-self.utilisation[top], kind="stable")]
+
+    def report(self, count: int = 10) -> np.ndarray:
+        """Record array of the ``count`` worst members (see :data:`REPORT_DTYPE`)."""
+
+        members = self.worst(count)
+        table = np.empty(members.size, dtype=REPORT_DTYPE)
+        table["member"] = members
+        table["force"] = self.forces[members]
+        table["stress"] = self.stress[members]
+        table["slenderness"] = self.slenderness[members]
+        table["utilisation"] = self.utilisation[members]
+        table["buckling"] = self.buckling_governs[members]
+        return table
+
+
+def check_members(forces: Any, lengths: Any, sections: MemberSections) -> MemberChecks:
+    """Stress, utilisation and Euler buckling of every member.
+
+    ``forces`` are axial forces (tension positive) of one load case, e.g.
+    :attr:`~mechanics.truss.TrussSolution.forces`, and ``lengths`` the
+    member lengths from :meth:`~mechanics.truss.TrussModel.member_lengths`.
+    """
+
+    forces = np.asarray(forces, dtype=float).ravel()
+    lengths = np.asarray(lengths, dtype=float).ravel()
+    if forces.size != sections.num_members or lengths.size != sections.num_members:
+        raise ValueError(
+            f"Expected {sections.num_members} member forces and lengths, got {forces.size} and {lengths.size}."
+        )
+
+    buckling_length = sections.effective_length_factor * lengths
+    critical_load = np.pi**2 * sections.elastic_modulus * sections.inertia / buckling_length**2
+    stress = forces / sections.area
+    stress_utilisation = np.abs(stress) / sections.strength
+    buckling_utilisation = np.maximum(-forces, 0.0) / critical_load
+    return MemberChecks(
+        forces=forces,
+        lengths=lengths,
+        stress=stress,
+        slenderness=buckling_length / np.sqrt(sections.inertia / sections.area),
+        critical_load=critical_load,
+        stress_utilisation=stress_utilisation,
+        buckling_utilisation=buckling_utilisation,
+        utilisation=np.maximum(stress_utilisation, buckling_utilisation),
+    )
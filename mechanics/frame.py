@@ -0,0 +1,430 @@
+"""Plane rigid-frame analysis by the direct stiffness method.
+
+Every node has three degrees of freedom ``(ux, uy, rz)`` and every member is
+a beam-column with axial stiffness EA and flexural stiffness EI. A member end
+can release its bending moment, which models a pin between the member and
+the node; a node where every member end is released gets its rotation
+restrained, since nothing resists it, and a moment applied there is
+rejected. Members may carry a uniform load per unit length given by its
+global components ``(qx, qy)``.
+
+End forces are the forces the nodes exert on each member in its local axes
+(``x`` from start to end, ``y`` a quarter turn anticlockwise), ordered
+``(N1, V1, M1, N2, V2, M2)``. Internal diagrams follow :mod:`mechanics.viga`:
+axial force positive in tension, shear as the sum of local ``y`` forces left
+of the section, and sagging bending moments positive.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .sparse import CSRMatrix, factorize, submatrix
+
+# Restrained directions (x, y, rotation) per support type of the desktop tool.
+FRAME_SUPPORT_RESTRAINTS: Dict[str, Tuple[bool, bool, bool]] = {
+    "empotrado": (True, True, True),
+    "fijo": (True, True, False),
+    "móvil": (False, True, False),
+    "movil": (False, True, False),
+    "libre": (False, False, False),
+}
+
+# Nominal steel section (E = 200 GPa, A = 100 cm², I = 10000 cm⁴) used when
+# no stiffness is given; it only matters for statically indeterminate frames.
+DEFAULT_AXIAL_STIFFNESS = 2.0e9
+DEFAULT_FLEXURAL_STIFFNESS = 2.0e7
+
+
+class FrameComputationError(ValueError):
+    """Raised when a frame definition cannot be analysed."""
+
+
+@dataclass(frozen=True)
+class FrameModel:
+    """Array description of a plane frame.
+
+    ``coordinates`` is ``(nodes, 2)``, ``members`` ``(members, 2)`` node rows,
+    ``restraints`` a ``(nodes, 3)`` mask and ``loads`` ``(nodes, 3)`` nodal
+    forces and moments. ``releases`` is ``(members, 2)``, true where the
+    start or end of a member is pinned, and ``member_loads`` ``(members, 2)``
+    the global ``(qx, qy)`` of a uniform load per unit length.
+    """
+
+    coordinates: np.ndarray
+    members: np.ndarray
+    restraints: np.ndarray
+    loads: np.ndarray
+    node_ids: np.ndarray
+    axial_stiffness: np.ndarray
+    flexural_stiffness: np.ndarray
+    releases: np.ndarray
+    member_loads: np.ndarray
+
+    @classmethod
+    def from_arrays(
+        cls,
+        coordinates: Any,
+        members: Any,
+        restraints: Any,
+        loads: Any = None,
+        *,
+        releases: Any = None,
+        member_loads: Any = None,
+        axial_stiffness: Any = DEFAULT_AXIAL_STIFFNESS,
+        flexural_stiffness: Any = DEFAULT_FLEXURAL_STIFFNESS,
+        node_ids: Any = None,
+    ) -> "FrameModel":
+        coordinates = np.asarray(coordinates, dtype=float)
+        if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+            raise FrameComputationError("Coordinates must be a (nodes, 2) array.")
+        num_nodes = coordinates.shape[0]
+
+        members = np.asarray(members, dtype=np.intp).reshape(-1, 2)
+        if members.size and (members.min() < 0 or members.max() >= num_nodes):
+            raise FrameComputationError("Members must reference existing nodes.")
+        num_members = members.shape[0]
+        if np.any(np.linalg.norm(np.diff(coordinates[members], axis=1)[:, 0], axis=1) == 0):
+            raise FrameComputationError("Frame members must have a positive length.")
+
+        restraints = np.asarray(restraints, dtype=bool)
+        if restraints.shape != (num_nodes, 3):
+            raise FrameComputationError("Restraints must be a (nodes, 3) mask.")
+        loads = np.zeros((num_nodes, 3)) if loads is None else np.asarray(loads, dtype=float)
+        if loads.shape != (num_nodes, 3):
+            raise FrameComputationError("Loads must be a (nodes, 3) array of Fx, Fy and M.")
+
+        releases = np.zeros((num_members, 2), dtype=bool) if releases is None else np.asarray(releases, dtype=bool)
+        if releases.shape != (num_members, 2):
+            raise FrameComputationError("Releases must be a (members, 2) mask.")
+        member_loads = np.zeros((num_members, 2)) if member_loads is None else np.asarray(member_loads, dtype=float)
+        if member_loads.shape != (num_members, 2):
+            raise FrameComputationError("Member loads must be a (members, 2) array of qx and qy.")
+
+        stiffness = []
+        for name, value in (("axial", axial_stiffness), ("flexural", flexural_stiffness)):
+            value = np.broadcast_to(np.asarray(value, dtype=float), (num_members,)).copy()
+            if np.any(value <= 0):
+                raise FrameComputationError(f"Member {name} stiffness must be positive.")
+            stiffness.append(value)
+
+        return cls(
+            coordinates=coordinates,
+            members=members,
+            restraints=restraints,
+            loads=loads,
+            node_ids=np.arange(num_nodes) if node_ids is None else np.asarray(node_ids),
+            axial_stiffness=stiffness[0],
+            flexural_stiffness=stiffness[1],
+            releases=releases,
+            member_loads=member_loads,
+        )
+
+    @classmethod
+    def from_dicts(
+        cls,
+        nodos: Sequence[Mapping[str, Any]],
+        miembros: Sequence[Mapping[str, Any]],
+        cargas: Sequence[Mapping[str, Any]] = (),
+    ) -> "FrameModel":
+        """Build a model from the desktop dictionaries.
+
+        Besides the truss keys, supports may be ``"Empotrado"``, members
+        accept ``articulado_inicio``/``articulado_fin``, ``EA``, ``EI``,
+        ``qx`` and ``qy``, and loads an optional moment ``M``.
+        """
+
+        rows = {n["id"]: i for i, n in enumerate(nodos)}
+        try:
+            members = [(rows[m["inicio"]], rows[m["fin"]]) for m in miembros]
+        except KeyError as exc:
+            raise FrameComputationError(f"Member references unknown node {exc.args[0]!r}.") from None
+        loads = np.zeros((len(nodos), 3))
+        for c in cargas:
+            if c["nodo"] not in rows:
+                raise FrameComputationError(f"Load applied to unknown node {c['nodo']!r}.")
+            loads[rows[c["nodo"]]] += (float(c.get("Fx", 0.0)), float(c.get("Fy", 0.0)), float(c.get("M", 0.0)))
+
+        return cls.from_arrays(
+            np.asarray([(float(n["x"]), float(n["y"])) for n in nodos], dtype=float).reshape(-1, 2),
+            members,
+            np.asarray(
+                [
+                    FRAME_SUPPORT_RESTRAINTS.get((n.get("apoyo") or "").strip().lower(), (False,) * 3)
+                    for n in nodos
+                ],
+                dtype=bool,
+            ).reshape(-1, 3),
+            loads,
+            releases=[(bool(m.get("articulado_inicio")), bool(m.get("articulado_fin"))) for m in miembros],
+            member_loads=[(float(m.get("qx", 0.0)), float(m.get("qy", 0.0))) for m in miembros],
+            axial_stiffness=[float(m.get("EA", DEFAULT_AXIAL_STIFFNESS)) for m in miembros],
+            flexural_stiffness=[float(m.get("EI", DEFAULT_FLEXURAL_STIFFNESS)) for m in miembros],
+            node_ids=[n["id"] for n in nodos],
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        return int(self.coordinates.shape[0])
+
+    @property
+    def num_members(self) -> int:
+        return int(self.members.shape[0])
+
+    def member_lengths(self) -> np.ndarray:
+        return np.linalg.norm(self.coordinates[self.members[:, 1]] - self.coordinates[self.members[:, 0]], axis=1)
+
+    def member_directions(self) -> np.ndarray:
+        vectors = self.coordinates[self.members[:, 1]] - self.coordinates[self.members[:, 0]]
+        return vectors / self.member_lengths()[:, None]
+
+    def hinged_nodes(self) -> np.ndarray:
+        """Node rows whose rotation no member resists (every end released)."""
+
+        rigid = np.bincount(self.members[~self.releases], minlength=self.num_nodes)
+        connected = np.bincount(self.members.ravel(), minlength=self.num_nodes)
+        return np.flatnonzero((rigid == 0) & (connected > 0) & ~self.restraints[:, 2])
+
+
+def _rotations(model: FrameModel) -> np.ndarray:
+    # (members, 6, 6) global-to-local transformations.
+    c, s = model.member_directions().T
+    T = np.zeros((model.num_members, 6, 6))
+    for offset in (0, 3):
+        T[:, offset, offset] = c
+        T[:, offset, offset + 1] = s
+        T[:, offset + 1, offset] = -s
+        T[:, offset + 1, offset + 1] = c
+        T[:, offset + 2, offset + 2] = 1.0
+    return T
+
+
+def _local_stiffness(model: FrameModel) -> np.ndarray:
+    L = model.member_lengths()
+    a = model.axial_stiffness / L
+    EI = model.flexural_stiffness
+    b, c, d, e = 12 * EI / L**3, 6 * EI / L**2, 4 * EI / L, 2 * EI / L
+    zero = np.zeros_like(L)
+    rows = [
+        [a, zero, zero, -a, zero, zero],
+        [zero, b, c, zero, -b, c],
+        [zero, c, d, zero, -c, e],
+        [-a, zero, zero, a, zero, zero],
+        [zero, -b, -c, zero, b, -c],
+        [zero, c, e, zero, -c, d],
+    ]
+    return np.moveaxis(np.asarray(rows), 2, 0)
+
+
+def _local_member_loads(model: FrameModel, member_loads: np.ndarray) -> np.ndarray:
+    # Global (qx, qy) per unit length to local (axial p, transverse q).
+    d = model.member_directions()
+    normal = np.column_stack([-d[:, 1], d[:, 0]])
+    return np.column_stack([np.sum(member_loads * d, axis=1), np.sum(member_loads * normal, axis=1)])
+
+
+def _fixed_end_loads(lengths: np.ndarray, local_loads: np.ndarray) -> np.ndarray:
+    # Nodal loads equivalent to a uniform load on a member with fixed ends.
+    p, q = local_loads.T
+    L = lengths
+    return np.column_stack([p * L / 2, q * L / 2, q * L**2 / 12, p * L / 2, q * L / 2, -q * L**2 / 12])
+
+
+def _condense(k: np.ndarray, f: np.ndarray, releases: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Statically condense the released end rotations out of ``k`` and ``f``.
+
+    Members are grouped by release pattern so each group is one batched solve.
+    """
+
+    k = k.copy()
+    f = f.copy()
+    for pattern, dofs in (((True, False), [2]), ((False, True), [5]), ((True, True), [2, 5])):
+        group = np.flatnonzero((releases[:, 0] == pattern[0]) & (releases[:, 1] == pattern[1]))
+        if not group.size:
+            continue
+        kg, fg = k[group], f[group]
+        k_rr = kg[:, dofs][:, :, dofs]
+        k_ar = kg[:, :, dofs]
+        kg -= k_ar @ np.linalg.solve(k_rr, kg[:, dofs, :])
+        fg -= (k_ar @ np.linalg.solve(k_rr, fg[:, dofs, None]))[:, :, 0]
+        kg[:, dofs, :] = 0.0
+        kg[:, :, dofs] = 0.0
+        fg[:, dofs] = 0.0
+        k[group], f[group] = kg, fg
+    return k, f
+
+
+def _released_rotations(k: np.ndarray, f: np.ndarray, local_u: np.ndarray, releases: np.ndarray) -> np.ndarray:
+    """Local end displacements with the member's own rotation at released ends.
+
+    A released end carries no moment, so its rotation solves the released
+    rows of the uncondensed member equations ``k u - f = end forces``.
+    """
+
+    local_u = local_u.copy()
+    for pattern, dofs in (((True, False), [2]), ((False, True), [5]), ((True, True), [2, 5])):
+        group = np.flatnonzero((releases[:, 0] == pattern[0]) & (releases[:, 1] == pattern[1]))
+        if not group.size:
+            continue
+        ug = local_u[group]
+        ug[:, dofs] = 0.0
+        kg = k[group]
+        rhs = f[group][:, dofs] - np.einsum("mij,mj->mi", kg[:, dofs, :], ug)
+        ug[:, dofs] = np.linalg.solve(kg[:, dofs][:, :, dofs], rhs[:, :, None])[:, :, 0]
+        local_u[group] = ug
+    return local_u
+
+
+def _member_dofs(model: FrameModel) -> np.ndarray:
+    return (3 * model.members[:, [0, 0, 0, 1, 1, 1]] + np.array([0, 1, 2, 0, 1, 2])).astype(np.intp)
+
+
+def assemble_frame_stiffness(model: FrameModel) -> CSRMatrix:
+    """Global ``(3 n, 3 n)`` stiffness matrix of the frame, releases condensed."""
+
+    k, _ = _condense(_local_stiffness(model), np.zeros((model.num_members, 6)), model.releases)
+    T = _rotations(model)
+    K_e = np.einsum("mji,mjk,mkl->mil", T, k, T)
+    dofs = _member_dofs(model)
+    n = 3 * model.num_nodes
+    return CSRMatrix.from_coo(
+        np.repeat(dofs, 6, axis=1).ravel(), np.tile(dofs, (1, 6)).ravel(), K_e.ravel(), (n, n)
+    )
+
+
+@dataclass(frozen=True)
+class MemberDiagrams:
+    """Internal forces sampled along every member, each ``(members, points)``.
+
+    ``stations`` are distances from the member start.
+    """
+
+    stations: np.ndarray
+    axial: np.ndarray
+    shear: np.ndarray
+    moment: np.ndarray
+
+
+@dataclass(frozen=True)
+class FrameSolution:
+    """Displacements ``(nodes, 3)``, reactions ``(nodes, 3)`` and local ``(members, 6)`` end forces.
+
+    ``end_displacements`` are the local ``(members, 6)`` end displacements,
+    where a released end has the member's own rotation rather than the
+    node's. ``distributed`` keeps the local ``(p, q)`` member loads of the
+    solved case, which the diagrams need between the ends.
+    """
+
+    displacements: np.ndarray
+    reactions: np.ndarray
+    end_forces: np.ndarray
+    end_displacements: np.ndarray
+    lengths: np.ndarray
+    distributed: np.ndarray
+
+    def diagrams(self, num_points: int = 21) -> MemberDiagrams:
+        """Axial force, shear and bending moment at ``num_points`` stations per member."""
+
+        s = np.linspace(0.0, 1.0, max(num_points, 2))[None, :] * self.lengths[:, None]
+        N1, V1, M1 = (self.end_forces[:, [i]] for i in range(3))
+        p, q = (self.distributed[:, [i]] for i in range(2))
+        return MemberDiagrams(
+            stations=s,
+            axial=-(N1 + p * s),
+            shear=V1 + q * s,
+            moment=-M1 + V1 * s + 0.5 * q * s * s,
+        )
+
+
+class FrameSystem:
+    """Frame stiffness matrix factorized once and reused for any number of loadings.
+
+    ``method`` is passed to :func:`~mechanics.sparse.factorize`; the free
+    block is symmetric positive definite for a stable frame, so the banded
+    Cholesky path applies when SciPy is not installed.
+    """
+
+    def __init__(self, model: FrameModel, *, method: str = "auto") -> None:
+        self.model = model
+        self.stiffness = assemble_frame_stiffness(model)
+        self.restraints = model.restraints.copy()
+        self._hinged = model.hinged_nodes()
+        self.restraints[self._hinged, 2] = True
+        self._free = np.flatnonzero(~self.restraints.ravel())
+        self._solver = factorize(submatrix(self.stiffness, self._free, self._free), method=method) if self._free.size else None
+
+        self._T = _rotations(model)
+        self._lengths = model.member_lengths()
+        self._dofs = _member_dofs(model)
+        k_local = _local_stiffness(model)
+        self._k_local, _ = _condense(k_local, np.zeros((model.num_members, 6)), model.releases)
+        self._k_full = k_local
+
+    def solve(self, loads: Any = None, member_loads: Any = None) -> FrameSolution:
+        """Solve for nodal ``loads`` and ``member_loads``, the model's own by default."""
+
+        model = self.model
+        loads = model.loads if loads is None else np.asarray(loads, dtype=float)
+        member_loads = model.member_loads if member_loads is None else np.asarray(member_loads, dtype=float)
+        if loads.shape != (model.num_nodes, 3) or member_loads.shape != (model.num_members, 2):
+            raise FrameComputationError("Loads must be (nodes, 3) and member loads (members, 2).")
+        # The restrained rotation of a hinged node would silently absorb a
+        # moment applied there.
+        loaded = self._hinged[loads[self._hinged, 2] != 0]
+        if loaded.size:
+            names = ", ".join(str(node_id) for node_id in model.node_ids[loaded].tolist())
+            raise FrameComputationError(f"Moment applied at hinged node(s) {names}, where no member resists it.")
+
+        local_loads = _local_member_loads(model, member_loads)
+        full_fixed_end = _fixed_end_loads(self._lengths, local_loads)
+        _, fixed_end = _condense(self._k_full, full_fixed_end, model.releases)
+        F = loads.ravel().copy()
+        np.add.at(F, self._dofs, np.einsum("mji,mj->mi", self._T, fixed_end))
+
+        u = np.zeros_like(F)
+        if self._free.size:
+            u[self._free] = self._solver.solve(F[self._free])
+        reactions = self.stiffness.matvec(u) - F
+        reactions[~model.restraints.ravel()] = 0.0
+
+        local_u = np.einsum("mij,mj->mi", self._T, u[self._dofs])
+        end_forces = np.einsum("mij,mj->mi", self._k_local, local_u) - fixed_end
+        return FrameSolution(
+            displacements=u.reshape(-1, 3),
+            reactions=reactions.reshape(-1, 3),
+            end_forces=end_forces,
+            end_displacements=_released_rotations(self._k_full, full_fixed_end, local_u, model.releases),
+            lengths=self._lengths,
+            distributed=local_loads,
+        )
+
+
+def solve_frame(model: FrameModel, *, method: str = "auto") -> FrameSolution:
+    """Solve a frame under its own nodal and member loads."""
+
+    return FrameSystem(model, method=method).solve()
+
+
+def resolver_bastidor(
+    nodos: Sequence[Mapping[str, Any]],
+    miembros: Sequence[Mapping[str, Any]],
+    cargas: Sequence[Mapping[str, Any]],
+) -> Tuple[List[Tuple[float, ...]], Dict[Any, Tuple[float, float, float]]]:
+    """Dictionary front-end for rigid frames with bending.
+
+    Returns ``(extremos, reacciones)``: the local end forces
+    ``(N1, V1, M1, N2, V2, M2)`` of every member in the order of ``miembros``
+    and the ``(Rx, Ry, Mz)`` of every supported node by id.
+    """
+
+    model = FrameModel.from_dicts(nodos, miembros, cargas)
+    solution = solve_frame(model)
+    extremos = [tuple(float(v) for v in row) for row in solution.end_forces]
+    reacciones = {}
+    for i in np.flatnonzero(model.restraints.any(axis=1)):
+        node_id = model.node_ids[i]
+        node_id = node_id.item() if isinstance(node_id, np.generic) else node_id
+        reacciones[node_id] = tuple(float(r) for r in solution.reactions[i])
+    return extremos, reacciones
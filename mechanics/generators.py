@@ -0,0 +1,183 @@
+"""Parametric truss topologies for examples, tests and scaling benchmarks.
+
+Every generator returns a :class:`~mechanics.truss.TrussModel` built from
+arrays. Plane trusses span ``panels`` panels between a pin at the left end of
+the bottom chord and a roller at the right end, with ``load`` applied
+vertically at every interior bottom panel point (gravity loads are negative,
+as in the desktop tool). :meth:`~mechanics.truss.TrussModel.to_dicts` turns
+any of them into the ``nodos``/``miembros``/``cargas`` lists of
+:func:`~mechanics.truss.resolver_articulado`.
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+from .truss import TrussComputationError, TrussModel
+
+Pairs = List[Tuple[int, int]]
+
+
+def _check_panels(panels: int, minimum: int = 1) -> None:
+    if panels < minimum:
+        raise TrussComputationError(f"A truss needs at least {minimum} panel(s).")
+
+
+def _simply_supported(
+    coordinates: np.ndarray,
+    members: Pairs,
+    left: int,
+    right: int,
+    loaded: np.ndarray,
+    load: float,
+) -> TrussModel:
+    restraints = np.zeros_like(coordinates, dtype=bool)
+    restraints[left] = True
+    restraints[right, 1] = True
+    loads = np.zeros_like(coordinates)
+    loads[loaded, 1] = load
+    return TrussModel.from_arrays(coordinates, members, restraints, loads)
+
+
+def _chords(panels: int, panel_length: float, depth: float) -> np.ndarray:
+    # Bottom panel points 0..panels, then top panel points panels+1..2*panels+1.
+    xs = np.arange(panels + 1) * panel_length
+    return np.concatenate(
+        [np.column_stack([xs, np.zeros_like(xs)]), np.column_stack([xs, np.full_like(xs, depth)])]
+    )
+
+
+def _parallel_chord(panels: int, panel_length: float, depth: float, load: float, towards_centre: bool) -> TrussModel:
+    _check_panels(panels)
+    top = panels + 1
+    members: Pairs = [(i, i + 1) for i in range(panels)]
+    members += [(top + i, top + i + 1) for i in range(panels)]
+    members += [(i, top + i) for i in range(panels + 1)]
+    for i in range(panels):
+        left_half = 2 * i + 1 < panels
+        # Pratt diagonals fall towards mid-span (tension under gravity), Howe
+        # diagonals rise towards it (compression).
+        if left_half == towards_centre:
+            members.append((top + i, i + 1))
+        else:
+            members.append((i, top + i + 1))
+    loaded = np.arange(1, panels)
+    return _simply_supported(_chords(panels, panel_length, depth), members, 0, panels, loaded, load)
+
+
+def pratt_truss(panels: int, *, panel_length: float = 1.0, depth: float = 1.0, load: float = -1.0) -> TrussModel:
+    """Parallel-chord Pratt truss: verticals plus diagonals falling towards mid-span."""
+
+    return _parallel_chord(panels, panel_length, depth, load, towards_centre=True)
+
+
+def howe_truss(panels: int, *, panel_length: float = 1.0, depth: float = 1.0, load: float = -1.0) -> TrussModel:
+    """Parallel-chord Howe truss: verticals plus diagonals rising towards mid-span."""
+
+    return _parallel_chord(panels, panel_length, depth, load, towards_centre=False)
+
+
+def warren_truss(panels: int, *, panel_length: float = 1.0, depth: float = 1.0, load: float = -1.0) -> TrussModel:
+    """Warren truss without verticals; the top chord nodes sit over mid-panel."""
+
+    _check_panels(panels)
+    xs = np.arange(panels + 1) * panel_length
+    top_xs = (np.arange(panels) + 0.5) * panel_length
+    coordinates = np.concatenate(
+        [np.column_stack([xs, np.zeros_like(xs)]), np.column_stack([top_xs, np.full_like(top_xs, depth)])]
+    )
+    top = panels + 1
+    members: Pairs = [(i, i + 1) for i in range(panels)]
+    members += [(top + i, top + i + 1) for i in range(panels - 1)]
+    members += [(i, top + i) for i in range(panels)]
+    members += [(top + i, i + 1) for i in range(panels)]
+    loaded = np.arange(1, panels)
+    return _simply_supported(coordinates, members, 0, panels, loaded, load)
+
+
+def k_truss(panels: int, *, panel_length: float = 1.0, depth: float = 1.0, load: float = -1.0) -> TrussModel:
+    """K truss: interior verticals are split at mid-height and braced by a K per panel.
+
+    The two diagonals of each panel run from the top and bottom of the
+    vertical nearer the support to the mid-height node of the other one, so
+    the central vertical of an even span receives a K from both sides. With
+    full-height end verticals the layout is statically indeterminate to the
+    first degree, so it exercises the stiffness path of the solver.
+    """
+
+    _check_panels(panels, minimum=2)
+    coordinates = _chords(panels, panel_length, depth)
+    top = panels + 1
+    interior = np.arange(1, panels)
+    mid = {int(i): 2 * panels + 2 + k for k, i in enumerate(interior)}
+    xs = interior * panel_length
+    coordinates = np.concatenate([coordinates, np.column_stack([xs, np.full_like(xs, depth / 2.0, dtype=float)])])
+
+    members: Pairs = [(i, i + 1) for i in range(panels)]
+    members += [(top + i, top + i + 1) for i in range(panels)]
+    members += [(0, top), (panels, top + panels)]
+    for i in interior:
+        members += [(int(i), mid[int(i)]), (mid[int(i)], top + int(i))]
+    for i in range(panels):
+        near, far = (i, i + 1) if 2 * i + 1 < panels else (i + 1, i)
+        members += [(near, mid[far]), (top + near, mid[far])]
+    loaded = np.arange(1, panels)
+    return _simply_supported(coordinates, members, 0, panels, loaded, load)
+
+
+def space_grid(
+    nx: int,
+    ny: int = None,
+    *,
+    spacing: float = 1.0,
+    depth: float = 1.0,
+    load: float = -1.0,
+) -> TrussModel:
+    """Square-on-square double-layer grid of ``nx`` by ``ny`` bays.
+
+    The bottom layer has ``(nx + 1) * (ny + 1)`` nodes, the top layer one node
+    over the centre of every bay, joined to the four bottom corners of its
+    bay. Every bottom perimeter node is supported vertically, and two corners
+    also restrain the in-plane rigid-body motions. ``load`` acts in ``z`` on
+    every top node.
+    """
+
+    ny = nx if ny is None else ny
+    _check_panels(min(nx, ny))
+    bx, by = np.meshgrid(np.arange(nx + 1), np.arange(ny + 1), indexing="ij")
+    tx, ty = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    bottom = np.column_stack([bx.ravel() * spacing, by.ravel() * spacing, np.zeros(bx.size)])
+    upper = np.column_stack([(tx.ravel() + 0.5) * spacing, (ty.ravel() + 0.5) * spacing, np.full(tx.size, depth)])
+    coordinates = np.concatenate([bottom, upper])
+
+    b = np.arange(bx.size).reshape(nx + 1, ny + 1)
+    t = bx.size + np.arange(tx.size).reshape(nx, ny)
+    pieces = [
+        np.column_stack([b[:-1, :].ravel(), b[1:, :].ravel()]),
+        np.column_stack([b[:, :-1].ravel(), b[:, 1:].ravel()]),
+        np.column_stack([t[:-1, :].ravel(), t[1:, :].ravel()]),
+        np.column_stack([t[:, :-1].ravel(), t[:, 1:].ravel()]),
+    ]
+    for corner in (b[:-1, :-1], b[1:, :-1], b[:-1, 1:], b[1:, 1:]):
+        pieces.append(np.column_stack([corner.ravel(), t.ravel()]))
+    members = np.concatenate(pieces)
+
+    restraints = np.zeros_like(coordinates, dtype=bool)
+    perimeter = np.zeros((nx + 1, ny + 1), dtype=bool)
+    perimeter[[0, -1], :] = True
+    perimeter[:, [0, -1]] = True
+    restraints[b[perimeter], 2] = True
+    restraints[b[0, 0], :2] = True
+    restraints[b[-1, 0], 1] = True
+    loads = np.zeros_like(coordinates)
+    loads[t.ravel(), 2] = load
+    return TrussModel.from_arrays(coordinates, members, restraints, loads)
+
+
+GENERATORS = {
+    "pratt": pratt_truss,
+    "howe": howe_truss,
+    "warren": warren_truss,
+    "k": k_truss,
+}
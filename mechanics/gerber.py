@@ -0,0 +1,195 @@
+"""Gerber (hinged) beams: chains of rigid segments joined by internal hinges.
+
+A straight beam on ``[0, length]`` is split by hinges that transmit shear but
+no moment. Supports are rollers or pins (``"Movil"``/``"Fijo"``, a vertical
+reaction) or fixed ends (``"Empotrado"``, a vertical reaction and a moment).
+Loads follow :mod:`mechanics.viga`: positive magnitudes act downward.
+
+Each segment contributes a vertical and a moment equation in its own
+reactions and the shears of its two hinges, so ordering the unknowns along
+the beam gives a banded system. Beyond the dense-solve size,
+:func:`~mechanics.sparse.factorize` eliminates it with one sweep along the
+chain and a back substitution, ``O(segments)``. The shear and moment diagrams
+reuse :class:`~mechanics.viga.BeamLoadIndex`.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .sparse import CSRMatrix, SingularMatrixError, factorize
+from .viga import (
+    BeamComputationError,
+    BeamLoadIndex,
+    DistributedLoad,
+    PointLoad,
+    SupportType,
+    _normalise_distributed_loads,
+    _normalise_point_loads,
+)
+
+
+@dataclass(frozen=True)
+class GerberSupport:
+    """Support at ``position``; ``"Empotrado"`` also resists moment."""
+
+    position: float
+    type: SupportType = "Movil"
+
+    @property
+    def is_fixed(self) -> bool:
+        return self.type.strip().lower() == "empotrado"
+
+
+def _normalise_supports(supports: Sequence[GerberSupport]) -> List[GerberSupport]:
+    normalised: List[GerberSupport] = []
+    for item in supports:
+        if isinstance(item, GerberSupport):
+            normalised.append(item)
+        elif isinstance(item, (tuple, list)) and len(item) >= 1:
+            normalised.append(GerberSupport(float(item[0]), str(item[1]) if len(item) > 1 else "Movil"))
+        elif isinstance(item, dict):
+            normalised.append(
+                GerberSupport(position=float(item.get("position", 0.0)), type=str(item.get("type", "Movil")))
+            )
+        else:
+            raise TypeError(f"Unsupported support definition: {item!r}")
+    return normalised
+
+
+@dataclass(frozen=True)
+class GerberBeamResult:
+    """Reactions, hinge shears and diagrams of a solved Gerber beam.
+
+    ``reactions`` (upward) and ``moments`` (anticlockwise, zero unless the
+    support is fixed) follow the order of ``supports``; ``hinge_shears`` is
+    the upward force the right segment exerts on the left one at each hinge.
+    """
+
+    supports: List[GerberSupport]
+    hinges: np.ndarray
+    reactions: np.ndarray
+    moments: np.ndarray
+    hinge_shears: np.ndarray
+    positions: np.ndarray
+    shear: np.ndarray
+    moment: np.ndarray
+    index: BeamLoadIndex
+
+
+def solve_gerber_beam(
+    *,
+    length: float,
+    supports: Sequence[GerberSupport],
+    hinges: Sequence[float] = (),
+    point_loads: Optional[Sequence[PointLoad]] = None,
+    distributed_loads: Optional[Sequence[DistributedLoad]] = None,
+    num_points: int = 800,
+    method: str = "auto",
+) -> GerberBeamResult:
+    """Solve a statically determinate hinged beam.
+
+    The beam needs one reaction component more than it has segments; fewer
+    make it a mechanism and more make it indeterminate, and both raise
+    :class:`~mechanics.viga.BeamComputationError`, as do unstable support
+    layouts. ``method`` is passed to :func:`~mechanics.sparse.factorize`.
+    """
+
+    if length <= 0:
+        raise BeamComputationError("Beam length must be positive.")
+    supports = _normalise_supports(supports)
+    loads_p = _normalise_point_loads(point_loads)
+    loads_d = _normalise_distributed_loads(distributed_loads)
+
+    hinges = np.asarray(sorted(float(h) for h in hinges), dtype=float)
+    if np.any((hinges <= 0) | (hinges >= length)) or np.any(np.diff(hinges) <= 0):
+        raise BeamComputationError("Hinges must be distinct positions strictly inside the beam.")
+    positions = np.asarray([s.position for s in supports], dtype=float)
+    if np.any((positions < 0) | (positions > length)):
+        raise BeamComputationError("Supports must lie on the beam.")
+    fixed = np.asarray([s.is_fixed for s in supports], dtype=bool)
+
+    num_segments = hinges.size + 1
+    num_unknowns = positions.size + int(fixed.sum()) + hinges.size
+    if num_unknowns != 2 * num_segments:
+        kind = "a mechanism" if num_unknowns < 2 * num_segments else "statically indeterminate"
+        raise BeamComputationError(
+            f"A beam with {hinges.size} hinge(s) needs {num_segments + 1} reaction components; "
+            f"{num_unknowns - hinges.size} make it {kind}."
+        )
+
+    starts = np.concatenate(([0.0], hinges))
+    ends = np.concatenate((hinges, [float(length)]))
+    # A support at a hinge is taken by the segment on its left.
+    segment = np.searchsorted(hinges, positions, side="left")
+
+    # Columns: support reactions, fixed-end moments, then hinge shears.
+    moment_columns = positions.size + np.arange(fixed.sum())
+    hinge_columns = positions.size + fixed.sum() + np.arange(hinges.size)
+    fixed_rows = np.flatnonzero(fixed)
+    left = np.arange(hinges.size)
+    rows = np.concatenate(
+        [2 * segment, 2 * segment + 1, 2 * segment[fixed_rows] + 1, 2 * left, 2 * left + 1, 2 * left + 2]
+    )
+    cols = np.concatenate([np.arange(positions.size)] * 2 + [moment_columns] + [hinge_columns] * 3)
+    values = np.concatenate(
+        [
+            np.ones(positions.size),
+            positions - starts[segment],
+            np.ones(fixed_rows.size),
+            np.ones(hinges.size),
+            ends[:-1] - starts[:-1],
+            -np.ones(hinges.size),
+        ]
+    )
+    matrix = CSRMatrix.from_coo(rows, cols, values, (num_unknowns, num_unknowns))
+
+    # Load resultant and first moment about the start of each segment, from
+    # the load-only index: -V(x) is the load left of x and -M(x) its moment.
+    # Loads act strictly after their position, so a load on a hinge belongs
+    # to the right segment and the last cut sits just past the end.
+    loads = BeamLoadIndex.build(length=length, reactions={}, point_loads=loads_p, distributed_loads=loads_d)
+    shear, moment, _ = loads.evaluate(np.concatenate(([0.0], hinges, [np.nextafter(float(length), np.inf)])))
+    carried, lever = -shear, -moment
+    span = ends - starts
+    total = carried[1:] - carried[:-1]
+    about_end = lever[1:] - lever[:-1] - span * carried[:-1]
+    rhs = np.empty(2 * num_segments)
+    rhs[0::2] = total
+    rhs[1::2] = span * total - about_end
+
+    try:
+        unknowns = factorize(matrix, method=method).solve(rhs)
+    except SingularMatrixError:
+        raise BeamComputationError("The support layout leaves a segment free to move (a mechanism).") from None
+
+    reactions = unknowns[: positions.size]
+    moments = np.zeros(positions.size)
+    moments[fixed_rows] = unknowns[moment_columns]
+    index = BeamLoadIndex.build(
+        length=length,
+        reactions={},
+        point_loads=loads_p,
+        distributed_loads=loads_d,
+        supports=list(zip(positions.tolist(), reactions.tolist())),
+        couples=list(zip(positions[fixed_rows].tolist(), (-moments[fixed_rows]).tolist())),
+    )
+    # Forces at a position act just after it, so the last station is
+    # evaluated just before the end to include a support placed there.
+    x = np.linspace(0.0, length, max(num_points, 2))
+    stations = x.copy()
+    stations[-1] = np.nextafter(stations[-1], 0.0)
+    shear_curve, moment_curve, _ = index.evaluate(stations)
+    return GerberBeamResult(
+        supports=supports,
+        hinges=hinges,
+        reactions=reactions,
+        moments=moments,
+        hinge_shears=unknowns[hinge_columns],
+        positions=x,
+        shear=shear_curve,
+        moment=moment_curve,
+        index=index,
+    )
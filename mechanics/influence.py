@@ -0,0 +1,128 @@
+"""Influence lines of truss member forces and moving panel-point loads.
+
+A unit load travels along a chord and is applied at every panel point; all
+positions are solved as one multi right-hand side block on a single
+:class:`~mechanics.truss.TrussSystem` factorization. Between panel points
+the load reaches the truss through the floor system (stringers simply
+supported on floor beams), so influence lines are linear between panels.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from .truss import TrussComputationError, TrussModel, TrussSystem
+
+
+@dataclass(frozen=True)
+class InfluenceLines:
+    """Member forces and reactions per unit load at each panel point.
+
+    ``positions`` are distances along the chord from its first panel point,
+    ``forces`` is ``(members, panel points)`` and ``reactions`` is
+    ``(panel points, nodes, dim)``.
+    """
+
+    nodes: np.ndarray
+    positions: np.ndarray
+    forces: np.ndarray
+    reactions: np.ndarray
+
+    @property
+    def length(self) -> float:
+        return float(self.positions[-1] - self.positions[0])
+
+    def evaluate(self, stations: Any) -> np.ndarray:
+        """Member forces ``(members, stations)`` for a unit load at ``stations``.
+
+        Values are interpolated linearly between panel points and are zero
+        off the chord.
+        """
+
+        stations = np.atleast_1d(np.asarray(stations, dtype=float))
+        positions = self.positions
+        panel = np.clip(np.searchsorted(positions, stations, side="right") - 1, 0, len(positions) - 2)
+        span = positions[panel + 1] - positions[panel]
+        weight = (stations - positions[panel]) / span
+        values = self.forces[:, panel] * (1.0 - weight) + self.forces[:, panel + 1] * weight
+        on_chord = (stations >= positions[0]) & (stations <= positions[-1])
+        return np.where(on_chord, values, 0.0)
+
+    def moving_load(self, axle_loads: Sequence[float], spacings: Sequence[float] = ()) -> "MovingLoadEnvelope":
+        """Extreme member forces for a train of axle loads crossing the chord.
+
+        ``spacings`` are the distances between consecutive axles, so the axle
+        offsets behind the lead axle are their cumulative sums. Influence lines
+        are piecewise linear, so the extremes occur with some axle on a panel
+        point; only those lead positions are evaluated.
+        """
+
+        axle_loads = np.asarray(axle_loads, dtype=float)
+        offsets = np.concatenate(([0.0], np.cumsum(np.asarray(spacings, dtype=float))))
+        if offsets.size != axle_loads.size:
+            raise TrussComputationError("A train needs one spacing fewer than axle loads.")
+
+        leads = np.unique((self.positions[:, None] + offsets[None, :]).ravel())
+        stations = leads[:, None] - offsets[None, :]
+        values = self.evaluate(stations.ravel()).reshape(-1, leads.size, offsets.size)
+        totals = values @ axle_loads
+        upper = np.argmax(totals, axis=1)
+        lower = np.argmin(totals, axis=1)
+        rows = np.arange(totals.shape[0])
+        return MovingLoadEnvelope(
+            maximum=totals[rows, upper],
+            minimum=totals[rows, lower],
+            lead_at_maximum=leads[upper],
+            lead_at_minimum=leads[lower],
+        )
+
+
+@dataclass(frozen=True)
+class MovingLoadEnvelope:
+    """Per-member force envelope of a moving train and where the lead axle sits."""
+
+    maximum: np.ndarray
+    minimum: np.ndarray
+    lead_at_maximum: np.ndarray
+    lead_at_minimum: np.ndarray
+
+
+def influence_lines(
+    model: TrussModel,
+    chord_nodes: Sequence[int],
+    *,
+    direction: Sequence[float] = (0.0, -1.0),
+    method: str = "auto",
+    system: Optional[TrussSystem] = None,
+) -> InfluenceLines:
+    """Influence lines of every member for a unit load along ``chord_nodes``.
+
+    ``chord_nodes`` are node rows listed in travel order and ``direction`` is
+    the direction of the unit load (downwards by default). An existing
+    ``system`` for the same model can be passed to reuse its factorization.
+    """
+
+    nodes = np.asarray(chord_nodes, dtype=np.intp)
+    if nodes.size < 2:
+        raise TrussComputationError("An influence line needs at least two panel points.")
+    direction = np.asarray(direction, dtype=float)
+    if direction.shape != (model.dim,):
+        raise TrussComputationError(f"The load direction must have {model.dim} components.")
+
+    steps = np.linalg.norm(np.diff(model.coordinates[nodes], axis=0), axis=1)
+    if np.any(steps <= 0):
+        raise TrussComputationError("Consecutive panel points must be distinct nodes.")
+    positions = np.concatenate(([0.0], np.cumsum(steps)))
+
+    loads = np.zeros((nodes.size, model.num_nodes, model.dim))
+    loads[np.arange(nodes.size), nodes] = direction / np.linalg.norm(direction)
+    system = system or TrussSystem(model, method=method)
+    result = system.solve(loads)
+    return InfluenceLines(
+        nodes=nodes,
+        positions=positions,
+        forces=result.forces,
+        reactions=result.reactions,
+    )
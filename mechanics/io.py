@@ -0,0 +1,376 @@
+"""Bulk import of truss and frame models from CSV or JSON-lines tables.
+
+A model is read from up to four tables whose columns use the keys of the
+desktop dictionaries, so a JSON-lines row looks like the corresponding
+``nodos``/``miembros``/``cargas`` entry:
+
+* nodes: ``id``, ``x``, ``y`` and, for space trusses, ``z``;
+* members: ``inicio``, ``fin`` and optionally ``EA`` (frames also ``EI``,
+  ``articulado_inicio``, ``articulado_fin``, ``qx`` and ``qy``);
+* supports: ``nodo`` with an ``apoyo`` name or ``restricciones`` letters;
+* loads: ``nodo``, ``Fx``, ``Fy`` and ``Fz`` (trusses) or ``M`` (frames).
+
+The format follows the file extension (``.csv``, or ``.jsonl``/``.ndjson``).
+Files are read in chunks of ``chunk_rows`` rows that are converted to typed
+column arrays straight away, so CAD exports with hundreds of thousands of
+rows never exist as per-row Python objects all at once. Validation is done
+on the whole columns: duplicate ids, members or loads referencing unknown
+nodes and zero-length members raise :class:`ModelImportError` naming the
+offending ids.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import os
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .frame import DEFAULT_AXIAL_STIFFNESS, DEFAULT_FLEXURAL_STIFFNESS, FRAME_SUPPORT_RESTRAINTS, FrameModel
+from .truss import AXES, TrussModel, support_restraints
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+CHUNK_ROWS = 65536
+CSV_SUFFIXES = (".csv",)
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+TRUE_WORDS = ("1", "true", "yes", "si", "sí", "x")
+# Offending ids quoted in an error message.
+REPORTED_IDS = 5
+
+NODE_COLUMNS = {"id": "id", "x": "float", "y": "float", "z": "float"}
+TRUSS_MEMBER_COLUMNS = {"inicio": "id", "fin": "id", "EA": "float"}
+FRAME_MEMBER_COLUMNS = {
+    **TRUSS_MEMBER_COLUMNS,
+    "EI": "float",
+    "articulado_inicio": "bool",
+    "articulado_fin": "bool",
+    "qx": "float",
+    "qy": "float",
+}
+SUPPORT_COLUMNS = {"nodo": "id", "apoyo": "str", "restricciones": "str"}
+LOAD_COLUMNS = {"nodo": "id", "Fx": "float", "Fy": "float", "Fz": "float", "M": "float"}
+
+
+class ModelImportError(ValueError):
+    """Raised when a model table cannot be read or fails validation."""
+
+
+def _format_of(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in CSV_SUFFIXES:
+        return "csv"
+    if suffix in JSONL_SUFFIXES:
+        return "jsonl"
+    raise ModelImportError(f"Unknown table format {suffix!r} for {path.name}; use .csv or .jsonl.")
+
+
+def _csv_chunks(handle, chunk_rows: int, name: str) -> Iterator[Dict[str, np.ndarray]]:
+    reader = csv.reader(handle)
+    header = [column.strip() for column in next(reader, [])]
+    while True:
+        rows = [row for row in islice(reader, chunk_rows) if row]
+        if not rows:
+            return
+        widths = np.fromiter(map(len, rows), dtype=np.intp, count=len(rows))
+        if np.any(widths != len(header)):
+            raise ModelImportError(f"{name}: every row needs the {len(header)} columns of the header.")
+        cells = np.char.strip(np.asarray(rows, dtype=str))
+        yield {column: cells[:, k] for k, column in enumerate(header)}
+
+
+def _jsonl_chunks(handle, chunk_rows: int, name: str) -> Iterator[Dict[str, np.ndarray]]:
+    lines = (line for line in handle if line.strip())
+    while True:
+        try:
+            rows = [json.loads(line) for line in islice(lines, chunk_rows)]
+        except json.JSONDecodeError as exc:
+            raise ModelImportError(f"{name}: invalid JSON line ({exc.msg}).") from None
+        if not rows:
+            return
+        columns = dict.fromkeys(key for row in rows for key in row)
+        yield {column: np.asarray([row.get(column) for row in rows], dtype=object) for column in columns}
+
+
+def iter_table(path: PathLike, *, chunk_rows: int = CHUNK_ROWS) -> Iterator[Dict[str, np.ndarray]]:
+    """Raw column arrays of successive chunks of a CSV or JSON-lines table.
+
+    CSV cells are stripped strings (empty when missing); JSON-lines values
+    keep their JSON type, with ``None`` for keys a row does not have.
+    """
+
+    path = Path(path)
+    reader = _csv_chunks if _format_of(path) == "csv" else _jsonl_chunks
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        yield from reader(handle, max(int(chunk_rows), 1), path.name)
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def _as_text(values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind == "U":
+        return values
+    return np.asarray([_text(value) for value in values.tolist()], dtype=str)
+
+
+def _blank(kind: str, size: int) -> np.ndarray:
+    if kind == "float":
+        return np.full(size, np.nan)
+    if kind == "bool":
+        return np.zeros(size, dtype=bool)
+    return np.full(size, "")
+
+
+def _convert(values: np.ndarray, kind: str) -> np.ndarray:
+    if kind == "float":
+        if values.dtype.kind == "U":
+            values = np.where(values == "", "nan", values)
+        try:
+            return values.astype(float)
+        except (TypeError, ValueError):
+            raise ModelImportError("Non-numeric value in a numeric column.") from None
+    if kind == "bool":
+        return np.isin(np.char.lower(_as_text(values)), TRUE_WORDS)
+    return _as_text(values)
+
+
+def read_table(
+    path: PathLike,
+    columns: Mapping[str, str],
+    *,
+    required: Sequence[str] = (),
+    chunk_rows: int = CHUNK_ROWS,
+) -> Dict[str, np.ndarray]:
+    """Typed arrays of the ``columns`` a table has.
+
+    ``columns`` maps column names to ``"float"`` (missing cells are NaN),
+    ``"bool"``, ``"str"`` or ``"id"`` (text here, see :func:`_ids`); other
+    columns are ignored. Columns in ``required`` must be present.
+    """
+
+    name = Path(path).name
+    pieces: Dict[str, list] = {}
+    num_rows = 0
+    for chunk in iter_table(path, chunk_rows=chunk_rows):
+        size = len(next(iter(chunk.values())))
+        for column, kind in columns.items():
+            if column in chunk:
+                try:
+                    converted = _convert(chunk[column], kind)
+                except ModelImportError as exc:
+                    raise ModelImportError(f"{name}, column {column!r}: {exc}") from None
+                pieces.setdefault(column, [_blank(kind, num_rows)]).append(converted)
+        for column, parts in pieces.items():
+            if column not in chunk:
+                parts.append(_blank(columns[column], size))
+        num_rows += size
+
+    if num_rows == 0:
+        return {column: _blank(columns[column], 0) for column in required}
+    missing = [column for column in required if column not in pieces]
+    if missing:
+        raise ModelImportError(f"{name} lacks the column(s) {', '.join(missing)}.")
+    table = {column: np.concatenate(parts) for column, parts in pieces.items()}
+    for column in required:
+        if columns[column] == "float" and np.isnan(table[column]).any():
+            raise ModelImportError(f"{name}: column {column!r} has empty cells.")
+        if columns[column] in ("id", "str") and np.any(table[column] == ""):
+            raise ModelImportError(f"{name}: column {column!r} has empty cells.")
+    return table
+
+
+def _sample(values: np.ndarray) -> str:
+    shown = ", ".join(str(value) for value in values[:REPORTED_IDS].tolist())
+    extra = values.size - REPORTED_IDS
+    return f"{shown} and {extra} more" if extra > 0 else shown
+
+
+def _ids(*columns: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Id columns as integers when every id is an integer, else as text."""
+
+    joined = np.concatenate(columns) if columns else np.empty(0, dtype=str)
+    digits = np.char.lstrip(joined, "-")
+    if joined.size and not np.all(np.char.isdigit(digits)):
+        return columns
+    return tuple(column.astype(np.int64) for column in columns)
+
+
+def _check_unique(ids: np.ndarray, what: str) -> None:
+    unique, counts = np.unique(ids, return_counts=True)
+    duplicated = unique[counts > 1]
+    if duplicated.size:
+        raise ModelImportError(f"Duplicate {what} ids: {_sample(duplicated)}.")
+
+
+def _node_rows(node_ids: np.ndarray, references: np.ndarray, what: str) -> np.ndarray:
+    """Rows of the referenced node ids; unknown ids raise."""
+
+    order = np.argsort(node_ids, kind="stable")
+    position = np.searchsorted(node_ids[order], references)
+    position = np.minimum(position, max(node_ids.size - 1, 0))
+    found = node_ids[order][position] == references if node_ids.size else np.zeros(references.size, dtype=bool)
+    if not np.all(found):
+        raise ModelImportError(f"{what} reference unknown nodes: {_sample(np.unique(references[~found]))}.")
+    return order[position]
+
+
+def _support_restraints(table: Dict[str, np.ndarray], axes: str, names: Mapping[str, Tuple[bool, ...]]) -> np.ndarray:
+    """``(supports, len(axes))`` flags from ``restricciones`` letters, else ``apoyo`` names."""
+
+    size = table["nodo"].size
+    letters = table.get("restricciones", np.full(size, ""))
+    apoyo = table.get("apoyo", np.full(size, ""))
+    keys = np.where(letters != "", np.char.add("=", np.char.lower(letters)), np.char.lower(apoyo))
+    unique, inverse = np.unique(keys, return_inverse=True)
+    flags = []
+    for key in unique.tolist():
+        if key.startswith("="):
+            if set(key[1:]) - set(axes):
+                raise ModelImportError(f"Unknown restrained axes {key[1:]!r}; use letters of {axes!r}.")
+            flags.append(tuple(axis in key for axis in axes))
+        elif key in names:
+            flags.append(names[key])
+        else:
+            raise ModelImportError(f"Unknown support type {key!r}.")
+    return np.asarray(flags, dtype=bool).reshape(-1, len(axes))[inverse.ravel()]
+
+
+def _read_geometry(
+    nodes: PathLike,
+    members: PathLike,
+    supports: Optional[PathLike],
+    loads: Optional[PathLike],
+    member_columns: Mapping[str, str],
+    chunk_rows: int,
+):
+    node_table = read_table(nodes, NODE_COLUMNS, required=("id", "x", "y"), chunk_rows=chunk_rows)
+    member_table = read_table(members, member_columns, required=("inicio", "fin"), chunk_rows=chunk_rows)
+    support_table = (
+        read_table(supports, SUPPORT_COLUMNS, required=("nodo",), chunk_rows=chunk_rows)
+        if supports is not None
+        else {"nodo": np.empty(0, dtype=str)}
+    )
+    load_table = (
+        read_table(loads, LOAD_COLUMNS, required=("nodo",), chunk_rows=chunk_rows)
+        if loads is not None
+        else {"nodo": np.empty(0, dtype=str)}
+    )
+
+    node_ids, starts, ends, supported, loaded = _ids(
+        node_table["id"], member_table["inicio"], member_table["fin"], support_table["nodo"], load_table["nodo"]
+    )
+    _check_unique(node_ids, "node")
+    _check_unique(supported, "support node")
+    ends = _node_rows(node_ids, np.concatenate([starts, ends]), "Members").reshape(2, -1).T
+    support_rows = _node_rows(node_ids, supported, "Supports")
+    load_rows = _node_rows(node_ids, loaded, "Loads")
+    return node_ids, node_table, ends, member_table, support_rows, support_table, load_rows, load_table
+
+
+def _check_lengths(coordinates: np.ndarray, members: np.ndarray, node_ids: np.ndarray) -> None:
+    lengths = np.linalg.norm(coordinates[members[:, 1]] - coordinates[members[:, 0]], axis=1)
+    zero = np.flatnonzero(lengths == 0)
+    if zero.size:
+        shown = ", ".join(f"{node_ids[a]}-{node_ids[b]}" for a, b in members[zero[:REPORTED_IDS]].tolist())
+        raise ModelImportError(f"{zero.size} zero-length member(s): {shown}.")
+
+
+def _fill(table: Mapping[str, np.ndarray], column: str, size: int, default: float) -> np.ndarray:
+    values = table.get(column)
+    if values is None:
+        return np.full(size, default)
+    return np.where(np.isnan(values), default, values)
+
+
+def read_truss(
+    nodes: PathLike,
+    members: PathLike,
+    supports: Optional[PathLike] = None,
+    loads: Optional[PathLike] = None,
+    *,
+    chunk_rows: int = CHUNK_ROWS,
+) -> TrussModel:
+    """Truss model from node, member, support and load tables.
+
+    The truss is spatial when the node table has a ``z`` column. Support
+    names follow :func:`~mechanics.truss.support_restraints` and loads on
+    the same node add up. Without an ``EA`` column the stiffness is uniform.
+    """
+
+    node_ids, node_table, ends, member_table, support_rows, support_table, load_rows, load_table = _read_geometry(
+        nodes, members, supports, loads, TRUSS_MEMBER_COLUMNS, chunk_rows
+    )
+    dim = 3 if "z" in node_table else 2
+    axes = AXES[:dim]
+    coordinates = np.column_stack([_fill(node_table, axis, node_ids.size, 0.0) for axis in axes])
+    _check_lengths(coordinates, ends, node_ids)
+
+    names = {name: support_restraints(name, dim) for name in ("empotrado", "fijo", "móvil", "movil", "libre")}
+    restraints = np.zeros((node_ids.size, dim), dtype=bool)
+    restraints[support_rows] = _support_restraints(support_table, axes, names)
+    forces = np.zeros((node_ids.size, dim))
+    np.add.at(
+        forces,
+        load_rows,
+        np.column_stack([_fill(load_table, f"F{axis}", load_rows.size, 0.0) for axis in axes]),
+    )
+
+    axial = member_table.get("EA")
+    if axial is not None and np.isnan(axial).any():
+        raise ModelImportError("EA must be given for every member or for none.")
+    return TrussModel.from_arrays(coordinates, ends, restraints, forces, node_ids=node_ids, axial_stiffness=axial)
+
+
+def read_frame(
+    nodes: PathLike,
+    members: PathLike,
+    supports: Optional[PathLike] = None,
+    loads: Optional[PathLike] = None,
+    *,
+    chunk_rows: int = CHUNK_ROWS,
+) -> FrameModel:
+    """Plane frame model from node, member, support and load tables.
+
+    ``restricciones`` letters are ``x``, ``y`` and ``r`` (rotation); missing
+    ``EA``/``EI`` take the nominal section of :mod:`mechanics.frame`.
+    """
+
+    node_ids, node_table, ends, member_table, support_rows, support_table, load_rows, load_table = _read_geometry(
+        nodes, members, supports, loads, FRAME_MEMBER_COLUMNS, chunk_rows
+    )
+    coordinates = np.column_stack([node_table["x"], node_table["y"]])
+    _check_lengths(coordinates, ends, node_ids)
+
+    restraints = np.zeros((node_ids.size, 3), dtype=bool)
+    restraints[support_rows] = _support_restraints(support_table, "xyr", FRAME_SUPPORT_RESTRAINTS)
+    forces = np.zeros((node_ids.size, 3))
+    np.add.at(
+        forces,
+        load_rows,
+        np.column_stack([_fill(load_table, column, load_rows.size, 0.0) for column in ("Fx", "Fy", "M")]),
+    )
+
+    size = ends.shape[0]
+    no_release = np.zeros(size, dtype=bool)
+    return FrameModel.from_arrays(
+        coordinates,
+        ends,
+        restraints,
+        forces,
+        releases=np.column_stack(
+            [member_table.get("articulado_inicio", no_release), member_table.get("articulado_fin", no_release)]
+        ),
+        member_loads=np.column_stack([_fill(member_table, "qx", size, 0.0), _fill(member_table, "qy", size, 0.0)]),
+        axial_stiffness=_fill(member_table, "EA", size, DEFAULT_AXIAL_STIFFNESS),
+        flexural_stiffness=_fill(member_table, "EI", size, DEFAULT_FLEXURAL_STIFFNESS),
+        node_ids=node_ids,
+    )
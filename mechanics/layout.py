@@ -0,0 +1,330 @@
+"""Ground-structure layout optimisation of trusses.
+
+A ground structure joins the nodes of a grid, or of any node set, with every
+candidate member up to a given length. The lightest truss that carries one
+load case within the stress limits ``σt`` and ``σc`` solves the linear
+program ``min Σ L (N⁺/σt + N⁻/σc)`` subject to nodal equilibrium, and its
+optimum keeps only a few of the candidates.
+
+SciPy is optional here, so the program is solved by a primal-dual interior
+point method (Mehrotra's predictor-corrector) written on top of
+:mod:`mechanics.sparse`. Each iteration solves with the normal matrix
+``B D Bᵀ``, where ``B`` is the equilibrium matrix and ``D`` a positive
+diagonal: it is a stiffness matrix with member stiffnesses ``D``, so its
+sparsity pattern never changes. It is refilled through one
+:class:`~mechanics.sparse.CSRPattern`, scaled to a unit diagonal,
+factorized with a single bandwidth ordering computed once, and the
+predictor and corrector share each factorization. The iteration count
+barely grows with the number of candidates, so the cost is a few dozen
+sparse factorizations.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+from .sparse import CSRPattern, SingularMatrixError, factorize, reverse_cuthill_mckee
+from .truss import TrussComputationError, TrussModel, _member_dofs
+
+# Origins processed together when searching candidate members, which bounds
+# the temporary (origins, nodes, dim) arrays.
+_CHUNK = 256
+
+# Largest relative diagonal shift of the normal matrix before giving up.
+_MAX_SHIFT = 1e-4
+
+
+def ground_structure(
+    coordinates: Any,
+    restraints: Any,
+    loads: Any = None,
+    *,
+    max_length: Optional[float] = None,
+    node_ids: Any = None,
+) -> TrussModel:
+    """Truss with a candidate member between every pair of nodes.
+
+    Pairs farther apart than ``max_length`` are skipped, and so are pairs
+    with another node on the segment between them, whose member would only
+    duplicate the chain of shorter ones: from each node only the nearest node
+    in every direction is joined.
+    """
+
+    coordinates = np.asarray(coordinates, dtype=float)
+    num_nodes = coordinates.shape[0]
+    limit = np.inf if max_length is None else float(max_length)
+    size = float(np.max(np.ptp(coordinates, axis=0))) if num_nodes else 0.0
+    resolution = 1e-9 * max(size, 1.0)
+
+    pieces = []
+    for first in range(0, num_nodes, _CHUNK):
+        origins = np.arange(first, min(first + _CHUNK, num_nodes))
+        vectors = coordinates[None, :, :] - coordinates[origins, None, :]
+        distances = np.linalg.norm(vectors, axis=2)
+        origin, target = np.nonzero((distances > 0) & (distances <= limit))
+        distance = distances[origin, target]
+        # Collinear targets share the direction key; the nearest one wins.
+        keys = np.rint(vectors[origin, target] / distance[:, None] / resolution).astype(np.int64)
+        order = np.lexsort((distance,) + tuple(keys.T[::-1]) + (origin,))
+        grouped = np.column_stack([origin[order], keys[order]])
+        first_of_group = np.concatenate(([True], np.any(grouped[1:] != grouped[:-1], axis=1)))
+        start, end = origins[origin[order][first_of_group]], target[order][first_of_group]
+        pieces.append(np.column_stack([start, end])[start < end])
+
+    members = np.concatenate(pieces) if pieces else np.empty((0, 2), dtype=np.intp)
+    return TrussModel.from_arrays(coordinates, members, restraints, loads, node_ids=node_ids)
+
+
+@dataclass(frozen=True)
+class LayoutResult:
+    """Optimised areas of a ground structure.
+
+    ``areas`` (fully stressed, ``|N| / σ``) and ``forces`` follow the members
+    of ``model``; ``history`` holds the volume after every iteration.
+    """
+
+    model: TrussModel
+    areas: np.ndarray
+    forces: np.ndarray
+    volume: float
+    history: np.ndarray
+    converged: bool
+
+    @property
+    def iterations(self) -> int:
+        return int(self.history.size)
+
+    def active(self, threshold: float = 1e-5) -> np.ndarray:
+        """Members whose area is at least ``threshold`` times the largest one."""
+
+        return self.areas >= threshold * self.areas.max()
+
+    def layout(self, threshold: float = 1e-5, *, elastic_modulus: float = 1.0) -> TrussModel:
+        """The optimised truss, ready to analyse.
+
+        Only active members are kept, chains of collinear members through
+        unloaded, unsupported nodes become single members (such nodes would
+        be mechanisms on their own) and nodes left without members are
+        dropped. Member areas times ``elastic_modulus`` become the axial
+        stiffness, so the layout analyses like the design it came from.
+        """
+
+        keep = self.active(threshold)
+        members, areas = _merge_collinear_chains(self.model, self.model.members[keep], self.areas[keep])
+        used = np.unique(members)
+        position = np.full(self.model.num_nodes, -1, dtype=np.intp)
+        position[used] = np.arange(used.size)
+        return TrussModel.from_arrays(
+            self.model.coordinates[used],
+            position[members],
+            self.model.restraints[used],
+            self.model.loads[used],
+            node_ids=self.model.node_ids[used],
+            axial_stiffness=elastic_modulus * areas,
+        )
+
+
+def _merge_collinear_chains(model: TrussModel, members: np.ndarray, areas: np.ndarray):
+    num_members = members.shape[0]
+    degree = np.bincount(members.ravel(), minlength=model.num_nodes)
+    idle = ~model.restraints.any(axis=1) & ~np.any(model.loads != 0, axis=1)
+    candidates = np.flatnonzero((degree == 2) & idle)
+
+    # The two members meeting at every candidate and their far ends.
+    ends = members.ravel()
+    order = np.argsort(ends, kind="stable")
+    start = np.searchsorted(ends[order], candidates)
+    pair = (order[np.stack([start, start + 1])] // 2).T
+    far = members[pair].sum(axis=2) - candidates[:, None]
+    arms = model.coordinates[far] - model.coordinates[candidates][:, None, :]
+    arms /= np.linalg.norm(arms, axis=2, keepdims=True)
+    straight = np.linalg.norm(arms.sum(axis=1), axis=1) <= 1e-9
+    through, pair = candidates[straight], pair[straight]
+    if not through.size:
+        return members, areas
+
+    # Members linked through pass-through nodes share the smallest label.
+    labels = np.arange(num_members)
+    while True:
+        linked = np.minimum(labels[pair[:, 0]], labels[pair[:, 1]])
+        updated = labels.copy()
+        np.minimum.at(updated, pair[:, 0], linked)
+        np.minimum.at(updated, pair[:, 1], linked)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+
+    # Each chain keeps the two ends that are not pass-through nodes.
+    passing = np.zeros(model.num_nodes, dtype=bool)
+    passing[through] = True
+    chain, inverse = np.unique(labels, return_inverse=True)
+    outer_ends = ~passing[ends]
+    end_chain = np.repeat(inverse, 2)[outer_ends]
+    merged = ends[outer_ends][np.argsort(end_chain, kind="stable")].reshape(-1, 2)
+    merged_areas = np.zeros(chain.size)
+    np.maximum.at(merged_areas, inverse, areas)
+    return merged, merged_areas
+
+
+def _step_to_boundary(values: np.ndarray, steps: np.ndarray) -> float:
+    decreasing = steps < 0
+    if not decreasing.any():
+        return 1.0
+    return min(1.0, float(np.min(-values[decreasing] / steps[decreasing])))
+
+
+def optimise_layout(
+    model: TrussModel,
+    *,
+    tension_limit: float = 1.0,
+    compression_limit: Optional[float] = None,
+    max_iterations: int = 100,
+    tol: float = 1e-6,
+    regularization: float = 1e-12,
+    method: str = "cholesky",
+) -> LayoutResult:
+    """Minimum-volume member areas for the loads of ``model``.
+
+    Stops when the relative duality gap and the equilibrium residuals fall
+    below ``tol`` or after ``max_iterations``. ``method`` is passed to
+    :func:`~mechanics.sparse.factorize`. ``regularization`` is the diagonal
+    shift of the normal matrix relative to its diagonal; it is raised
+    automatically when rounding breaks a factorization, and if that still
+    fails the iterate so far is returned with ``converged`` false. A ground
+    structure that cannot carry the loads raises
+    :class:`~mechanics.truss.TrussComputationError`.
+    """
+
+    compression_limit = tension_limit if compression_limit is None else compression_limit
+    if tension_limit <= 0 or compression_limit <= 0:
+        raise TrussComputationError("Stress limits must be positive.")
+    lengths = model.member_lengths()
+    if np.any(lengths <= 0):
+        raise TrussComputationError("Members must have a positive length.")
+    num_members = model.num_members
+
+    # Symbolic work, done once: free-DOF numbering, CSR slots and ordering.
+    # Restrained DOFs point at a trailing zero so gathers need no masking.
+    free = np.flatnonzero(~model.restraints.ravel())
+    position = np.full(model.restraints.size, free.size, dtype=np.intp)
+    position[free] = np.arange(free.size)
+    local = position[_member_dofs(model)]
+    size = local.shape[1]
+    rows = np.repeat(local, size, axis=1)
+    cols = np.tile(local, (1, size))
+    keep = (rows < free.size) & (cols < free.size)
+    pattern = CSRPattern.from_coo(rows[keep], cols[keep], (free.size, free.size))
+    gradients = np.concatenate((-model.member_directions(), model.member_directions()), axis=1)
+    outer = (gradients[:, :, None] * gradients[:, None, :]).reshape(num_members, -1)
+    pattern_rows = np.repeat(np.arange(free.size), np.diff(pattern.indptr))
+    diagonal = np.flatnonzero(pattern_rows == pattern.indices)
+    if diagonal.size < free.size:
+        raise TrussComputationError("The ground structure has free nodes without candidate members (mechanism).")
+    ordering = None
+    if method not in ("dense", "splu"):
+        ordering = reverse_cuthill_mckee(pattern.fill(np.ones(pattern.slots.size)))
+
+    loads = model.loads.ravel()[free]
+    load_scale = float(np.max(np.abs(loads))) if loads.size else 0.0
+    if load_scale == 0.0:
+        raise TrussComputationError("The ground structure has no loads to carry.")
+    costs = np.concatenate((lengths / tension_limit, lengths / compression_limit))
+    cost_scale = float(costs.max())
+    b, c = loads / load_scale, costs / cost_scale
+
+    def equilibrium(x: np.ndarray) -> np.ndarray:
+        forces = x[:num_members] - x[num_members:]
+        return np.bincount(local.ravel(), weights=(gradients * forces[:, None]).ravel(), minlength=free.size + 1)[:-1]
+
+    def transposed(y: np.ndarray) -> np.ndarray:
+        elongations = np.einsum("mk,mk->m", gradients, np.append(y, 0.0)[local])
+        return np.concatenate((elongations, -elongations))
+
+    def normal_solver(d: np.ndarray):
+        weights = d[:num_members] + d[num_members:]
+        matrix = pattern.fill((weights[:, None] * outer)[keep])
+        # Stiffnesses spread over many orders of magnitude near the optimum,
+        # so the matrix is scaled to a unit diagonal and every row gets the
+        # same relative shift, which also keeps the rows of nodes the optimum
+        # abandons factorizable. If rounding still breaks the factorization
+        # the shift is raised: a larger shift only damps the step.
+        stiffness = matrix.data[diagonal]
+        scale = 1.0 / np.sqrt(np.where(stiffness > 0, stiffness, 1.0))
+        matrix.data[:] *= scale[pattern_rows] * scale[pattern.indices]
+        shift = regularization
+        while True:
+            matrix.data[diagonal] = 1.0 + shift
+            try:
+                factor = factorize(matrix, method=method, ordering=ordering)
+                return lambda rhs: scale * factor.solve(scale * rhs)
+            except SingularMatrixError:
+                if shift >= _MAX_SHIFT:
+                    raise
+                shift = min(100.0 * shift, _MAX_SHIFT)
+
+    # Mehrotra's starting point: least-norm x and least-squares y, shifted
+    # into the positive orthant.
+    try:
+        solve = normal_solver(np.ones(2 * num_members))
+    except SingularMatrixError:
+        raise TrussComputationError("The ground structure cannot carry the loads (mechanism).") from None
+    x = transposed(solve(b))
+    # Load components on mechanisms of the whole ground structure only
+    # survive the regularisation, so they show up as a residual here.
+    if np.linalg.norm(b - equilibrium(x)) > 1e-6 * np.linalg.norm(b):
+        raise TrussComputationError("The ground structure cannot carry the loads (mechanism).")
+    y = solve(equilibrium(c))
+    z = c - transposed(y)
+    x = x + max(-1.5 * x.min(), 0.0)
+    z = z + max(-1.5 * z.min(), 0.0)
+    x, z = x + 0.5 * (x @ z) / z.sum(), z + 0.5 * (x @ z) / x.sum()
+
+    history = []
+    converged = False
+    for _ in range(max_iterations):
+        primal = b - equilibrium(x)
+        dual = c - transposed(y) - z
+        objective = float(c @ x)
+        gap = abs(objective - float(b @ y)) / (1.0 + abs(objective))
+        if gap <= tol and np.linalg.norm(primal) <= tol * (1.0 + np.linalg.norm(b)) and np.linalg.norm(
+            dual
+        ) <= tol * (1.0 + np.linalg.norm(c)):
+            converged = True
+            break
+
+        # Predictor and corrector share one factorization of B D B^T.
+        d = x / z
+        try:
+            solve = normal_solver(d)
+        except SingularMatrixError:
+            # Rounding, not the structure, ends the iterations here; the
+            # iterate so far is returned unconverged.
+            break
+
+        def direction(complementarity: np.ndarray):
+            dy = solve(primal - equilibrium(complementarity / z - d * dual))
+            dz = dual - transposed(dy)
+            return complementarity / z - d * dz, dy, dz
+
+        mu = float(x @ z) / x.size
+        dx, dy, dz = direction(-x * z)
+        alpha_p, alpha_d = _step_to_boundary(x, dx), _step_to_boundary(z, dz)
+        centring = (float((x + alpha_p * dx) @ (z + alpha_d * dz)) / x.size / mu) ** 3
+        dx, dy, dz = direction(centring * mu - x * z - dx * dz)
+        alpha_p = min(1.0, 0.995 * _step_to_boundary(x, dx))
+        alpha_d = min(1.0, 0.995 * _step_to_boundary(z, dz))
+        x, y, z = x + alpha_p * dx, y + alpha_d * dy, z + alpha_d * dz
+        history.append(float(c @ x) * cost_scale * load_scale)
+
+    x = x * load_scale
+    return LayoutResult(
+        model=model,
+        areas=x[:num_members] / tension_limit + x[num_members:] / compression_limit,
+        forces=x[:num_members] - x[num_members:],
+        volume=float(costs @ x),
+        history=np.asarray(history),
+        converged=converged,
+    )
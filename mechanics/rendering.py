@@ -0,0 +1,122 @@
+"""Array preparation for batched drawing of trusses, frames and free bodies.
+
+Front-ends draw a structure as a handful of collections rather than one
+artist per member: all members as one line collection coloured by force, all
+loads or reactions as one arrow field. Labels are the exception, since text
+cannot be batched, so :func:`label_mask` keeps their number bounded
+whatever the model size (level of detail). Nothing here imports a plotting
+library; the desktop tool feeds the arrays to matplotlib and the web client
+can send them as JSON.
+"""
+from __future__ import annotations
+
+from typing import Any, Mapping, Sequence, Tuple
+
+import numpy as np
+
+# Largest number of labels drawn in one view.
+LABEL_BUDGET = 60
+COMPRESSION_COLOR = (1.0, 0.0, 0.0)
+TENSION_COLOR = (0.0, 0.0, 1.0)
+
+
+def structure_arrays(
+    nodos: Sequence[Mapping[str, Any]],
+    miembros: Sequence[Mapping[str, Any]],
+) -> Tuple[np.ndarray, np.ndarray, dict]:
+    """``(coordinates, members, index)`` of the dictionary model of the desktop tool.
+
+    ``coordinates`` is ``(nodes, 2)``, ``members`` the ``(members, 2)`` node
+    positions of each member's ends and ``index`` maps node ids to positions.
+    """
+
+    index = {nodo["id"]: i for i, nodo in enumerate(nodos)}
+    coordinates = np.array([(nodo["x"], nodo["y"]) for nodo in nodos], dtype=float).reshape(-1, 2)
+    members = np.array([(index[m["inicio"]], index[m["fin"]]) for m in miembros], dtype=int).reshape(-1, 2)
+    return coordinates, members, index
+
+
+def normalised_forces(forces: Any) -> np.ndarray:
+    """Forces divided by the largest magnitude, in ``[-1, 1]``; all zeros stay zero."""
+
+    forces = np.asarray(forces, dtype=float)
+    largest = float(np.max(np.abs(forces))) if forces.size else 0.0
+    return forces / largest if largest > 0 else np.zeros_like(forces)
+
+
+def force_colors(forces: Any) -> np.ndarray:
+    """``(members, 3)`` RGB colours from red (compression) through black to blue (tension).
+
+    The shade follows the force relative to the largest magnitude, so the
+    most loaded members stand out; unloaded members are black.
+    """
+
+    t = normalised_forces(forces)[:, None]
+    return np.where(t < 0, -t * np.asarray(COMPRESSION_COLOR), t * np.asarray(TENSION_COLOR))
+
+
+def hex_colors(rgb: Any) -> list:
+    """``'#rrggbb'`` strings for Tk canvases and web clients."""
+
+    levels = np.rint(np.clip(np.asarray(rgb, dtype=float).reshape(-1, 3), 0.0, 1.0) * 255).astype(int)
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in levels.tolist()]
+
+
+def arrow_field(origins: Any, vectors: Any, length: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``(origins, components, kept)`` of arrows of the given ``length`` along ``vectors``.
+
+    Zero vectors are dropped (``kept`` marks the rows left), so the result
+    can go straight to one ``quiver`` call with ``angles="xy",
+    scale_units="xy", scale=1``.
+    """
+
+    origins = np.asarray(origins, dtype=float).reshape(-1, 2)
+    vectors = np.asarray(vectors, dtype=float).reshape(-1, 2)
+    magnitude = np.linalg.norm(vectors, axis=1)
+    kept = magnitude > 0
+    return origins[kept], vectors[kept] * (length / magnitude[kept])[:, None], kept
+
+
+def section_cut_points(coordinates: Any, members: Any, offset: float, axis: int) -> np.ndarray:
+    """``(members, 2)`` points where each member crosses the line ``x[axis] = offset``.
+
+    A member lying along the line is cut at its mid-point.
+    """
+
+    ends = np.asarray(coordinates, dtype=float)[np.asarray(members, dtype=int)]
+    start, stop = ends[:, 0], ends[:, 1]
+    span = stop[:, axis] - start[:, axis]
+    flat = span == 0
+    t = np.where(flat, 0.5, (offset - start[:, axis]) / np.where(flat, 1.0, span))
+    points = start + t[:, None] * (stop - start)
+    points[~flat, axis] = offset
+    return points
+
+
+def label_mask(points: Any, limits: Sequence[float], *, max_labels: int = LABEL_BUDGET) -> np.ndarray:
+    """Which ``points`` to label in the view ``(xmin, xmax, ymin, ymax)``.
+
+    Every visible point is labelled while there are at most ``max_labels``;
+    beyond that the view is split into about ``max_labels`` cells and only
+    the first point of each cell keeps its label, so zooming out thins the
+    text and zooming in brings it back.
+    """
+
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    xmin, xmax = sorted(limits[:2])
+    ymin, ymax = sorted(limits[2:])
+    inside = np.flatnonzero(
+        (points[:, 0] >= xmin) & (points[:, 0] <= xmax) & (points[:, 1] >= ymin) & (points[:, 1] <= ymax)
+    )
+    mask = np.zeros(len(points), dtype=bool)
+    if inside.size <= max_labels:
+        mask[inside] = True
+        return mask
+
+    side = max(int(np.sqrt(max_labels)), 1)
+    visible = points[inside]
+    cell_x = np.clip(((visible[:, 0] - xmin) / max(xmax - xmin, 1e-300) * side).astype(int), 0, side - 1)
+    cell_y = np.clip(((visible[:, 1] - ymin) / max(ymax - ymin, 1e-300) * side).astype(int), 0, side - 1)
+    _, first = np.unique(cell_x * side + cell_y, return_index=True)
+    mask[inside[first]] = True
+    return mask
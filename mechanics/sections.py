@@ -0,0 +1,382 @@
+"""Catalog of standard steel and glulam sections with fast selection.
+
+Properties are computed once, vectorized, from the nominal dimensions of each
+profile and stored in SI units (m, m², m³, m⁴, kg/m, Pa). The catalog keeps
+its rows sorted by the strong-axis section modulus ``wy`` together with a
+suffix minimum of the mass, so the lightest profile meeting a modulus
+requirement is found with one binary search.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .stress import SectionProperties
+from .viga import BeamDiagrams
+
+STEEL_DENSITY = 7850.0  # kg/m³
+STEEL_E = 210e9  # Pa
+STEEL_FY = 275e6  # Pa, S275
+GLULAM_DENSITY = 420.0  # kg/m³, GL24h mean
+GLULAM_E = 11.5e9  # Pa, GL24h E0,mean
+GLULAM_FM = 24e6  # Pa, GL24h fm,k
+
+# name: (h, b, tw, tf, r) in mm.
+IPE_DIMENSIONS = {
+    "IPE 80": (80, 46, 3.8, 5.2, 5),
+    "IPE 100": (100, 55, 4.1, 5.7, 7),
+    "IPE 120": (120, 64, 4.4, 6.3, 7),
+    "IPE 140": (140, 73, 4.7, 6.9, 7),
+    "IPE 160": (160, 82, 5.0, 7.4, 9),
+    "IPE 180": (180, 91, 5.3, 8.0, 9),
+    "IPE 200": (200, 100, 5.6, 8.5, 12),
+    "IPE 220": (220, 110, 5.9, 9.2, 12),
+    "IPE 240": (240, 120, 6.2, 9.8, 15),
+    "IPE 270": (270, 135, 6.6, 10.2, 15),
+    "IPE 300": (300, 150, 7.1, 10.7, 15),
+    "IPE 330": (330, 160, 7.5, 11.5, 18),
+    "IPE 360": (360, 170, 8.0, 12.7, 18),
+    "IPE 400": (400, 180, 8.6, 13.5, 21),
+    "IPE 450": (450, 190, 9.4, 14.6, 21),
+    "IPE 500": (500, 200, 10.2, 16.0, 21),
+    "IPE 550": (550, 210, 11.1, 17.2, 24),
+    "IPE 600": (600, 220, 12.0, 19.0, 24),
+}
+
+HEA_DIMENSIONS = {
+    "HEA 100": (96, 100, 5.0, 8.0, 12),
+    "HEA 120": (114, 120, 5.0, 8.0, 12),
+    "HEA 140": (133, 140, 5.5, 8.5, 12),
+    "HEA 160": (152, 160, 6.0, 9.0, 15),
+    "HEA 180": (171, 180, 6.0, 9.5, 15),
+    "HEA 200": (190, 200, 6.5, 10.0, 18),
+    "HEA 220": (210, 220, 7.0, 11.0, 18),
+    "HEA 240": (230, 240, 7.5, 12.0, 21),
+    "HEA 260": (250, 260, 7.5, 12.5, 24),
+    "HEA 280": (270, 280, 8.0, 13.0, 24),
+    "HEA 300": (290, 300, 8.5, 14.0, 27),
+    "HEA 320": (310, 300, 9.0, 15.5, 27),
+    "HEA 340": (330, 300, 9.5, 16.5, 27),
+    "HEA 360": (350, 300, 10.0, 17.5, 27),
+    "HEA 400": (390, 300, 11.0, 19.0, 27),
+    "HEA 450": (440, 300, 11.5, 21.0, 27),
+    "HEA 500": (490, 300, 12.0, 23.0, 27),
+    "HEA 550": (540, 300, 12.5, 24.0, 27),
+    "HEA 600": (590, 300, 13.0, 25.0, 27),
+}
+
+# name: (d, bf, tw, tf) in inches; fillets are not modelled for W-shapes.
+W_DIMENSIONS = {
+    "W8x10": (7.89, 3.94, 0.170, 0.205),
+    "W8x18": (8.14, 5.25, 0.230, 0.330),
+    "W8x31": (8.00, 8.00, 0.285, 0.435),
+    "W10x12": (9.87, 3.96, 0.190, 0.210),
+    "W10x22": (10.2, 5.75, 0.240, 0.360),
+    "W10x33": (9.73, 7.96, 0.290, 0.435),
+    "W12x14": (11.9, 3.97, 0.200, 0.225),
+    "W12x26": (12.2, 6.49, 0.230, 0.380),
+    "W12x40": (11.9, 8.01, 0.295, 0.515),
+    "W14x22": (13.7, 5.00, 0.230, 0.335),
+    "W14x30": (13.8, 6.73, 0.270, 0.385),
+    "W14x48": (13.8, 8.03, 0.340, 0.595),
+    "W16x26": (15.7, 5.50, 0.250, 0.345),
+    "W16x40": (16.0, 7.00, 0.305, 0.505),
+    "W18x35": (17.7, 6.00, 0.300, 0.425),
+    "W18x50": (18.0, 7.50, 0.355, 0.570),
+    "W21x44": (20.7, 6.50, 0.350, 0.450),
+    "W21x62": (21.0, 8.24, 0.400, 0.615),
+    "W24x55": (23.6, 7.01, 0.395, 0.505),
+    "W24x76": (23.9, 8.99, 0.440, 0.680),
+    "W27x84": (26.7, 10.0, 0.460, 0.640),
+    "W30x99": (29.7, 10.5, 0.520, 0.670),
+    "W33x118": (32.9, 11.5, 0.550, 0.740),
+    "W36x135": (35.6, 12.0, 0.600, 0.790),
+}
+
+GLULAM_WIDTHS = (90, 115, 140, 165, 190, 215, 240)  # mm
+GLULAM_LAMELLA = 40  # mm
+GLULAM_MAX_HEIGHT = 2000  # mm
+
+_INCH = 25.4
+
+
+def _i_section_properties(h, b, tw, tf, r) -> Tuple[np.ndarray, ...]:
+    """Area and inertias of doubly symmetric I-sections, including root fillets."""
+
+    web = h - 2.0 * tf
+    fillet_area = (1.0 - math.pi / 4.0) * r**2
+    # Distance of the fillet centroid from the flange and web faces.
+    fillet_offset = r * (10.0 - 3.0 * math.pi) / (12.0 - 3.0 * math.pi)
+
+    area = 2.0 * b * tf + web * tw + 4.0 * fillet_area
+    iy = (b * h**3 - (b - tw) * web**3) / 12.0 + 4.0 * fillet_area * (web / 2.0 - fillet_offset) ** 2
+    iz = (2.0 * tf * b**3 + web * tw**3) / 12.0 + 4.0 * fillet_area * (tw / 2.0 + fillet_offset) ** 2
+    return area, iy, iz
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """One profile of a :class:`SectionCatalog`."""
+
+    name: str
+    family: str
+    height: float
+    width: float
+    area: float
+    mass: float
+    iy: float
+    wy: float
+    iz: float
+    wz: float
+    elastic_modulus: float
+    strength: float
+    web_thickness: float
+    flange_thickness: float
+
+    def section_properties(self) -> SectionProperties:
+        """Layered approximation of the profile for :mod:`mechanics.stress`.
+
+        I-sections become flange/web/flange rectangles (fillets ignored);
+        rectangular sections are a single layer.
+        """
+
+        if self.web_thickness >= self.width:
+            return SectionProperties.from_layers([(self.width, self.height)])
+        web = self.height - 2.0 * self.flange_thickness
+        return SectionProperties.from_layers(
+            [
+                (self.width, self.flange_thickness),
+                (self.web_thickness, web),
+                (self.width, self.flange_thickness),
+            ]
+        )
+
+
+_COLUMNS = (
+    "height",
+    "width",
+    "area",
+    "mass",
+    "iy",
+    "wy",
+    "iz",
+    "wz",
+    "elastic_modulus",
+    "strength",
+    "web_thickness",
+    "flange_thickness",
+)
+
+
+class SectionCatalog:
+    """Array-backed table of profiles sorted by strong-axis section modulus."""
+
+    def __init__(self, names: Sequence[str], families: Sequence[str], **columns: Iterable[float]) -> None:
+        missing = set(_COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f"Missing catalog columns: {sorted(missing)}")
+
+        data = {key: np.asarray(list(columns[key]), dtype=float) for key in _COLUMNS}
+        order = np.lexsort((data["mass"], data["wy"]))
+        self.names = np.asarray(names, dtype=object)[order]
+        self.families = np.asarray(families, dtype=object)[order]
+        for key in _COLUMNS:
+            setattr(self, key, data[key][order])
+
+        # _lightest_from[i] is the lightest row among i..n-1 (ties keep the
+        # smaller modulus); the extra slot marks "no candidate". The same
+        # suffix minimum over the rows sorted by moment capacity wy * strength
+        # serves requirements that mix materials.
+        self._lightest_from = _suffix_lightest(self.mass)
+        capacity = self.wy * self.strength
+        self._capacity_order = np.argsort(capacity, kind="stable")
+        self._capacity = capacity[self._capacity_order]
+        by_capacity = _suffix_lightest(self.mass[self._capacity_order])
+        self._lightest_by_capacity = np.where(by_capacity >= 0, self._capacity_order[by_capacity], -1)
+        self._positions = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._positions
+
+    def index_of(self, name: str) -> int:
+        try:
+            return self._positions[name]
+        except KeyError:
+            raise KeyError(f"Unknown section: {name!r}") from None
+
+    def entry(self, key: Union[int, str]) -> CatalogEntry:
+        i = self.index_of(key) if isinstance(key, str) else int(key)
+        return CatalogEntry(
+            name=str(self.names[i]),
+            family=str(self.families[i]),
+            **{column: float(getattr(self, column)[i]) for column in _COLUMNS},
+        )
+
+    def subset(self, families: Iterable[str]) -> "SectionCatalog":
+        """Return a new catalog restricted to the given families."""
+
+        mask = np.isin(self.families, list(families))
+        return SectionCatalog(
+            self.names[mask],
+            self.families[mask],
+            **{column: getattr(self, column)[mask] for column in _COLUMNS},
+        )
+
+    def select(
+        self, *, required_wy: float = 0.0, required_iy: float = 0.0, required_moment: float = 0.0
+    ) -> Optional[CatalogEntry]:
+        """Lightest profile with ``wy >= required_wy`` and ``iy >= required_iy``.
+
+        ``required_moment`` bounds the capacity ``wy * strength`` of each row
+        in its own material instead of the modulus. The modulus or capacity
+        bound is a binary search on a sorted table; the other bounds, when
+        given, are checked vectorized over the remaining rows.
+        """
+
+        if required_moment > 0.0:
+            start = int(np.searchsorted(self._capacity, required_moment, side="left"))
+            if required_iy <= 0.0 and required_wy <= 0.0:
+                best = int(self._lightest_by_capacity[start])
+                return self.entry(best) if best >= 0 else None
+            rows = self._capacity_order[start:]
+            rows = rows[(self.wy[rows] >= required_wy) & (self.iy[rows] >= required_iy)]
+        else:
+            start = int(np.searchsorted(self.wy, required_wy, side="left"))
+            if required_iy <= 0.0:
+                best = int(self._lightest_from[start])
+                return self.entry(best) if best >= 0 else None
+            rows = np.flatnonzero(self.iy[start:] >= required_iy) + start
+        if rows.size == 0:
+            return None
+        return self.entry(int(rows[np.argmin(self.mass[rows])]))
+
+    def select_many(self, required_wy: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+        """Row of the lightest profile per requirement, ``-1`` when none fits."""
+
+        starts = np.searchsorted(self.wy, np.asarray(required_wy, dtype=float), side="left")
+        return self._lightest_from[starts]
+
+
+def _suffix_lightest(mass: np.ndarray) -> np.ndarray:
+    # Position of the lightest entry among i..n-1 for every i, ties keeping
+    # the earlier one, and -1 in the extra slot n.
+    n = mass.size
+    lightest = np.empty(n + 1, dtype=np.intp)
+    lightest[n] = -1
+    best = -1
+    for i in range(n - 1, -1, -1):
+        if best < 0 or mass[i] <= mass[best]:
+            best = i
+        lightest[i] = best
+    return lightest
+
+
+def _steel_rows(
+    dimensions: Mapping[str, Tuple[float, ...]], family: str, scale: float = 1.0
+) -> Tuple[List[str], List[str], dict]:
+    names = list(dimensions)
+    dims = np.asarray([tuple(values) + (0.0,) * (5 - len(values)) for values in dimensions.values()], dtype=float)
+    h, b, tw, tf, r = (dims[:, k] * scale * 1e-3 for k in range(5))
+    area, iy, iz = _i_section_properties(h, b, tw, tf, r)
+    columns = {
+        "height": h,
+        "width": b,
+        "area": area,
+        "mass": area * STEEL_DENSITY,
+        "iy": iy,
+        "wy": iy / (h / 2.0),
+        "iz": iz,
+        "wz": iz / (b / 2.0),
+        "elastic_modulus": np.full(len(names), STEEL_E),
+        "strength": np.full(len(names), STEEL_FY),
+        "web_thickness": tw,
+        "flange_thickness": tf,
+    }
+    return names, [family] * len(names), columns
+
+
+def _glulam_rows() -> Tuple[List[str], List[str], dict]:
+    widths, heights = np.meshgrid(
+        np.asarray(GLULAM_WIDTHS, dtype=float),
+        np.arange(4 * GLULAM_LAMELLA, GLULAM_MAX_HEIGHT + 1, GLULAM_LAMELLA, dtype=float),
+    )
+    b = widths.ravel() * 1e-3
+    h = heights.ravel() * 1e-3
+    names = [f"GL24h {int(bw)}x{int(hh)}" for bw, hh in zip(widths.ravel(), heights.ravel())]
+    area = b * h
+    columns = {
+        "height": h,
+        "width": b,
+        "area": area,
+        "mass": area * GLULAM_DENSITY,
+        "iy": b * h**3 / 12.0,
+        "wy": b * h**2 / 6.0,
+        "iz": h * b**3 / 12.0,
+        "wz": h * b**2 / 6.0,
+        "elastic_modulus": np.full(len(names), GLULAM_E),
+        "strength": np.full(len(names), GLULAM_FM),
+        "web_thickness": b,
+        "flange_thickness": np.zeros(len(names)),
+    }
+    return names, ["GL24h"] * len(names), columns
+
+
+def build_standard_catalog() -> SectionCatalog:
+    """Catalog with the IPE, HEA, W and GL24h glulam families."""
+
+    parts = [
+        _steel_rows(IPE_DIMENSIONS, "IPE"),
+        _steel_rows(HEA_DIMENSIONS, "HEA"),
+        _steel_rows(W_DIMENSIONS, "W", scale=_INCH),
+        _glulam_rows(),
+    ]
+    names = [name for part in parts for name in part[0]]
+    families = [family for part in parts for family in part[1]]
+    columns = {column: np.concatenate([part[2][column] for part in parts]) for column in _COLUMNS}
+    return SectionCatalog(names, families, **columns)
+
+
+@lru_cache(maxsize=1)
+def standard_catalog() -> SectionCatalog:
+    """Shared instance of :func:`build_standard_catalog`."""
+
+    return build_standard_catalog()
+
+
+def max_abs_moment(result: Union[BeamDiagrams, Mapping[str, Any]]) -> float:
+    if isinstance(result, BeamDiagrams):
+        moment = result.moment
+    else:
+        moment = np.asarray(result["diagrams"]["moment"], dtype=float)
+    return float(np.max(np.abs(moment))) if len(moment) else 0.0
+
+
+def select_section(
+    result: Union[BeamDiagrams, Mapping[str, Any]],
+    catalog: Optional[SectionCatalog] = None,
+    *,
+    allowable_stress: Optional[float] = None,
+    required_iy: float = 0.0,
+) -> Optional[CatalogEntry]:
+    """Lightest profile whose bending capacity covers the beam's peak moment.
+
+    With ``allowable_stress`` the requirement is ``wy >= |M|max / stress`` for
+    every row. Without it each row is checked against its own material
+    strength, which mixes steel and timber fairly. Both are binary searches
+    on the catalog (see :meth:`SectionCatalog.select`).
+    """
+
+    catalog = catalog if catalog is not None else standard_catalog()
+    moment = max_abs_moment(result)
+    if allowable_stress is not None:
+        if allowable_stress <= 0:
+            raise ValueError("Allowable stress must be positive.")
+        return catalog.select(required_wy=moment / allowable_stress, required_iy=required_iy)
+    return catalog.select(required_moment=moment, required_iy=required_iy)
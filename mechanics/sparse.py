@@ -0,0 +1,622 @@
+"""Minimal sparse-matrix support for the structural solvers.
+
+SciPy is optional in this project, so assembly produces a small
+:class:`CSRMatrix` built with NumPy alone. When SciPy is installed the matrix
+converts to ``scipy.sparse.csr_matrix`` without copying the index arrays and
+:func:`factorize` uses SuperLU; otherwise systems are renumbered with reverse
+Cuthill–McKee and solved with a banded Cholesky (symmetric positive definite
+matrices) or a banded LU.
+
+The banded paths cost ``O(n k)`` memory and ``O(n k²)`` time for ``n``
+unknowns and half bandwidth ``k``. Renumbering keeps ``k`` bounded only for
+structures that are long in one direction, such as plane trusses and
+frames, which therefore scale almost linearly. For structures that extend
+in two or more directions, such as :func:`~mechanics.generators.space_grid`,
+``k`` grows like ``√n`` (``n^(2/3)`` for solid 3D lattices). Time then grows
+at least quadratically, so large models of that kind need SciPy's
+fill-reducing SuperLU or :func:`conjugate_gradient`.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    import scipy.sparse as _scipy_sparse
+
+    SCIPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _scipy_sparse = None
+    SCIPY_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class CSRMatrix:
+    """Compressed sparse row matrix with sorted, duplicate-free columns."""
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    shape: Tuple[int, int]
+
+    @classmethod
+    def from_coo(cls, rows, cols, values, shape: Tuple[int, int]) -> "CSRMatrix":
+        """Build the matrix from triplets, summing duplicated entries."""
+
+        rows = np.asarray(rows, dtype=np.intp).ravel()
+        cols = np.asarray(cols, dtype=np.intp).ravel()
+        values = np.asarray(values, dtype=float).ravel()
+        n_rows, n_cols = int(shape[0]), int(shape[1])
+
+        keys = rows * n_cols + cols
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        values = values[order]
+
+        if keys.size:
+            starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+            values = np.add.reduceat(values, starts)
+            keys = keys[starts]
+
+        unique_rows = keys // n_cols if n_cols else keys
+        indptr = np.zeros(n_rows + 1, dtype=np.intp)
+        np.cumsum(np.bincount(unique_rows, minlength=n_rows), out=indptr[1:])
+        return cls(
+            indptr=indptr,
+            indices=(keys - unique_rows * n_cols).astype(np.intp),
+            data=values,
+            shape=(n_rows, n_cols),
+        )
+
+    @property
+    def nnz(self) -> int:
+        return int(self.data.size)
+
+    def row_ids(self) -> np.ndarray:
+        """Row index of every stored entry."""
+
+        return np.repeat(np.arange(self.shape[0], dtype=np.intp), np.diff(self.indptr))
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Product with a vector or with a block of column vectors."""
+
+        x = np.asarray(x, dtype=float)
+        products = self.data.reshape((-1,) + (1,) * (x.ndim - 1)) * x[self.indices]
+        out = np.zeros((self.shape[0],) + x.shape[1:])
+        nonempty = self.indptr[:-1] < self.indptr[1:]
+        if products.size:
+            out[nonempty] = np.add.reduceat(products, self.indptr[:-1][nonempty], axis=0)
+        return out
+
+    __matmul__ = matvec
+
+    def transpose(self) -> "CSRMatrix":
+        return CSRMatrix.from_coo(self.indices, self.row_ids(), self.data, (self.shape[1], self.shape[0]))
+
+    @property
+    def T(self) -> "CSRMatrix":
+        return self.transpose()
+
+    def diagonal(self) -> np.ndarray:
+        diagonal = np.zeros(min(self.shape))
+        rows = self.row_ids()
+        on_diagonal = rows == self.indices
+        diagonal[rows[on_diagonal]] = self.data[on_diagonal]
+        return diagonal
+
+    def toarray(self) -> np.ndarray:
+        dense = np.zeros(self.shape)
+        dense[self.row_ids(), self.indices] = self.data
+        return dense
+
+    def to_scipy(self):
+        """Return the equivalent ``scipy.sparse.csr_matrix``."""
+
+        if _scipy_sparse is None:
+            raise RuntimeError("SciPy is not installed.")
+        return _scipy_sparse.csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+
+@dataclass(frozen=True)
+class CSRPattern:
+    """Sparsity pattern of a set of COO triplets, for refilling their values.
+
+    Matrices assembled many times from the same ``(rows, cols)`` with new
+    values, as in iterative redesign, pay the sort of
+    :meth:`CSRMatrix.from_coo` once; :meth:`fill` then sums the values into
+    their slots with a single ``bincount``.
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    slots: np.ndarray
+    shape: Tuple[int, int]
+
+    @classmethod
+    def from_coo(cls, rows, cols, shape: Tuple[int, int]) -> "CSRPattern":
+        rows = np.asarray(rows, dtype=np.intp).ravel()
+        cols = np.asarray(cols, dtype=np.intp).ravel()
+        n_rows, n_cols = int(shape[0]), int(shape[1])
+        keys, slots = np.unique(rows * n_cols + cols, return_inverse=True)
+        unique_rows = keys // n_cols if n_cols else keys
+        indptr = np.zeros(n_rows + 1, dtype=np.intp)
+        np.cumsum(np.bincount(unique_rows, minlength=n_rows), out=indptr[1:])
+        return cls(
+            indptr=indptr,
+            indices=(keys - unique_rows * n_cols).astype(np.intp),
+            slots=slots.ravel().astype(np.intp),
+            shape=(n_rows, n_cols),
+        )
+
+    def fill(self, values) -> CSRMatrix:
+        """The matrix with ``values``, one per triplet, duplicates summed."""
+
+        data = np.bincount(self.slots, weights=np.asarray(values, dtype=float).ravel(), minlength=self.indices.size)
+        return CSRMatrix(indptr=self.indptr, indices=self.indices, data=data, shape=self.shape)
+
+
+# Systems up to this size are solved with LAPACK on a dense copy; above it the
+# banded or SciPy sparse factorizations pay off.
+DENSE_SOLVE_LIMIT = 256
+
+
+class SingularMatrixError(np.linalg.LinAlgError):
+    """Raised when a factorization meets a zero pivot."""
+
+
+def _symmetric_pattern(matrix: CSRMatrix) -> CSRMatrix:
+    rows = np.concatenate((matrix.row_ids(), matrix.indices))
+    cols = np.concatenate((matrix.indices, matrix.row_ids()))
+    off_diagonal = rows != cols
+    n = max(matrix.shape)
+    return CSRMatrix.from_coo(rows[off_diagonal], cols[off_diagonal], np.ones(off_diagonal.sum()), (n, n))
+
+
+def reverse_cuthill_mckee(matrix: CSRMatrix) -> np.ndarray:
+    """Bandwidth-reducing ordering of the (symmetrised) sparsity pattern.
+
+    Returns ``perm`` such that ``A[perm][:, perm]`` has a narrow band.
+    """
+
+    pattern = _symmetric_pattern(matrix)
+    if SCIPY_AVAILABLE:
+        from scipy.sparse.csgraph import reverse_cuthill_mckee as _rcm
+
+        return np.asarray(_rcm(pattern.to_scipy(), symmetric_mode=True), dtype=np.intp)
+
+    n = pattern.shape[0]
+    degree = np.diff(pattern.indptr)
+    visited = np.zeros(n, dtype=bool)
+    order: list = []
+    # Each connected component starts from its lowest-degree node.
+    for start in np.argsort(degree, kind="stable"):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = [int(start)]
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            neighbours = pattern.indices[pattern.indptr[node]:pattern.indptr[node + 1]]
+            neighbours = neighbours[~visited[neighbours]]
+            if neighbours.size:
+                neighbours = neighbours[np.argsort(degree[neighbours], kind="stable")]
+                visited[neighbours] = True
+                queue.extend(neighbours.tolist())
+        order.extend(queue)
+    return np.asarray(order[::-1], dtype=np.intp)
+
+
+def _is_structurally_symmetric(matrix: CSRMatrix) -> bool:
+    if matrix.shape[0] != matrix.shape[1]:
+        return False
+    keys = np.sort(matrix.row_ids() * matrix.shape[1] + matrix.indices)
+    transposed = np.sort(matrix.indices * matrix.shape[1] + matrix.row_ids())
+    return bool(np.array_equal(keys, transposed))
+
+
+def _is_symmetric(matrix: CSRMatrix, rtol: float = 1e-12) -> bool:
+    if not _is_structurally_symmetric(matrix):
+        return False
+    n = matrix.shape[1]
+    rows = matrix.row_ids()
+    order = np.argsort(rows * n + matrix.indices)
+    transposed = np.argsort(matrix.indices * n + rows)
+    scale = float(np.abs(matrix.data).max()) if matrix.nnz else 0.0
+    return bool(np.allclose(matrix.data[order], matrix.data[transposed], rtol=rtol, atol=rtol * scale))
+
+
+def gram(matrix: CSRMatrix) -> CSRMatrix:
+    """Return ``A^T A``, pairing the entries that share a row of ``A``."""
+
+    counts = np.diff(matrix.indptr)
+    entry_rows = matrix.row_ids()
+    repeats = counts[entry_rows]
+    left = np.repeat(np.arange(matrix.nnz), repeats)
+    group_start = np.repeat(np.cumsum(repeats) - repeats, repeats)
+    right = np.repeat(matrix.indptr[entry_rows], repeats) + np.arange(left.size) - group_start
+    n = matrix.shape[1]
+    return CSRMatrix.from_coo(
+        matrix.indices[left], matrix.indices[right], matrix.data[left] * matrix.data[right], (n, n)
+    )
+
+
+def row_column_ordering(matrix: CSRMatrix) -> Tuple[np.ndarray, np.ndarray]:
+    """Bandwidth-reducing row and column orderings for unsymmetric matrices.
+
+    Rows are ordered by reverse Cuthill–McKee on the pattern of ``A A^T``
+    (two rows are neighbours when they share a column) and every column is
+    placed at the mean position of its rows. This suits equilibrium matrices,
+    whose rows and columns are different entities (node directions and member
+    forces), where a symmetric renumbering does not narrow the band.
+    """
+
+    columns = matrix.transpose()
+    counts = np.diff(columns.indptr)
+    n = matrix.shape[0]
+    row_perm = reverse_cuthill_mckee(gram(columns))
+
+    rank = np.empty(n)
+    rank[row_perm] = np.arange(n)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        position = np.bincount(
+            columns.row_ids(), weights=rank[columns.indices], minlength=matrix.shape[1]
+        ) / counts
+    position[counts == 0] = np.inf
+    return row_perm, np.argsort(position, kind="stable")
+
+
+def bandwidth(matrix: CSRMatrix) -> Tuple[int, int]:
+    """Lower and upper bandwidth of ``matrix``."""
+
+    if matrix.nnz == 0:
+        return 0, 0
+    offsets = matrix.row_ids() - matrix.indices
+    return int(max(offsets.max(), 0)), int(max(-offsets.min(), 0))
+
+
+def permute(matrix: CSRMatrix, row_perm: np.ndarray, col_perm: np.ndarray) -> CSRMatrix:
+    """Return ``matrix[row_perm][:, col_perm]``."""
+
+    row_inverse = np.empty_like(row_perm)
+    row_inverse[row_perm] = np.arange(row_perm.size)
+    col_inverse = np.empty_like(col_perm)
+    col_inverse[col_perm] = np.arange(col_perm.size)
+    return CSRMatrix.from_coo(
+        row_inverse[matrix.row_ids()], col_inverse[matrix.indices], matrix.data, matrix.shape
+    )
+
+
+class BandedLU:
+    """LU factorization with partial pivoting of a banded square matrix.
+
+    Elimination runs over a sliding dense window of ``kl + 1`` rows by
+    ``kl + ku + 1`` columns, so memory and time are ``O(n (kl + ku))`` and
+    ``O(n kl (kl + ku))``. Row interchanges are recorded as in LAPACK's
+    ``gbtrf``: at step ``j`` rows ``j`` and ``pivots[j]`` were swapped.
+    """
+
+    def __init__(self, matrix: CSRMatrix) -> None:
+        n = matrix.shape[0]
+        if matrix.shape[1] != n:
+            raise ValueError("Only square matrices can be factorized.")
+        kl, ku = bandwidth(matrix)
+        width = kl + ku + 1
+        rows = matrix.row_ids()
+        band = np.zeros((n, width))
+        band[rows, matrix.indices - rows + kl] = matrix.data
+
+        scale = float(np.abs(matrix.data).max()) if matrix.nnz else 0.0
+        tol = scale * np.finfo(float).eps * width
+
+        upper = np.zeros((n, width))
+        lower = np.zeros((n, kl))
+        pivots = np.arange(n)
+        window = np.zeros((kl + 1, width))
+        for r in range(min(kl, n)):
+            window[r, : width - kl + r] = band[r, kl - r:]
+
+        for j in range(n):
+            if j + kl < n:
+                window[kl] = band[j + kl]
+            active = min(kl + 1, n - j)
+            p = int(np.argmax(np.abs(window[:active, 0])))
+            if abs(window[p, 0]) <= tol:
+                raise SingularMatrixError(f"Zero pivot at position {j}.")
+            if p:
+                window[[0, p]] = window[[p, 0]]
+                pivots[j] = j + p
+            multipliers = window[1:active, 0] / window[0, 0]
+            window[1:active] -= np.multiply.outer(multipliers, window[0])
+            upper[j] = window[0]
+            lower[j, : active - 1] = multipliers
+
+            window[:-1, :-1] = window[1:, 1:]
+            window[:, -1] = 0.0
+            window[-1] = 0.0
+
+        self.n = n
+        self.kl = kl
+        self.ku = ku
+        self._upper = upper
+        self._lower = lower
+        self._pivots = pivots
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        """Solve for a right-hand side vector or an ``(n, k)`` block."""
+
+        x = np.array(b, dtype=float)
+        n, kl = self.n, self.kl
+        width = self._upper.shape[1]
+        for j in range(n):
+            p = self._pivots[j]
+            if p != j:
+                x[[j, p]] = x[[p, j]]
+            m = min(kl, n - j - 1)
+            if m:
+                x[j + 1:j + 1 + m] -= np.multiply.outer(self._lower[j, :m], x[j])
+        for j in range(n - 1, -1, -1):
+            m = min(width - 1, n - j - 1)
+            x[j] = (x[j] - self._upper[j, 1:1 + m] @ x[j + 1:j + 1 + m]) / self._upper[j, 0]
+        return x
+
+
+class BandedCholesky:
+    """Blocked Cholesky factorization of a symmetric positive definite band matrix.
+
+    Columns are eliminated ``block`` at a time over a dense window of
+    ``block + k`` rows and columns (``k`` the half bandwidth), so each step is
+    a handful of matrix products and the Python loop runs ``n / block`` times
+    instead of ``n``. The inverse of every diagonal factor is kept, which
+    turns both substitutions into matrix products as well.
+    """
+
+    def __init__(self, matrix: CSRMatrix, *, block: Optional[int] = None) -> None:
+        n = matrix.shape[0]
+        if matrix.shape[1] != n:
+            raise ValueError("Only square matrices can be factorized.")
+        k = max(bandwidth(matrix))
+        block = block or max(k, 32)
+        rows = matrix.row_ids()
+        band = np.zeros((n, 2 * k + 1))
+        band[rows, matrix.indices - rows + k] = matrix.data
+        scale = float(np.abs(matrix.data).max()) if matrix.nnz else 0.0
+        tol = scale * np.finfo(float).eps * (2 * k + 1)
+
+        def dense(start: int, stop: int) -> np.ndarray:
+            span = np.arange(start, stop)
+            offsets = span[None, :] - span[:, None] + k
+            inside = (offsets >= 0) & (offsets <= 2 * k)
+            return np.where(inside, band[span[:, None], np.clip(offsets, 0, 2 * k)], 0.0)
+
+        self._starts = list(range(0, n, block))
+        self._inverse = []
+        self._coupling = []
+        window = dense(0, min(block + k, n))
+        for start in self._starts:
+            size = min(block, n - start)
+            stop = min(start + size + k, n)
+            try:
+                factor = np.linalg.cholesky(window[:size, :size])
+            except np.linalg.LinAlgError:
+                raise SingularMatrixError(f"Matrix is not positive definite near position {start}.") from None
+            pivots = np.diagonal(factor) ** 2
+            if pivots.min() <= tol:
+                raise SingularMatrixError(f"Zero pivot at position {start + int(np.argmin(pivots))}.")
+            inverse = np.linalg.inv(factor)
+            coupling = window[size:, :size] @ inverse.T
+            self._inverse.append(inverse)
+            self._coupling.append(coupling)
+
+            # The next window keeps the updated trailing block and appends the
+            # untouched rows and columns that enter the band.
+            following = min(stop + block, n)
+            updated = window[size:, size:] - coupling @ coupling.T
+            window = dense(start + size, following)
+            window[: updated.shape[0], : updated.shape[1]] = updated
+        self.n = n
+        self.k = k
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        """Solve for a right-hand side vector or an ``(n, k)`` block."""
+
+        x = np.array(b, dtype=float)
+        blocks = list(zip(self._starts, self._inverse, self._coupling))
+        for start, inverse, coupling in blocks:
+            size = inverse.shape[0]
+            x[start:start + size] = inverse @ x[start:start + size]
+            x[start + size:start + size + coupling.shape[0]] -= coupling @ x[start:start + size]
+        for start, inverse, coupling in reversed(blocks):
+            size = inverse.shape[0]
+            rest = x[start + size:start + size + coupling.shape[0]]
+            x[start:start + size] = inverse.T @ (x[start:start + size] - coupling.T @ rest)
+        return x
+
+
+def singular_pivots(matrix: CSRMatrix, *, rtol: float = 1e-9) -> np.ndarray:
+    """Positions whose pivots vanish in the symmetric elimination of a PSD matrix.
+
+    Elimination follows the given order without pivoting, over a sliding
+    window as in :class:`BandedLU`, so renumber with
+    :func:`reverse_cuthill_mckee` first. A pivot below ``rtol`` times its
+    original diagonal means that row is a combination of the earlier ones; it
+    is recorded and skipped. The positions returned number ``n - rank``.
+    """
+
+    n = matrix.shape[0]
+    k = max(bandwidth(matrix))
+    rows = matrix.row_ids()
+    band = np.zeros((n, 2 * k + 1))
+    band[rows, matrix.indices - rows + k] = matrix.data
+    diagonal = matrix.diagonal()
+
+    window = np.zeros((k + 1, k + 1))
+    for r in range(min(k, n)):
+        window[r, :k] = band[r, k - r:2 * k - r]
+
+    dependent = []
+    for j in range(n):
+        if j + k < n:
+            window[k] = band[j + k, :k + 1]
+            window[:, k] = band[j + k, :k + 1]
+        pivot = window[0, 0]
+        if pivot <= rtol * diagonal[j]:
+            dependent.append(j)
+        else:
+            column = window[1:, 0]
+            window[1:, 1:] -= np.multiply.outer(column, column) / pivot
+
+        window[:-1, :-1] = window[1:, 1:]
+        window[-1] = 0.0
+        window[:, -1] = 0.0
+    return np.asarray(dependent, dtype=np.intp)
+
+
+class _DenseLU:
+    # One LU solve at construction reports singular matrices at
+    # factorization time, like the other methods.
+    def __init__(self, matrix: CSRMatrix) -> None:
+        self._dense = matrix.toarray()
+        try:
+            np.linalg.solve(self._dense, np.zeros(self._dense.shape[0]))
+        except np.linalg.LinAlgError as exc:
+            raise SingularMatrixError(str(exc)) from exc
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        return np.linalg.solve(self._dense, np.asarray(b, dtype=float))
+
+
+class _SciPyLU:
+    def __init__(self, matrix: CSRMatrix) -> None:
+        from scipy.sparse.linalg import splu
+
+        try:
+            self._lu = splu(matrix.to_scipy().tocsc())
+        except RuntimeError as exc:
+            raise SingularMatrixError(str(exc)) from exc
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        return self._lu.solve(np.asarray(b, dtype=float))
+
+
+class _PermutedSolver:
+    """Solve ``A x = b`` through a factorization of ``A[row_perm][:, col_perm]``."""
+
+    def __init__(self, inner, row_perm: np.ndarray, col_perm: np.ndarray) -> None:
+        self._inner = inner
+        self._row_perm = row_perm
+        self._col_perm = col_perm
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        b = np.asarray(b, dtype=float)
+        y = self._inner.solve(b[self._row_perm])
+        x = np.empty_like(y)
+        x[self._col_perm] = y
+        return x
+
+
+def factorize(matrix: CSRMatrix, *, method: str = "auto", ordering: Optional[np.ndarray] = None):
+    """Factorize a square sparse matrix once for repeated solves.
+
+    ``method`` is ``"dense"`` (LAPACK), ``"banded"`` (reverse Cuthill–McKee
+    renumbering, or :func:`row_column_ordering` for unsymmetric patterns,
+    followed by :class:`BandedLU`), ``"cholesky"`` (reverse Cuthill–McKee and
+    :class:`BandedCholesky`, for symmetric positive definite matrices),
+    ``"splu"`` (SciPy's SuperLU) or ``"auto"``, which picks dense for small
+    systems, then SuperLU when SciPy is installed and the banded paths
+    otherwise, trying Cholesky first on symmetric matrices. ``ordering``
+    replaces reverse Cuthill–McKee as the symmetric renumbering of the banded
+    paths, so matrices sharing one pattern are ordered only once. The
+    returned object has a ``solve(b)`` method accepting vectors or
+    ``(n, k)`` blocks.
+    """
+
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Only square matrices can be factorized.")
+    if method == "auto":
+        if matrix.shape[0] <= DENSE_SOLVE_LIMIT:
+            method = "dense"
+        elif SCIPY_AVAILABLE:
+            method = "splu"
+        elif _is_symmetric(matrix):
+            try:
+                return factorize(matrix, method="cholesky", ordering=ordering)
+            except SingularMatrixError:
+                method = "banded"
+        else:
+            method = "banded"
+
+    if method == "dense":
+        return _DenseLU(matrix)
+    if method == "splu":
+        return _SciPyLU(matrix)
+    if method == "cholesky":
+        perm = reverse_cuthill_mckee(matrix) if ordering is None else ordering
+        return _PermutedSolver(BandedCholesky(permute(matrix, perm, perm)), perm, perm)
+    if method == "banded":
+        if ordering is not None:
+            row_perm = col_perm = ordering
+        elif _is_structurally_symmetric(matrix):
+            row_perm = col_perm = reverse_cuthill_mckee(matrix)
+        else:
+            row_perm, col_perm = row_column_ordering(matrix)
+        return _PermutedSolver(BandedLU(permute(matrix, row_perm, col_perm)), row_perm, col_perm)
+    raise ValueError(f"Unknown factorization method: {method!r}")
+
+
+def conjugate_gradient(
+    matrix: CSRMatrix,
+    b: np.ndarray,
+    *,
+    x0: Optional[np.ndarray] = None,
+    tol: float = 1e-10,
+    maxiter: Optional[int] = None,
+) -> np.ndarray:
+    """Jacobi-preconditioned conjugate gradient for symmetric positive definite systems.
+
+    ``x0`` warm-starts the iteration; convergence is declared when the
+    residual norm drops below ``tol`` times the norm of ``b``.
+    """
+
+    b = np.asarray(b, dtype=float)
+    diagonal = matrix.diagonal()
+    if np.any(diagonal <= 0):
+        raise SingularMatrixError("Conjugate gradient needs a positive diagonal.")
+    inverse_diagonal = 1.0 / diagonal
+
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    r = b - matrix.matvec(x)
+    z = inverse_diagonal * r
+    p = z.copy()
+    rz = float(r @ z)
+    target = tol * max(float(np.linalg.norm(b)), np.finfo(float).tiny)
+    for _ in range(maxiter or 10 * b.size):
+        if np.linalg.norm(r) <= target:
+            return x
+        q = matrix.matvec(p)
+        alpha = rz / float(p @ q)
+        x += alpha * p
+        r -= alpha * q
+        z = inverse_diagonal * r
+        rz_next = float(r @ z)
+        p = z + (rz_next / rz) * p
+        rz = rz_next
+    if np.linalg.norm(r) <= target:
+        return x
+    raise np.linalg.LinAlgError("Conjugate gradient did not converge.")
+
+
+def submatrix(matrix: CSRMatrix, rows: np.ndarray, cols: np.ndarray) -> CSRMatrix:
+    """Return ``matrix[rows][:, cols]`` for index arrays ``rows`` and ``cols``."""
+
+    row_map = np.full(matrix.shape[0], -1, dtype=np.intp)
+    row_map[rows] = np.arange(len(rows))
+    col_map = np.full(matrix.shape[1], -1, dtype=np.intp)
+    col_map[cols] = np.arange(len(cols))
+    new_rows = row_map[matrix.row_ids()]
+    new_cols = col_map[matrix.indices]
+    keep = (new_rows >= 0) & (new_cols >= 0)
+    return CSRMatrix.from_coo(new_rows[keep], new_cols[keep], matrix.data[keep], (len(rows), len(cols)))
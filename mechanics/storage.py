@@ -0,0 +1,238 @@
+"""Memory-mapped storage for large batches of beam diagrams.
+
+Each diagram field is written into its own ``.npy`` file through
+:func:`numpy.lib.format.open_memmap`, so rows go straight from the solver to
+disk without passing through Python lists or JSON. A small ``index.json``
+records the shapes, the number of valid rows and a label per row; readers use
+:func:`open_results` to get zero-copy views of the arrays.
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from .viga import BeamDiagrams
+
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+DIAGRAM_FIELDS = ("positions", "shear", "moment", "torsor")
+REACTION_KEYS = ("A", "B", "C")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class ResultStorageError(ValueError):
+    """Raised when a result does not fit the layout of a sink or index."""
+
+
+def _diagram_rows(result: Union[BeamDiagrams, Mapping[str, Any]]) -> Dict[str, np.ndarray]:
+    """Extract the diagram arrays from either result flavour."""
+
+    if isinstance(result, BeamDiagrams):
+        rows = {name: getattr(result, name) for name in DIAGRAM_FIELDS}
+        reactions = result.reactions
+    else:
+        diagrams = result["diagrams"]
+        rows = {
+            "positions": diagrams["positions"],
+            "shear": diagrams["shear"],
+            "moment": diagrams["moment"],
+            "torsor": result["torsor"]["values"],
+        }
+        reactions = {
+            key: info["vertical"] if isinstance(info, Mapping) else info
+            for key, info in result["reactions"].items()
+        }
+    rows["reactions"] = [reactions.get(key, 0.0) for key in REACTION_KEYS]
+    return rows
+
+
+class MemmapResultSink:
+    """Append-only sink that writes beam diagrams into ``.npy`` memmaps.
+
+    The files are preallocated for ``capacity`` rows of ``num_points`` samples,
+    so resident memory stays flat regardless of how many beams are stored.
+    Use it as a context manager or call :meth:`close` to write the index.
+    """
+
+    def __init__(
+        self,
+        directory: PathLike,
+        *,
+        capacity: int,
+        num_points: int,
+        dtype: Union[str, np.dtype] = "float64",
+    ) -> None:
+        if capacity <= 0:
+            raise ResultStorageError("Sink capacity must be positive.")
+        if num_points < 2:
+            raise ResultStorageError("Diagrams need at least two points.")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.capacity = int(capacity)
+        self.num_points = int(num_points)
+        self.dtype = np.dtype(dtype)
+
+        self._arrays: Dict[str, np.memmap] = {}
+        for name in DIAGRAM_FIELDS:
+            self._arrays[name] = open_memmap(
+                self.directory / f"{name}.npy",
+                mode="w+",
+                dtype=self.dtype,
+                shape=(self.capacity, self.num_points),
+            )
+        self._arrays["reactions"] = open_memmap(
+            self.directory / "reactions.npy",
+            mode="w+",
+            dtype=self.dtype,
+            shape=(self.capacity, len(REACTION_KEYS)),
+        )
+        self._records: List[Dict[str, Any]] = []
+        self._closed = False
+
+    @property
+    def count(self) -> int:
+        return len(self._records)
+
+    def arrays(self) -> Dict[str, np.memmap]:
+        """Return the writable memmaps backing the sink."""
+
+        return dict(self._arrays)
+
+    def reserve(self, count: int, *, labels: Optional[List[str]] = None) -> int:
+        """Claim ``count`` consecutive rows and return the first one.
+
+        Used by writers that fill rows directly through the memmaps, such as
+        the parallel batch runner.
+        """
+
+        if self._closed:
+            raise ResultStorageError("The sink has already been closed.")
+        start = self.count
+        if start + count > self.capacity:
+            raise ResultStorageError(f"Sink is full ({self.capacity} rows).")
+        if labels is not None and len(labels) != count:
+            raise ResultStorageError("One label per reserved row is required.")
+        for offset in range(count):
+            label = labels[offset] if labels is not None else ""
+            self._records.append({"row": start + offset, "label": label})
+        return start
+
+    def append(
+        self,
+        result: Union[BeamDiagrams, Mapping[str, Any]],
+        *,
+        label: str = "",
+        metadata: Optional[Mapping[str, Any]] = None,
+    ) -> int:
+        """Store one result and return the row it was written to."""
+
+        if self._closed:
+            raise ResultStorageError("The sink has already been closed.")
+        row = self.count
+        if row >= self.capacity:
+            raise ResultStorageError(f"Sink is full ({self.capacity} rows).")
+
+        for name, values in _diagram_rows(result).items():
+            target = self._arrays[name]
+            values = np.asarray(values, dtype=self.dtype)
+            if values.shape != target.shape[1:]:
+                raise ResultStorageError(
+                    f"Field '{name}' has shape {values.shape}, expected {target.shape[1:]}."
+                )
+            target[row] = values
+
+        record: Dict[str, Any] = {"row": row, "label": label}
+        if metadata:
+            record["metadata"] = dict(metadata)
+        self._records.append(record)
+        return row
+
+    def flush(self) -> None:
+        """Flush the memmaps and rewrite the JSON index."""
+
+        for array in self._arrays.values():
+            array.flush()
+
+        index = {
+            "version": INDEX_VERSION,
+            "count": self.count,
+            "capacity": self.capacity,
+            "num_points": self.num_points,
+            "dtype": self.dtype.str,
+            "fields": {
+                name: {"file": f"{name}.npy", "shape": list(array.shape)}
+                for name, array in self._arrays.items()
+            },
+            "reaction_keys": list(REACTION_KEYS),
+            "records": self._records,
+        }
+        tmp_path = self.directory / f"{INDEX_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(index, handle)
+        os.replace(tmp_path, self.directory / INDEX_FILE)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._arrays.clear()
+        self._closed = True
+
+    def __enter__(self) -> "MemmapResultSink":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+@dataclass(frozen=True)
+class StoredResults:
+    """Read-only view over a directory written by :class:`MemmapResultSink`."""
+
+    directory: Path
+    count: int
+    positions: np.ndarray
+    shear: np.ndarray
+    moment: np.ndarray
+    torsor: np.ndarray
+    reactions: np.ndarray
+    records: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def reaction(self, key: str) -> np.ndarray:
+        """Return the column of vertical reactions for support ``key``."""
+
+        return self.reactions[:, REACTION_KEYS.index(key)]
+
+
+def open_results(directory: PathLike, *, mmap_mode: str = "r") -> StoredResults:
+    """Open a result directory without loading the arrays into memory."""
+
+    directory = Path(directory)
+    with open(directory / INDEX_FILE, encoding="utf-8") as handle:
+        index = json.load(handle)
+    if index.get("version") != INDEX_VERSION:
+        raise ResultStorageError(f"Unsupported index version: {index.get('version')!r}")
+
+    count = int(index["count"])
+    arrays = {
+        name: np.load(directory / info["file"], mmap_mode=mmap_mode)[:count]
+        for name, info in index["fields"].items()
+    }
+    return StoredResults(
+        directory=directory,
+        count=count,
+        records=index.get("records", []),
+        **arrays,
+    )
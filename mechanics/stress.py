@@ -0,0 +1,183 @@
+"""Normal and shear stress fields from beam diagrams and section properties.
+
+Sections are described as stacks of centred rectangles ("layers"), which
+covers the three-part I/T sections of the desktop tool as well as plain
+rectangles. Stresses follow the beam convention used by
+:func:`~mechanics.viga.compute_beam_analysis`: a positive moment is sagging,
+so it compresses the fibres above the centroid.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .viga import BeamComputationError, BeamDiagrams
+
+
+@dataclass(frozen=True)
+class SectionProperties:
+    """Geometric properties of a section built from stacked rectangles.
+
+    ``bottoms``, ``tops`` and ``widths`` describe each layer, measured from
+    the bottom fibre of the section.
+    """
+
+    bottoms: np.ndarray
+    tops: np.ndarray
+    widths: np.ndarray
+    area: float
+    centroid: float
+    inertia: float
+
+    @classmethod
+    def from_layers(cls, layers: Sequence[Tuple[float, float]]) -> "SectionProperties":
+        """Build the section from ``(width, height)`` pairs listed bottom to top."""
+
+        if not layers:
+            raise BeamComputationError("A section needs at least one layer.")
+        widths = np.asarray([float(w) for w, _ in layers])
+        heights = np.asarray([float(h) for _, h in layers])
+        if np.any(widths <= 0) or np.any(heights <= 0):
+            raise BeamComputationError("Section layers must have positive width and height.")
+
+        tops = np.cumsum(heights)
+        bottoms = tops - heights
+        areas = widths * heights
+        area = float(areas.sum())
+        centroid = float(np.sum(areas * (bottoms + heights / 2.0)) / area)
+        inertia = float(
+            np.sum(widths * heights**3 / 12.0 + areas * (bottoms + heights / 2.0 - centroid) ** 2)
+        )
+        return cls(
+            bottoms=bottoms,
+            tops=tops,
+            widths=widths,
+            area=area,
+            centroid=centroid,
+            inertia=inertia,
+        )
+
+    @property
+    def height(self) -> float:
+        return float(self.tops[-1])
+
+    @property
+    def section_modulus(self) -> float:
+        """Elastic section modulus for the extreme fibre."""
+
+        return self.inertia / max(self.centroid, self.height - self.centroid)
+
+    def width_at(self, y: Union[float, np.ndarray]) -> np.ndarray:
+        """Width of the section at height ``y`` (zero outside the section)."""
+
+        y = np.asarray(y, dtype=float)
+        layer = np.searchsorted(self.tops, y, side="right")
+        # The top fibre belongs to the last layer.
+        layer = np.where(y == self.tops[-1], len(self.tops) - 1, layer)
+        inside = (y >= 0.0) & (layer < len(self.tops))
+        return np.where(inside, self.widths[np.minimum(layer, len(self.widths) - 1)], 0.0)
+
+    def first_moment(self, y: Union[float, np.ndarray]) -> np.ndarray:
+        """First moment Q of the area above height ``y`` about the centroid."""
+
+        y = np.asarray(y, dtype=float)
+        lower = np.clip(y[..., None], self.bottoms, self.tops)
+        arms = (self.tops - self.centroid) ** 2 - (lower - self.centroid) ** 2
+        return np.sum(self.widths * arms / 2.0, axis=-1)
+
+
+def rectangular_section(width: float, height: float) -> SectionProperties:
+    return SectionProperties.from_layers([(width, height)])
+
+
+def composite_section(
+    top_width: float,
+    top_height: float,
+    web_width: float,
+    web_height: float,
+    bottom_width: float,
+    bottom_height: float,
+) -> SectionProperties:
+    """Three-part section laid out as in the desktop ``calcular_propiedades_seccion``."""
+
+    return SectionProperties.from_layers(
+        [(bottom_width, bottom_height), (web_width, web_height), (top_width, top_height)]
+    )
+
+
+@dataclass(frozen=True)
+class StressPeak:
+    """Largest absolute stress of a field and where it occurs."""
+
+    value: float
+    x: float
+    y: float
+
+
+@dataclass(frozen=True)
+class StressField:
+    """Stresses sampled on the ``x`` (along the beam) by ``y`` (height) grid."""
+
+    x: np.ndarray
+    y: np.ndarray
+    normal: np.ndarray
+    shear: np.ndarray
+
+    def _peak(self, values: np.ndarray) -> StressPeak:
+        i, j = np.unravel_index(np.argmax(np.abs(values)), values.shape)
+        return StressPeak(value=float(values[i, j]), x=float(self.x[i]), y=float(self.y[j]))
+
+    @property
+    def max_normal(self) -> StressPeak:
+        return self._peak(self.normal)
+
+    @property
+    def max_shear(self) -> StressPeak:
+        return self._peak(self.shear)
+
+
+def _diagram_arrays(
+    diagrams: Union[BeamDiagrams, Mapping[str, Any]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if isinstance(diagrams, BeamDiagrams):
+        return diagrams.positions, diagrams.shear, diagrams.moment
+    data = diagrams["diagrams"]
+    return (
+        np.asarray(data["positions"], dtype=float),
+        np.asarray(data["shear"], dtype=float),
+        np.asarray(data["moment"], dtype=float),
+    )
+
+
+def compute_stress_field(
+    diagrams: Union[BeamDiagrams, Mapping[str, Any]],
+    section: SectionProperties,
+    *,
+    num_y: int = 200,
+    y: Optional[Sequence[float]] = None,
+) -> StressField:
+    """Evaluate bending and shear stresses over the beam.
+
+    ``diagrams`` is either the output of
+    :func:`~mechanics.viga.compute_beam_diagrams` or the dictionary returned by
+    :func:`~mechanics.viga.compute_beam_analysis`. The normal stress is
+    ``-M (y - c) / I`` and the shear stress is Jourawski's ``V Q / (I b)``;
+    both are evaluated as outer products of the diagram and section profiles.
+    """
+
+    x, shear, moment = _diagram_arrays(diagrams)
+    heights = np.linspace(0.0, section.height, max(num_y, 2)) if y is None else np.asarray(y, dtype=float)
+
+    lever = -(heights - section.centroid) / section.inertia
+    widths = section.width_at(heights)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shear_profile = np.where(widths > 0, section.first_moment(heights) / (section.inertia * widths), 0.0)
+
+    return StressField(
+        x=x,
+        y=heights,
+        normal=np.multiply.outer(moment, lever),
+        shear=np.multiply.outer(shear, shear_profile),
+    )
@@ -0,0 +1,982 @@
+"""Pin-jointed truss analysis independent of the desktop interface.
+
+Models are plain arrays: node coordinates, member connectivity as pairs of
+node rows, a boolean restraint mask per node and direction, and nodal loads.
+Member forces are positive in tension. Plane and space trusses share every
+routine; ``dim`` is the number of coordinate columns. :func:`resolver_articulado`
+keeps the dictionary interface used by the desktop simulator (``nodos``,
+``miembros`` and ``cargas`` lists), where nodes with a ``z`` key make a space
+truss.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .sparse import (
+    CSRMatrix,
+    conjugate_gradient,
+    factorize,
+    gram,
+    permute,
+    reverse_cuthill_mckee,
+    singular_pivots,
+    submatrix,
+)
+
+
+# Restrained directions (x, y) per support type of the desktop tool. A fixed
+# (empotrado) support restrains the same translations as a pin.
+SUPPORT_RESTRAINTS: Dict[str, Tuple[bool, bool]] = {
+    "empotrado": (True, True),
+    "fijo": (True, True),
+    "móvil": (False, True),
+    "movil": (False, True),
+    "libre": (False, False),
+}
+
+# The same support names for space trusses, where rollers act along z.
+SPACE_SUPPORT_RESTRAINTS: Dict[str, Tuple[bool, bool, bool]] = {
+    "empotrado": (True, True, True),
+    "fijo": (True, True, True),
+    "móvil": (False, False, True),
+    "movil": (False, False, True),
+    "libre": (False, False, False),
+}
+
+AXES = "xyz"
+
+
+class TrussComputationError(ValueError):
+    """Raised when a truss definition cannot be analysed."""
+
+
+def support_restraints(apoyo: Optional[str], dim: int = 2) -> Tuple[bool, ...]:
+    """Restrained directions for a desktop support name, ``(x, y)`` or ``(x, y, z)``."""
+
+    table = SPACE_SUPPORT_RESTRAINTS if dim == 3 else SUPPORT_RESTRAINTS
+    return table.get((apoyo or "").strip().lower(), (False,) * dim)
+
+
+def node_restraints(nodo: Mapping[str, Any], dim: int = 2) -> Tuple[bool, ...]:
+    """Restrained directions of a node dictionary.
+
+    ``restricciones`` lists the restrained axes, either as letters (``"xz"``)
+    or as one flag per direction, and takes precedence over the ``apoyo``
+    support name.
+    """
+
+    restricciones = nodo.get("restricciones")
+    if restricciones is None:
+        return support_restraints(nodo.get("apoyo"), dim)
+    if isinstance(restricciones, str):
+        letters = restricciones.strip().lower()
+        if set(letters) - set(AXES[:dim]):
+            raise TrussComputationError(f"Unknown restrained axes {restricciones!r} for node {nodo.get('id')!r}.")
+        return tuple(axis in letters for axis in AXES[:dim])
+    flags = tuple(bool(flag) for flag in restricciones)
+    if len(flags) != dim:
+        raise TrussComputationError(f"Node {nodo.get('id')!r} needs {dim} restraint flags.")
+    return flags
+
+
+@dataclass(frozen=True)
+class TrussModel:
+    """Array description of a truss.
+
+    ``coordinates`` is ``(nodes, dim)`` with ``dim`` 2 or 3, ``members``
+    ``(members, 2)`` node rows, ``restraints`` a ``(nodes, dim)`` boolean mask
+    and ``loads`` ``(nodes, dim)``.
+    ``node_ids`` keeps the external identifiers used by dictionary callers
+    and ``axial_stiffness`` the EA of each member (uniform when omitted),
+    which only matters for statically indeterminate trusses.
+    """
+
+    coordinates: np.ndarray
+    members: np.ndarray
+    restraints: np.ndarray
+    loads: np.ndarray
+    node_ids: np.ndarray
+    axial_stiffness: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        coordinates: Any,
+        members: Any,
+        restraints: Any,
+        loads: Any = None,
+        node_ids: Any = None,
+        axial_stiffness: Any = None,
+    ) -> "TrussModel":
+        coordinates = np.asarray(coordinates, dtype=float)
+        if coordinates.ndim != 2:
+            raise TrussComputationError("Coordinates must be a (nodes, dim) array.")
+        num_nodes = coordinates.shape[0]
+
+        members = np.asarray(members, dtype=np.intp).reshape(-1, 2)
+        if members.size and (members.min() < 0 or members.max() >= num_nodes):
+            raise TrussComputationError("Members must reference existing nodes.")
+
+        restraints = np.asarray(restraints, dtype=bool)
+        if restraints.shape != coordinates.shape:
+            raise TrussComputationError("Restraints must have one flag per node and direction.")
+
+        loads = np.zeros_like(coordinates) if loads is None else np.asarray(loads, dtype=float)
+        if loads.shape != coordinates.shape:
+            raise TrussComputationError("Loads must have one component per node and direction.")
+
+        node_ids = np.arange(num_nodes) if node_ids is None else np.asarray(node_ids)
+        if axial_stiffness is not None:
+            axial_stiffness = np.broadcast_to(
+                np.asarray(axial_stiffness, dtype=float), (members.shape[0],)
+            ).copy()
+            if np.any(axial_stiffness <= 0):
+                raise TrussComputationError("Member axial stiffness EA must be positive.")
+        return cls(
+            coordinates=coordinates,
+            members=members,
+            restraints=restraints,
+            loads=loads,
+            node_ids=node_ids,
+            axial_stiffness=axial_stiffness,
+        )
+
+    @classmethod
+    def from_dicts(
+        cls,
+        nodos: Sequence[Mapping[str, Any]],
+        miembros: Sequence[Mapping[str, Any]],
+        cargas: Sequence[Mapping[str, Any]] = (),
+    ) -> "TrussModel":
+        """Build a model from the desktop dictionaries.
+
+        The truss is spatial as soon as one node has a ``z`` coordinate; nodes
+        without one then lie on ``z = 0``.
+        """
+
+        dim = 3 if any("z" in n for n in nodos) else 2
+        rows = {n["id"]: i for i, n in enumerate(nodos)}
+        coordinates = [tuple(float(n.get(axis, 0.0)) for axis in AXES[:dim]) for n in nodos]
+        restraints = [node_restraints(n, dim) for n in nodos]
+        try:
+            members = [(rows[m["inicio"]], rows[m["fin"]]) for m in miembros]
+        except KeyError as exc:
+            raise TrussComputationError(f"Member references unknown node {exc.args[0]!r}.") from None
+
+        model = cls.from_arrays(
+            np.asarray(coordinates, dtype=float).reshape(-1, dim),
+            members,
+            np.asarray(restraints, dtype=bool).reshape(-1, dim),
+            node_ids=[n["id"] for n in nodos],
+        )
+        return replace(model, loads=model.loads_from_dicts(cargas))
+
+    def to_dicts(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """``(nodos, miembros, cargas)`` lists for the desktop dictionary front-ends.
+
+        Supports with a desktop name are written as ``apoyo``; any other subset
+        of restrained directions as ``restricciones`` letters.
+        """
+
+        axes = AXES[: self.dim]
+        table = SPACE_SUPPORT_RESTRAINTS if self.dim == 3 else SUPPORT_RESTRAINTS
+        names = {restraint: name for name, restraint in table.items() if name != "movil"}
+        nodos = []
+        for row, point in enumerate(self.coordinates.tolist()):
+            nodo: Dict[str, Any] = {"id": _external_id(self, row), **dict(zip(axes, point))}
+            restraint = tuple(bool(flag) for flag in self.restraints[row])
+            if restraint in names:
+                nodo["apoyo"] = names[restraint].capitalize()
+            else:
+                nodo["restricciones"] = "".join(axis for axis, flag in zip(axes, restraint) if flag)
+            nodos.append(nodo)
+        ids = [nodo["id"] for nodo in nodos]
+        miembros = [{"inicio": ids[a], "fin": ids[b], "fuerza": 0.0} for a, b in self.members.tolist()]
+        cargas = [
+            {"nodo": ids[row], **{f"F{axis}": float(value) for axis, value in zip(axes, self.loads[row])}}
+            for row in np.flatnonzero(np.any(self.loads != 0.0, axis=1))
+        ]
+        return nodos, miembros, cargas
+
+    def loads_from_dicts(self, cargas: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """``(nodes, dim)`` load array from desktop ``{'nodo', 'Fx', 'Fy'}`` entries.
+
+        Space trusses also read ``Fz``, which defaults to zero.
+        """
+
+        rows = {node_id: i for i, node_id in enumerate(self.node_ids.tolist())}
+        loads = np.zeros((self.num_nodes, self.dim))
+        for c in cargas:
+            if c["nodo"] not in rows:
+                raise TrussComputationError(f"Load applied to unknown node {c['nodo']!r}.")
+            components = (float(c["Fx"]), float(c["Fy"]), float(c.get("Fz", 0.0)))
+            loads[rows[c["nodo"]]] += components[: self.dim]
+        return loads
+
+    @property
+    def num_nodes(self) -> int:
+        return int(self.coordinates.shape[0])
+
+    @property
+    def num_members(self) -> int:
+        return int(self.members.shape[0])
+
+    @property
+    def dim(self) -> int:
+        return int(self.coordinates.shape[1])
+
+    def member_vectors(self) -> np.ndarray:
+        return self.coordinates[self.members[:, 1]] - self.coordinates[self.members[:, 0]]
+
+    def member_lengths(self) -> np.ndarray:
+        return np.linalg.norm(self.member_vectors(), axis=1)
+
+    def member_stiffness(self) -> np.ndarray:
+        """EA of every member, ones when the model does not define it."""
+
+        if self.axial_stiffness is None:
+            return np.ones(self.num_members)
+        return self.axial_stiffness
+
+    def member_directions(self) -> np.ndarray:
+        """Unit vectors from the start to the end node (zero for null members)."""
+
+        vectors = self.member_vectors()
+        lengths = np.linalg.norm(vectors, axis=1)
+        safe = np.where(lengths > 0, lengths, 1.0)
+        return np.where(lengths[:, None] > 0, vectors / safe[:, None], 0.0)
+
+
+@dataclass(frozen=True)
+class TrussSolution:
+    """Member forces (tension positive) and nodal reactions of a truss."""
+
+    forces: np.ndarray
+    reactions: np.ndarray
+    num_vars: int
+    num_eqs: int
+
+    @property
+    def is_determinate(self) -> bool:
+        return self.num_vars == self.num_eqs
+
+
+def assemble_equilibrium(model: TrussModel) -> CSRMatrix:
+    """Sparse method-of-joints matrix, one column per member force and reaction.
+
+    Rows are the equilibrium equations of each node and direction
+    (``node * dim + axis``). Member columns come first, followed by the
+    restrained directions in node order. The direction cosines are computed
+    once per member and scattered as COO triplets: a tensile force pulls each
+    end node towards the other one.
+    """
+
+    dim = model.dim
+    num_members = model.num_members
+    num_reactions = int(model.restraints.sum())
+    axes = np.arange(dim)
+    directions = model.member_directions()
+
+    start_rows = (model.members[:, :1] * dim + axes).ravel()
+    end_rows = (model.members[:, 1:] * dim + axes).ravel()
+    member_cols = np.repeat(np.arange(num_members), dim)
+    restrained_rows = np.flatnonzero(model.restraints.ravel())
+
+    rows = np.concatenate((start_rows, end_rows, restrained_rows))
+    cols = np.concatenate((member_cols, member_cols, num_members + np.arange(num_reactions)))
+    values = np.concatenate((directions.ravel(), -directions.ravel(), np.ones(num_reactions)))
+    keep = values != 0.0
+    return CSRMatrix.from_coo(
+        rows[keep],
+        cols[keep],
+        values[keep],
+        (model.num_nodes * dim, num_members + num_reactions),
+    )
+
+
+def _member_dofs(model: TrussModel) -> np.ndarray:
+    """Global DOFs of every member, start node first: ``(members, 2 * dim)``."""
+
+    axes = np.arange(model.dim)
+    return np.concatenate(
+        (model.members[:, :1] * model.dim + axes, model.members[:, 1:] * model.dim + axes), axis=1
+    )
+
+
+def assemble_stiffness(model: TrussModel) -> CSRMatrix:
+    """Global stiffness matrix ``K = sum EA/L g g^T`` with ``g = [-d, d]``."""
+
+    lengths = model.member_lengths()
+    if np.any(lengths <= 0):
+        raise TrussComputationError("Members must have a positive length.")
+    directions = model.member_directions()
+    gradients = np.concatenate((-directions, directions), axis=1)
+    scale = model.member_stiffness() / lengths
+    blocks = scale[:, None, None] * gradients[:, :, None] * gradients[:, None, :]
+
+    dofs = _member_dofs(model)
+    size = 2 * model.dim
+    rows = np.repeat(dofs, size, axis=1)
+    cols = np.tile(dofs, (1, size))
+    n = model.num_nodes * model.dim
+    return CSRMatrix.from_coo(rows.ravel(), cols.ravel(), blocks.ravel(), (n, n))
+
+
+@dataclass(frozen=True)
+class StiffnessSolution:
+    """Nodal displacements, member forces and reactions of the stiffness method."""
+
+    displacements: np.ndarray
+    forces: np.ndarray
+    reactions: np.ndarray
+
+
+@dataclass(frozen=True)
+class TrussLoadCases:
+    """Results of several load cases solved on one factorization.
+
+    ``forces`` is ``(members, cases)``; ``reactions`` and ``displacements``
+    are ``(cases, nodes, dim)``. Displacements are only available when the
+    system was solved by the stiffness method.
+    """
+
+    forces: np.ndarray
+    reactions: np.ndarray
+    displacements: Optional[np.ndarray] = None
+
+    @property
+    def num_cases(self) -> int:
+        return int(self.forces.shape[1])
+
+
+def member_forces_from_displacements(model: TrussModel, displacements: np.ndarray) -> np.ndarray:
+    """Axial forces ``EA/L * d . (u_end - u_start)``.
+
+    ``displacements`` is ``(nodes, dim)`` for one case, giving ``(members,)``
+    forces, or ``(cases, nodes, dim)``, giving ``(members, cases)``.
+    """
+
+    u = np.asarray(displacements, dtype=float)
+    cases = u.reshape(-1, model.num_nodes, model.dim)
+    start, end = model.members[:, 0], model.members[:, 1]
+    elongation = np.einsum("md,cmd->mc", model.member_directions(), cases[:, end] - cases[:, start])
+    forces = (model.member_stiffness() / model.member_lengths())[:, None] * elongation
+    return forces[:, 0] if u.ndim == 2 else forces
+
+
+def thermal_elongations(model: TrussModel, expansion: Any, temperature_change: Any) -> np.ndarray:
+    """Free thermal elongations ``α ΔT L`` of every member.
+
+    ``expansion`` (α) and ``temperature_change`` (ΔT) are scalars or
+    per-member arrays; a ``(cases, members)`` temperature change gives one
+    row of elongations per case, ready for :meth:`TrussSystem.solve_imposed`.
+    """
+
+    return np.asarray(expansion, dtype=float) * np.asarray(temperature_change, dtype=float) * model.member_lengths()
+
+
+def _direction_rank(scatter: np.ndarray, rtol: float = 1e-9) -> np.ndarray:
+    eigenvalues = np.linalg.eigvalsh(scatter)
+    return np.sum(eigenvalues > rtol * np.maximum(eigenvalues[..., -1:], 1.0), axis=-1)
+
+
+@dataclass(frozen=True)
+class ReducedTruss:
+    """A truss without its zero-force members and the nodes they leave bare.
+
+    ``kept_members`` and ``kept_nodes`` are rows of ``original`` present in
+    ``model``. ``member_pass`` is the elimination pass that removed each
+    member (-1 for kept members). The reduction holds only while the nodes in
+    ``unloaded_nodes`` (joints where a member was found to be zero-force, and
+    removed nodes) stay unloaded.
+    """
+
+    original: TrussModel
+    model: TrussModel
+    kept_members: np.ndarray
+    kept_nodes: np.ndarray
+    member_pass: np.ndarray
+    unloaded_nodes: np.ndarray
+
+    @property
+    def zero_force_members(self) -> np.ndarray:
+        return np.flatnonzero(self.member_pass >= 0)
+
+    def restrict_loads(self, loads: np.ndarray) -> np.ndarray:
+        """Loads of the kept nodes, ``(..., nodes, dim)`` in reduced numbering."""
+
+        loads = np.asarray(loads, dtype=float)
+        if np.any(loads[..., self.unloaded_nodes, :] != 0.0):
+            raise TrussComputationError("Loads act on joints assumed unloaded by the zero-force reduction.")
+        return loads[..., self.kept_nodes, :]
+
+    def expand(self, result: "TrussLoadCases") -> "TrussLoadCases":
+        """Map results of the reduced model back onto the original truss."""
+
+        original = self.original
+        num_cases = result.forces.shape[1]
+        forces = np.zeros((original.num_members, num_cases))
+        forces[self.kept_members] = result.forces
+        reactions = np.zeros((num_cases, original.num_nodes, original.dim))
+        reactions[:, self.kept_nodes] = result.reactions
+        displacements = None
+        if result.displacements is not None:
+            displacements = np.zeros_like(reactions)
+            displacements[:, self.kept_nodes] = result.displacements
+            self._recover_displacements(displacements)
+        return TrussLoadCases(forces=forces, reactions=reactions, displacements=displacements)
+
+    def _recover_displacements(self, displacements: np.ndarray) -> None:
+        # Removed nodes are placed so that their zero-force members do not
+        # stretch, undoing the passes in reverse order.
+        original = self.original
+        removed = np.setdiff1d(np.arange(original.num_nodes), self.kept_nodes)
+        if not removed.size:
+            return
+        node_pass = np.full(original.num_nodes, -1)
+        for end in (0, 1):
+            np.maximum.at(node_pass, original.members[:, end], self.member_pass)
+        directions = original.member_directions()
+        outer = directions[:, :, None] * directions[:, None, :]
+        for step in np.unique(node_pass[removed])[::-1]:
+            group = removed[node_pass[removed] == step]
+            in_group = np.zeros(original.num_nodes, dtype=bool)
+            in_group[group] = True
+            normal = np.zeros((original.num_nodes, original.dim, original.dim))
+            rhs = np.zeros((displacements.shape[0], original.num_nodes, original.dim))
+            for end in (0, 1):
+                node = original.members[:, end]
+                other = original.members[:, 1 - end]
+                rows = np.flatnonzero(in_group[node] & (self.member_pass >= 0))
+                np.add.at(normal, node[rows], outer[rows])
+                along = np.einsum("md,cmd->cm", directions[rows], displacements[:, other[rows]])
+                np.add.at(rhs, (slice(None), node[rows]), along[:, :, None] * directions[rows])
+            solved = np.einsum("nij,cnj->cni", np.linalg.pinv(normal[group]), rhs[:, group])
+            displacements[:, group] = solved
+
+
+def reduce_truss(model: TrussModel, loads: Any = None) -> ReducedTruss:
+    """Remove zero-force members before solving.
+
+    At a joint without load, a member whose direction is not spanned by the
+    other members and restrained directions of that joint carries no force,
+    in any dimension. Such members are removed when that leaves the reduced
+    truss as stable as the original: unloaded two-member joints and dangling
+    members go, together with their bare nodes, while the third member of a
+    joint whose other two are collinear stays, since it braces the joint.
+    Removing members can expose new cases, so passes repeat until nothing
+    changes. ``loads`` (``(nodes, dim)`` or ``(cases, nodes, dim)``, the
+    model's loads by default) decides which joints are unloaded.
+    """
+
+    loads = model.loads if loads is None else np.asarray(loads, dtype=float)
+    loaded = np.any(loads.reshape(-1, model.num_nodes, model.dim) != 0.0, axis=(0, 2))
+    directions = model.member_directions()
+    outer = directions[:, :, None] * directions[:, None, :]
+    axes = np.arange(model.dim)
+
+    def scatter_of(active: np.ndarray) -> np.ndarray:
+        scatter = np.zeros((model.num_nodes, model.dim, model.dim))
+        for end in (0, 1):
+            np.add.at(scatter, model.members[active, end], outer[active])
+        scatter[:, axes, axes] += model.restraints
+        return scatter
+
+    member_pass = np.full(model.num_members, -1)
+    unloaded_nodes = np.zeros(model.num_nodes, dtype=bool)
+    step = 0
+    while True:
+        active = member_pass < 0
+        scatter = scatter_of(active)
+        node_rank = _direction_rank(scatter)
+
+        zero = np.zeros(model.num_members, dtype=bool)
+        fired_at = np.zeros(model.num_nodes, dtype=bool)
+        for end in (0, 1):
+            node = model.members[:, end]
+            rows = np.flatnonzero(active & ~loaded[node])
+            rank_without = _direction_rank(scatter[node[rows]] - outer[rows])
+            fired = rows[rank_without < node_rank[node[rows]]]
+            zero[fired] = True
+            fired_at[node[fired]] = True
+
+        # A zero-force member may still be what holds a joint in place (the
+        # third member at a joint with two collinear ones). Removal is kept
+        # only where every joint either keeps its rank or is left bare.
+        while zero.any():
+            remaining = active & ~zero
+            degree = np.zeros(model.num_nodes, dtype=int)
+            for end in (0, 1):
+                np.add.at(degree, model.members[remaining, end], 1)
+            weakened = (_direction_rank(scatter_of(remaining)) < node_rank) & (degree > 0)
+            revert = zero & (weakened[model.members[:, 0]] | weakened[model.members[:, 1]])
+            if not revert.any():
+                break
+            zero &= ~revert
+        if not zero.any():
+            break
+        unloaded_nodes |= fired_at & np.isin(np.arange(model.num_nodes), model.members[zero].ravel())
+        member_pass[zero] = step
+        step += 1
+
+    kept_members = np.flatnonzero(member_pass < 0)
+    used = np.zeros(model.num_nodes, dtype=bool)
+    used[model.members[kept_members].ravel()] = True
+    kept_nodes = np.flatnonzero(used | loaded)
+    renumber = np.full(model.num_nodes, -1)
+    renumber[kept_nodes] = np.arange(kept_nodes.size)
+
+    stiffness = None if model.axial_stiffness is None else model.axial_stiffness[kept_members]
+    reduced = TrussModel(
+        coordinates=model.coordinates[kept_nodes],
+        members=renumber[model.members[kept_members]],
+        restraints=model.restraints[kept_nodes],
+        loads=model.loads[kept_nodes],
+        node_ids=model.node_ids[kept_nodes],
+        axial_stiffness=stiffness,
+    )
+    return ReducedTruss(
+        original=model,
+        model=reduced,
+        kept_members=kept_members,
+        kept_nodes=kept_nodes,
+        member_pass=member_pass,
+        unloaded_nodes=np.union1d(np.flatnonzero(unloaded_nodes), np.flatnonzero(~used & ~loaded)),
+    )
+
+
+class _LeastSquares:
+    def __init__(self, matrix: CSRMatrix) -> None:
+        self._pseudo_inverse = np.linalg.pinv(matrix.toarray())
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        return self._pseudo_inverse @ b
+
+
+class _ConjugateGradient:
+    def __init__(self, matrix: CSRMatrix) -> None:
+        self._matrix = matrix
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        if b.ndim == 1:
+            return conjugate_gradient(self._matrix, b)
+        return np.column_stack([conjugate_gradient(self._matrix, column) for column in b.T])
+
+
+TRUSS_STRATEGIES = ("joints", "stiffness", "lstsq")
+
+
+class TrussSystem:
+    """Truss matrix factorized once and reused for any number of load cases.
+
+    ``strategy`` is chosen from the shape of the method-of-joints system
+    unless given: ``"joints"`` for square systems, ``"stiffness"`` (free-DOF
+    block of the stiffness matrix, using the model's EA) when there are more
+    unknowns than equations, and ``"lstsq"`` for whatever cannot be factorized.
+    ``method`` is passed to :func:`~mechanics.sparse.factorize`; ``"cg"``
+    solves the stiffness system by conjugate gradient instead.
+
+    With ``reduce=True`` the zero-force members for the model's loads are
+    removed first (:func:`reduce_truss`) and results are expanded back; later
+    load cases must leave the joints the reduction relied on unloaded.
+    ``num_vars`` and ``num_eqs`` always describe the original truss.
+    """
+
+    def __init__(
+        self,
+        model: TrussModel,
+        *,
+        method: str = "auto",
+        strategy: Optional[str] = None,
+        reduce: bool = False,
+    ) -> None:
+        if strategy is not None and strategy not in TRUSS_STRATEGIES:
+            raise ValueError(f"Unknown truss strategy: {strategy!r}")
+        self.model = model
+        self.reduction = reduce_truss(model) if reduce else None
+        self._target = self.reduction.model if reduce else model
+        self.equilibrium = assemble_equilibrium(self._target)
+        self.num_eqs = model.num_nodes * model.dim
+        self.num_vars = model.num_members + int(model.restraints.sum())
+        self.stiffness: Optional[CSRMatrix] = None
+        self._free = np.flatnonzero(~self._target.restraints.ravel())
+        self._solver = None
+
+        rows, cols = self.equilibrium.shape
+        if strategy is None:
+            if cols > rows:
+                strategy = self._try(self._factorize_stiffness, method)
+            elif cols == rows:
+                strategy = self._try(self._factorize_joints, method)
+            strategy = strategy or "lstsq"
+        elif strategy == "stiffness":
+            self._factorize_stiffness(method)
+        elif strategy == "joints":
+            self._factorize_joints(method)
+
+        if strategy == "lstsq":
+            self._solver = _LeastSquares(self.equilibrium)
+        self.strategy = strategy
+
+    @staticmethod
+    def _try(factorization, method: str) -> Optional[str]:
+        try:
+            return factorization(method)
+        except (np.linalg.LinAlgError, TrussComputationError):
+            return None
+
+    def _factorize_joints(self, method: str) -> str:
+        if method == "cg":
+            raise ValueError("Conjugate gradient only applies to the stiffness strategy.")
+        self._solver = factorize(self.equilibrium, method=method)
+        return "joints"
+
+    def _factorize_stiffness(self, method: str) -> str:
+        self.stiffness = assemble_stiffness(self._target)
+        if self._free.size:
+            K_ff = submatrix(self.stiffness, self._free, self._free)
+            self._solver = _ConjugateGradient(K_ff) if method == "cg" else factorize(K_ff, method=method)
+        return "stiffness"
+
+    @property
+    def is_determinate(self) -> bool:
+        return self.num_vars == self.num_eqs
+
+    def solve(self, loads: Any) -> TrussLoadCases:
+        """Solve every load case of ``loads``, ``(nodes, dim)`` or ``(cases, nodes, dim)``."""
+
+        loads = np.asarray(loads, dtype=float)
+        if loads.shape[-2:] != (self.model.num_nodes, self.model.dim) or loads.ndim not in (2, 3):
+            raise TrussComputationError(
+                f"Loads must have shape (nodes, {self.model.dim}) or (cases, nodes, {self.model.dim})."
+            )
+        if self.reduction is None:
+            return self._solve(loads)
+        return self.reduction.expand(self._solve(self.reduction.restrict_loads(loads)))
+
+    def solve_imposed(self, loads: Any = None, *, elongations: Any = None, settlements: Any = None) -> TrussLoadCases:
+        """Solve load cases with imposed member elongations and support displacements.
+
+        ``elongations`` are free member elongations, ``(members,)`` or
+        ``(cases, members)``, e.g. from :func:`thermal_elongations`;
+        ``settlements`` are prescribed displacements ``(nodes, dim)`` or
+        ``(cases, nodes, dim)``, non-zero only in restrained directions.
+        Both become extra right-hand sides on the existing factorization, so
+        every case costs one back substitution. The number of cases is
+        broadcast between ``loads``, ``elongations`` and ``settlements``.
+        """
+
+        if self.strategy != "stiffness":
+            raise TrussComputationError("Imposed strains and settlements need the stiffness strategy.")
+        if self.reduction is not None:
+            raise TrussComputationError("Imposed strains and settlements cannot be solved on a reduced truss.")
+        model = self.model
+        shape = (model.num_nodes, model.dim)
+        loads = np.zeros(shape) if loads is None else np.asarray(loads, dtype=float)
+        elongations = np.zeros(model.num_members) if elongations is None else np.asarray(elongations, dtype=float)
+        settlements = np.zeros(shape) if settlements is None else np.asarray(settlements, dtype=float)
+        members = (model.num_members,)
+        if loads.shape[-2:] != shape or settlements.shape[-2:] != shape or elongations.shape[-1:] != members:
+            raise TrussComputationError(
+                f"Loads and settlements must end in (nodes, {model.dim}) and elongations in (members,)."
+            )
+        loads, settlements = loads.reshape(-1, *shape), settlements.reshape(-1, *shape)
+        elongations = elongations.reshape(-1, model.num_members)
+        num_cases = max(len(loads), len(elongations), len(settlements))
+        try:
+            loads, settlements = (np.broadcast_to(a, (num_cases, *shape)) for a in (loads, settlements))
+            elongations = np.broadcast_to(elongations, (num_cases, model.num_members))
+        except ValueError:
+            raise TrussComputationError("Loads, elongations and settlements have different numbers of cases.") from None
+        if np.any(settlements.reshape(num_cases, -1)[:, self._free] != 0):
+            raise TrussComputationError("Settlements can only be prescribed in restrained directions.")
+        return self._solve(loads, elongations=elongations, settlements=settlements)
+
+    def _solve(
+        self, loads: np.ndarray, *, elongations: Optional[np.ndarray] = None, settlements: Optional[np.ndarray] = None
+    ) -> TrussLoadCases:
+        model = self._target
+        cases = loads.reshape(-1, model.num_nodes * model.dim)
+        F = cases.T
+        num_cases = cases.shape[0]
+
+        if self.strategy == "stiffness":
+            # A free elongation e0 acts on the nodes like the forces of a
+            # member in compression EA/L e0; its own share is taken back from
+            # the member forces below.
+            if elongations is not None:
+                prestress = (model.member_stiffness() / model.member_lengths())[:, None] * elongations.T
+                padding = np.zeros((self.equilibrium.shape[1] - model.num_members, num_cases))
+                F = F - self.equilibrium @ np.vstack((prestress, padding))
+            u = np.zeros_like(F)
+            restrained = model.restraints.ravel()
+            if settlements is not None:
+                u[restrained] = settlements.reshape(num_cases, -1).T[restrained]
+            if self._free.size:
+                rhs = F[self._free]
+                if u[restrained].any():
+                    rhs = rhs - self.stiffness.matvec(u)[self._free]
+                u[self._free] = self._solver.solve(rhs)
+            reactions = self.stiffness.matvec(u) - F
+            reactions[self._free] = 0.0
+            displacements = u.T.reshape(num_cases, model.num_nodes, model.dim)
+            forces = member_forces_from_displacements(model, displacements)
+            if elongations is not None:
+                forces = forces - prestress
+            return TrussLoadCases(
+                forces=forces,
+                reactions=reactions.T.reshape(num_cases, model.num_nodes, model.dim),
+                displacements=displacements,
+            )
+
+        x = self._solver.solve(-F)
+        reactions = np.zeros_like(F)
+        reactions[model.restraints.ravel()] = x[model.num_members:]
+        return TrussLoadCases(
+            forces=x[: model.num_members],
+            reactions=reactions.T.reshape(num_cases, model.num_nodes, model.dim),
+        )
+
+
+def solve_truss_stiffness(model: TrussModel, *, method: str = "auto") -> StiffnessSolution:
+    """Solve any stable truss, determinate or not, by the direct stiffness method.
+
+    The free-DOF block of the stiffness matrix is solved with
+    :func:`~mechanics.sparse.factorize` or, with ``method="cg"``, with the
+    conjugate gradient. A mechanism makes the matrix singular and raises
+    :class:`~mechanics.sparse.SingularMatrixError`.
+    """
+
+    result = TrussSystem(model, method=method, strategy="stiffness").solve(model.loads)
+    return StiffnessSolution(
+        displacements=result.displacements[0],
+        forces=result.forces[:, 0],
+        reactions=result.reactions[0],
+    )
+
+
+def solve_truss(model: TrussModel, *, method: str = "auto", reduce: bool = False) -> TrussSolution:
+    """Solve ``model`` for its own loads.
+
+    Square systems are solved by the method of joints through
+    :func:`~mechanics.sparse.factorize` (``method`` selects dense, banded or
+    SuperLU). Statically indeterminate trusses, with more unknowns than
+    equations, use the stiffness method with the model's EA. Whatever remains
+    unsolvable (singular or overdetermined systems) falls back to least
+    squares. ``reduce`` removes zero-force members first. Use
+    :class:`TrussSystem` directly to solve many load cases.
+    """
+
+    system = TrussSystem(model, method=method, reduce=reduce)
+    result = system.solve(model.loads)
+    return TrussSolution(
+        forces=result.forces[:, 0],
+        reactions=result.reactions[0],
+        num_vars=system.num_vars,
+        num_eqs=system.num_eqs,
+    )
+
+
+@dataclass(frozen=True)
+class TrussDiagnostics:
+    """Stability and determinacy of a truss from the rank of its equilibrium matrix.
+
+    ``mechanism_nodes`` are the node rows where a direction without stiffness
+    was found, either by the global elimination or because the node's members
+    are collinear or missing. ``redundant_members`` is one set of members
+    whose removal leaves a statically determinate structure (if it is stable).
+    """
+
+    num_vars: int
+    num_eqs: int
+    rank: int
+    mechanism_nodes: np.ndarray
+    redundant_members: np.ndarray
+
+    @property
+    def num_mechanisms(self) -> int:
+        return self.num_eqs - self.rank
+
+    @property
+    def degree_of_indeterminacy(self) -> int:
+        return self.num_vars - self.rank
+
+    @property
+    def is_stable(self) -> bool:
+        return self.num_mechanisms == 0
+
+    @property
+    def is_determinate(self) -> bool:
+        return self.is_stable and self.degree_of_indeterminacy == 0
+
+    def require_stable(self) -> None:
+        """Raise :class:`TrussComputationError` when the truss is a mechanism."""
+
+        if not self.is_stable:
+            raise TrussComputationError(
+                f"Truss has {self.num_mechanisms} mechanism(s) at node rows "
+                f"{self.mechanism_nodes.tolist()}."
+            )
+
+
+def _locally_unstable_nodes(model: TrussModel, rtol: float) -> np.ndarray:
+    # A node is held only if its members and restrained directions span every
+    # axis: the smallest eigenvalue of sum(d d^T) vanishes for dangling nodes
+    # and for nodes whose members are all collinear.
+    directions = model.member_directions()
+    outer = directions[:, :, None] * directions[:, None, :]
+    scatter = np.zeros((model.num_nodes, model.dim, model.dim))
+    np.add.at(scatter, model.members[:, 0], outer)
+    np.add.at(scatter, model.members[:, 1], outer)
+    axes = np.arange(model.dim)
+    scatter[:, axes, axes] += model.restraints
+    eigenvalues = np.linalg.eigvalsh(scatter)
+    return np.flatnonzero(eigenvalues[:, 0] <= rtol * np.maximum(eigenvalues[:, -1], 1.0))
+
+
+def _dependent(matrix: CSRMatrix, rtol: float) -> np.ndarray:
+    perm = reverse_cuthill_mckee(matrix)
+    return np.sort(perm[singular_pivots(permute(matrix, perm, perm), rtol=rtol)])
+
+
+def diagnose_truss(model: TrussModel, *, rtol: float = 1e-7) -> TrussDiagnostics:
+    """Rank-based stability and determinacy check, run before solving.
+
+    The member block of the equilibrium matrix restricted to free directions,
+    ``B``, is examined through its Gram matrices: zero pivots of ``B B^T``
+    are mechanism directions and zero pivots of ``B^T B`` redundant members.
+    Both are eliminated in banded form after a reverse Cuthill–McKee
+    renumbering, so the cost grows linearly with the length of a plane truss
+    (see :mod:`mechanics.sparse` for models that extend in more directions).
+    A local check also flags nodes whose members are all collinear.
+
+    The Gram matrices square the conditioning of ``B``; for extremely slender
+    trusses (thousands of panels over one panel depth) genuine pivots approach
+    ``rtol`` and mechanisms may go unnoticed.
+    """
+
+    A = assemble_equilibrium(model)
+    num_eqs, num_vars = A.shape
+    free = np.flatnonzero(~model.restraints.ravel())
+    B = submatrix(A, free, np.arange(model.num_members))
+
+    mechanism_dofs = free[_dependent(gram(B.transpose()), rtol)]
+    redundant = _dependent(gram(B), rtol)
+    nodes = np.union1d(mechanism_dofs // model.dim, _locally_unstable_nodes(model, rtol))
+    rank = num_eqs - mechanism_dofs.size
+    return TrussDiagnostics(
+        num_vars=num_vars,
+        num_eqs=num_eqs,
+        rank=rank,
+        mechanism_nodes=nodes.astype(np.intp),
+        redundant_members=redundant,
+    )
+
+
+@dataclass(frozen=True)
+class NodeMemberIndex:
+    """CSR adjacency from every node to the members meeting there.
+
+    The members of node ``n`` are ``members[indptr[n]:indptr[n + 1]]``;
+    ``signs`` is +1 where the node is the member's start and -1 where it is
+    its end, so ``sign * N * d`` is the force a member with axial force ``N``
+    (tension positive) exerts on the node.
+    """
+
+    indptr: np.ndarray
+    members: np.ndarray
+    signs: np.ndarray
+
+    @classmethod
+    def from_model(cls, model: TrussModel) -> "NodeMemberIndex":
+        ends = model.members.T.ravel()
+        rows = np.tile(np.arange(model.num_members), 2)
+        signs = np.repeat([1.0, -1.0], model.num_members)
+        order = np.argsort(ends, kind="stable")
+        counts = np.bincount(ends, minlength=model.num_nodes)
+        return cls(
+            indptr=np.concatenate(([0], np.cumsum(counts))),
+            members=rows[order],
+            signs=signs[order],
+        )
+
+    @property
+    def degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def members_at(self, node: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Member rows and signs at one node."""
+
+        span = slice(self.indptr[node], self.indptr[node + 1])
+        return self.members[span], self.signs[span]
+
+    def node_resultants(self, model: TrussModel, forces: np.ndarray) -> np.ndarray:
+        """``(nodes, dim)`` pin force at every node: the resultant the pin transmits to its members.
+
+        This is ``-sum(sign * N * d)`` over the members at the node, with ``d``
+        the unit vector from the member's start to its end; zero-length
+        members contribute nothing. For solved forces it equals the load plus
+        the reaction at the node.
+        """
+
+        forces = np.asarray(forces, dtype=float)
+        contributions = (self.signs * forces[self.members])[:, None] * model.member_directions()[self.members]
+        node_of_entry = np.repeat(np.arange(model.num_nodes), self.degree)
+        totals = np.zeros((model.num_nodes, model.dim))
+        for axis in range(model.dim):
+            totals[:, axis] -= np.bincount(node_of_entry, weights=contributions[:, axis], minlength=model.num_nodes)
+        return totals
+
+
+def _external_id(model: TrussModel, row: int) -> Any:
+    node_id = model.node_ids[row]
+    return node_id.item() if isinstance(node_id, np.generic) else node_id
+
+
+def _reaction_dict(model: TrussModel, reactions: np.ndarray) -> Dict[Any, Tuple[float, ...]]:
+    return {
+        _external_id(model, i): tuple(float(r) for r in reactions[i])
+        for i in np.flatnonzero(model.restraints.any(axis=1))
+    }
+
+
+def resolver_articulado(
+    nodos: Sequence[Mapping[str, Any]],
+    miembros: Sequence[Mapping[str, Any]],
+    cargas: Sequence[Mapping[str, Any]],
+) -> Tuple[List[float], Dict[Any, Tuple[float, ...]], int, int]:
+    """Dictionary front-end used by ``calcular_armadura`` and ``calcular_bastidor``.
+
+    Returns ``(fuerzas, reacciones, num_vars, num_eqs)`` where ``fuerzas``
+    follows the order of ``miembros`` and ``reacciones`` maps the id of every
+    supported node to its ``(Rx, Ry)``, or ``(Rx, Ry, Rz)`` for space trusses.
+    """
+
+    model = TrussModel.from_dicts(nodos, miembros, cargas)
+    solution = solve_truss(model)
+    return (
+        [float(f) for f in solution.forces],
+        _reaction_dict(model, solution.reactions),
+        solution.num_vars,
+        solution.num_eqs,
+    )
+
+
+def resultantes_nodales(
+    nodos: Sequence[Mapping[str, Any]],
+    miembros: Sequence[Mapping[str, Any]],
+) -> Dict[Any, Tuple[float, ...]]:
+    """Pin force ``(Fx, Fy)`` (or ``(Fx, Fy, Fz)``) at every node from the solved ``miembros[j]['fuerza']``.
+
+    The member forces are combined for all nodes at once through a
+    :class:`NodeMemberIndex`, as used by the frame pin-force report; at a
+    solved node the result equals its load plus its reaction.
+    """
+
+    model = TrussModel.from_dicts(nodos, miembros)
+    forces = np.asarray([float(m.get("fuerza", 0.0)) for m in miembros])
+    totals = NodeMemberIndex.from_model(model).node_resultants(model, forces)
+    return {_external_id(model, i): tuple(float(f) for f in total) for i, total in enumerate(totals)}
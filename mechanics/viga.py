@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -191,22 +191,177 @@ def torsor_at(
     return float(momento)
 
 
-def compute_beam_analysis(
+def _prefix_sums(values: np.ndarray) -> np.ndarray:
+    return np.concatenate(([0.0], np.cumsum(values)))
+
+
+@dataclass(frozen=True)
+class BeamLoadIndex:
+    """Sorted breakpoints of a solved beam for fast internal-force queries.
+
+    Reactions, point loads and the start/end of every distributed load are
+    kept sorted by position together with prefix sums of the force and of its
+    first and second moments. Evaluating V(x), M(x) or the torsor T(x) then
+    needs one ``searchsorted`` per group, i.e. O(log n) per query point,
+    instead of the O(loads) scan done by :func:`torsor_at`.
+
+    Reactions act from their position onwards (``x >= position``) while loads
+    act strictly after it (``x > position``), matching :func:`torsor_at`.
+    Concentrated couples (clockwise positive, so they add to the sagging
+    moment) also act from their position onwards.
+    """
+
+    support_positions: np.ndarray
+    support_force_sums: np.ndarray
+    support_moment_sums: np.ndarray
+    load_positions: np.ndarray
+    load_force_sums: np.ndarray
+    load_moment_sums: np.ndarray
+    ramp_positions: np.ndarray
+    ramp_sums: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    torsor_base: float = 0.0
+    couple_positions: np.ndarray = field(default_factory=lambda: np.empty(0))
+    couple_sums: np.ndarray = field(default_factory=lambda: np.zeros(1))
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        length: float,
+        reactions: Dict[str, float],
+        torsor_base: float = 0.0,
+        support_c_position: Optional[float] = None,
+        point_loads: Sequence[PointLoad] = (),
+        distributed_loads: Sequence[DistributedLoad] = (),
+        supports: Sequence[Tuple[float, float]] = (),
+        couples: Sequence[Tuple[float, float]] = (),
+    ) -> "BeamLoadIndex":
+        """Index a solved beam.
+
+        ``supports`` adds ``(position, upward force)`` reactions beyond A, B
+        and C, and ``couples`` ``(position, clockwise moment)`` pairs.
+        """
+
+        support_pos = [0.0, float(length)] + [float(pos) for pos, _ in supports]
+        support_force = [reactions.get("A", 0.0), reactions.get("B", 0.0)] + [float(f) for _, f in supports]
+        if support_c_position is not None:
+            support_pos.append(float(support_c_position))
+            support_force.append(reactions.get("C", 0.0))
+
+        load_pos = [load.position for load in point_loads]
+        load_force = [load.magnitude for load in point_loads]
+
+        # A uniform load on [start, end] is a ramp of slope w starting at
+        # ``start`` cancelled by a ramp of slope -w starting at ``end``.
+        ramp_pos = [load.start for load in distributed_loads] + [load.end for load in distributed_loads]
+        ramp_slope = [load.intensity for load in distributed_loads] + [
+            -load.intensity for load in distributed_loads
+        ]
+
+        def _sorted(positions: List[float], values: List[float]) -> Tuple[np.ndarray, np.ndarray]:
+            pos = np.asarray(positions, dtype=float)
+            val = np.asarray(values, dtype=float)
+            order = np.argsort(pos, kind="stable")
+            return pos[order], val[order]
+
+        sp, sf = _sorted(support_pos, support_force)
+        lp, lf = _sorted(load_pos, load_force)
+        rp, rs = _sorted(ramp_pos, ramp_slope)
+        cp, cm = _sorted([pos for pos, _ in couples], [moment for _, moment in couples])
+
+        return cls(
+            support_positions=sp,
+            support_force_sums=_prefix_sums(sf),
+            support_moment_sums=_prefix_sums(sf * sp),
+            load_positions=lp,
+            load_force_sums=_prefix_sums(lf),
+            load_moment_sums=_prefix_sums(lf * lp),
+            ramp_positions=rp,
+            ramp_sums=(_prefix_sums(rs), _prefix_sums(rs * rp), _prefix_sums(rs * rp * rp)),
+            torsor_base=float(torsor_base),
+            couple_positions=cp,
+            couple_sums=_prefix_sums(cm),
+        )
+
+    def evaluate(self, x: Union[float, Sequence[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(shear, moment, torsor)`` at the query positions ``x``."""
+
+        x = np.asarray(x, dtype=float)
+        ks = np.searchsorted(self.support_positions, x, side="right")
+        kl = np.searchsorted(self.load_positions, x, side="left")
+        kr = np.searchsorted(self.ramp_positions, x, side="left")
+        kc = np.searchsorted(self.couple_positions, x, side="right")
+
+        s_f = self.support_force_sums[ks]
+        l_f = self.load_force_sums[kl]
+        r0, r1, r2 = (sums[kr] for sums in self.ramp_sums)
+
+        shear = s_f - l_f - (x * r0 - r1)
+        moment = (
+            (x * s_f - self.support_moment_sums[ks])
+            - (x * l_f - self.load_moment_sums[kl])
+            - 0.5 * (x * x * r0 - 2.0 * x * r1 + r2)
+            + self.couple_sums[kc]
+        )
+        return shear, moment, moment + self.torsor_base
+
+    def shear(self, x: Union[float, Sequence[float], np.ndarray]) -> np.ndarray:
+        return self.evaluate(x)[0]
+
+    def moment(self, x: Union[float, Sequence[float], np.ndarray]) -> np.ndarray:
+        return self.evaluate(x)[1]
+
+    def torsor(self, x: Union[float, Sequence[float], np.ndarray]) -> np.ndarray:
+        return self.evaluate(x)[2]
+
+
+@dataclass(frozen=True)
+class BeamDiagrams:
+    """Array form of the internal diagrams of a single beam.
+
+    This is the numeric core of :func:`compute_beam_analysis` without the
+    conversion to Python lists, meant for batch runs and result sinks that
+    keep everything in NumPy buffers. ``index`` answers queries at arbitrary
+    positions without resampling the diagrams.
+    """
+
+    positions: np.ndarray
+    shear: np.ndarray
+    moment: np.ndarray
+    torsor: np.ndarray
+    reactions: Dict[str, float]
+    index: Optional[BeamLoadIndex] = None
+
+
+@dataclass(frozen=True)
+class _BeamSolution:
+    loads_p: List[PointLoad]
+    loads_d: List[DistributedLoad]
+    support_c_pos: Optional[float]
+    reactions: Dict[str, float]
+    total_force: float
+    total_moment_a: float
+
+    def index(self, *, length: float, torsor: float) -> BeamLoadIndex:
+        return BeamLoadIndex.build(
+            length=length,
+            reactions=self.reactions,
+            torsor_base=torsor,
+            support_c_position=self.support_c_pos,
+            point_loads=self.loads_p,
+            distributed_loads=self.loads_d,
+        )
+
+
+def _solve_beam(
     *,
     length: float,
-    height_start: float = 0.0,
-    height_end: float = 0.0,
-    support_a_type: SupportType = "Fijo",
-    support_b_type: SupportType = "Movil",
-    support_c_type: Optional[SupportType] = "Ninguno",
-    support_c_position: Optional[float] = None,
-    point_loads: Optional[Sequence[PointLoad]] = None,
-    distributed_loads: Optional[Sequence[DistributedLoad]] = None,
-    torsor: float = 0.0,
-    num_points: int = 800,
-) -> Dict[str, object]:
-    """Compute reactions and internal diagrams for a beam configuration."""
-
+    support_c_type: Optional[SupportType],
+    support_c_position: Optional[float],
+    point_loads: Optional[Sequence[PointLoad]],
+    distributed_loads: Optional[Sequence[DistributedLoad]],
+    torsor: float,
+) -> _BeamSolution:
     loads_p = _normalise_point_loads(point_loads)
     loads_d = _normalise_distributed_loads(distributed_loads)
 
@@ -223,16 +378,95 @@ def compute_beam_analysis(
         ra = (total_force - rb) / 2.0
         rc = ra
 
-    angle = np.arctan((height_end - height_start) / length)
-
     reactions = {
         "A": float(ra),
         "B": float(rb),
+        "C": float(rc) if support_c_pos is not None else 0.0,
     }
-    if support_c_pos is not None:
-        reactions["C"] = float(rc)
-    else:
-        reactions["C"] = 0.0
+    return _BeamSolution(
+        loads_p=loads_p,
+        loads_d=loads_d,
+        support_c_pos=support_c_pos,
+        reactions=reactions,
+        total_force=total_force,
+        total_moment_a=total_moment_a,
+    )
+
+
+def compute_beam_diagrams(
+    *,
+    length: float,
+    height_start: float = 0.0,
+    height_end: float = 0.0,
+    support_a_type: SupportType = "Fijo",
+    support_b_type: SupportType = "Movil",
+    support_c_type: Optional[SupportType] = "Ninguno",
+    support_c_position: Optional[float] = None,
+    point_loads: Optional[Sequence[PointLoad]] = None,
+    distributed_loads: Optional[Sequence[DistributedLoad]] = None,
+    torsor: float = 0.0,
+    num_points: int = 800,
+) -> BeamDiagrams:
+    """Return the shear, moment and torsor diagrams as NumPy arrays.
+
+    Accepts the same keyword arguments as :func:`compute_beam_analysis` so a
+    configuration dictionary can be fed to either; heights and the A/B support
+    types only affect the horizontal reaction components and are ignored here.
+    """
+
+    solution = _solve_beam(
+        length=length,
+        support_c_type=support_c_type,
+        support_c_position=support_c_position,
+        point_loads=point_loads,
+        distributed_loads=distributed_loads,
+        torsor=torsor,
+    )
+    index = solution.index(length=length, torsor=torsor)
+    x = np.linspace(0.0, length, max(num_points, 2))
+    shear, moment, torsor_curve = index.evaluate(x)
+    return BeamDiagrams(
+        positions=x,
+        shear=shear,
+        moment=moment,
+        torsor=torsor_curve,
+        reactions=dict(solution.reactions),
+        index=index,
+    )
+
+
+def compute_beam_analysis(
+    *,
+    length: float,
+    height_start: float = 0.0,
+    height_end: float = 0.0,
+    support_a_type: SupportType = "Fijo",
+    support_b_type: SupportType = "Movil",
+    support_c_type: Optional[SupportType] = "Ninguno",
+    support_c_position: Optional[float] = None,
+    point_loads: Optional[Sequence[PointLoad]] = None,
+    distributed_loads: Optional[Sequence[DistributedLoad]] = None,
+    torsor: float = 0.0,
+    num_points: int = 800,
+) -> Dict[str, object]:
+    """Compute reactions and internal diagrams for a beam configuration."""
+
+    solution = _solve_beam(
+        length=length,
+        support_c_type=support_c_type,
+        support_c_position=support_c_position,
+        point_loads=point_loads,
+        distributed_loads=distributed_loads,
+        torsor=torsor,
+    )
+    loads_p = solution.loads_p
+    loads_d = solution.loads_d
+    support_c_pos = solution.support_c_pos
+    reactions = solution.reactions
+    total_force = solution.total_force
+    total_moment_a = solution.total_moment_a
+
+    angle = np.arctan((height_end - height_start) / length)
 
     reaction_components = {
         "A": {
@@ -253,49 +487,7 @@ def compute_beam_analysis(
     }
 
     x = np.linspace(0.0, length, max(num_points, 2))
-    shear = np.zeros_like(x)
-    moment = np.zeros_like(x)
-    torsor_curve = np.zeros_like(x)
-
-    for idx, xi in enumerate(x):
-        v = reactions["A"]
-        m = reactions["A"] * xi
-
-        if support_c_pos is not None and xi >= support_c_pos:
-            v += reactions["C"]
-            m += reactions["C"] * (xi - support_c_pos)
-
-        if xi >= length:
-            v += reactions["B"]
-            m += reactions["B"] * (xi - length)
-
-        for load in loads_p:
-            if xi > load.position:
-                v -= load.magnitude
-                m -= load.magnitude * (xi - load.position)
-
-        for load in loads_d:
-            if xi > load.start:
-                if xi <= load.end:
-                    span = xi - load.start
-                    v -= load.intensity * span
-                    m -= load.intensity * span * span / 2.0
-                else:
-                    long_total = load.length
-                    v -= load.intensity * long_total
-                    m -= load.intensity * long_total * (xi - (load.start + long_total / 2.0))
-
-        shear[idx] = v
-        moment[idx] = m
-        torsor_curve[idx] = torsor_at(
-            xi,
-            length=length,
-            reactions=reactions,
-            torsor_base=torsor,
-            support_c_position=support_c_pos,
-            point_loads=loads_p,
-            distributed_loads=loads_d,
-        )
+    shear, moment, torsor_curve = solution.index(length=length, torsor=torsor).evaluate(x)
 
     center_of_mass = None
     if abs(total_force) > np.finfo(float).eps:
@@ -1,5 +1,6 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import os
 
 try:
     import ttkbootstrap as ttkb
@@ -10,10 +11,21 @@ except ImportError:
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
 import argparse
 
+from mechanics import cuts, deformed, design, frame, layout, rendering, sections, truss
+from mechanics import io as tablas_io
+
+# Con más miembros que esto el registro resume las fuerzas en vez de listarlas.
+MIEMBROS_DETALLE = 40
+# Miembros más solicitados que se listan en la verificación de perfiles.
+FILAS_VERIFICACION = 10
+# Perfil de los miembros creados sin elegir uno (ejemplos, optimización).
+PERFIL_POR_DEFECTO = "HEA 100"
+
 
 class Viga:
     """Representa una viga con cargas puntuales"""
@@ -236,6 +248,9 @@ class SimuladorVigaMejorado:
         self.miembros_arm = []
         self.cargas_arm = []
         self.id_nodo_actual = 1
+        # Deformada calculada: (miembros, puntos, 2) en coordenadas del modelo
+        self.deformada_arm = None
+        self.deformada_bast = None
         # Valores por defecto para el método de secciones
         self.corte_valor = tk.DoubleVar(value=0.0)
         self.corte_eje = tk.StringVar(value="X")
@@ -247,6 +262,7 @@ class SimuladorVigaMejorado:
 
         self.miembro_inicio = tk.IntVar(value=1)
         self.miembro_fin = tk.IntVar(value=2)
+        self.perfil_arm = tk.StringVar(value=PERFIL_POR_DEFECTO)
 
         self.carga_nodo = tk.IntVar(value=1)
         self.carga_fx = tk.DoubleVar(value=0.0)
@@ -1513,11 +1529,14 @@ class SimuladorVigaMejorado:
         self.miembros_arm.clear()
         self.cargas_arm.clear()
         self.id_nodo_actual = 1
+        self.deformada_arm = None
         # Limpiar datos de bastidores
         self.nodos_bast.clear()
         self.miembros_bast.clear()
         self.cargas_bast.clear()
         self.id_nodo_bast = 1
+        self.resultantes_bast = {}
+        self.deformada_bast = None
 
         # Limpiar variables de deformación axial y térmica
         self.modulo_young.set(200.0)
@@ -1913,7 +1932,11 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         ttk.Entry(frame_miem, textvariable=self.miembro_inicio, width=5).grid(row=0, column=1, padx=2, pady=1, sticky="ew")
         ttk.Label(frame_miem, text="Fin:").grid(row=0, column=2, padx=2, pady=1, sticky="w")
         ttk.Entry(frame_miem, textvariable=self.miembro_fin, width=5).grid(row=0, column=3, padx=2, pady=1, sticky="ew")
-        ttk.Button(frame_miem, text="Agregar Miembro", command=self.agregar_miembro).grid(row=0, column=4, padx=5, pady=1, sticky="ew")
+        ttk.Label(frame_miem, text="Perfil:").grid(row=0, column=4, padx=2, pady=1, sticky="w")
+        catalogo = sections.standard_catalog()
+        perfiles_acero = catalogo.names[catalogo.families != "GL24h"].tolist()
+        ttk.Combobox(frame_miem, textvariable=self.perfil_arm, values=perfiles_acero, width=9).grid(row=0, column=5, padx=2, pady=1, sticky="ew")
+        ttk.Button(frame_miem, text="Agregar Miembro", command=self.agregar_miembro).grid(row=0, column=6, padx=5, pady=1, sticky="ew")
 
         frame_carga = ttk.LabelFrame(frame_arm, text="Cargas en Nodos", padding="5 5 5 5") # Ajustar padding
         frame_carga.pack(fill="x", pady=3) # Ajustar padding
@@ -1948,8 +1971,12 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         arm_buttons_frame.pack(fill="x", pady=5)
         arm_buttons_frame.columnconfigure(0, weight=1)
         arm_buttons_frame.columnconfigure(1, weight=1)
+        arm_buttons_frame.columnconfigure(2, weight=1)
         ttk.Button(arm_buttons_frame, text="Calcular Armadura", command=self.calcular_armadura).grid(row=0, column=0, padx=5, pady=5, sticky="ew")
-        ttk.Button(arm_buttons_frame, text="Instrucciones", command=self.mostrar_instrucciones_armadura).grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        ttk.Button(arm_buttons_frame, text="Optimizar Topología", command=self.optimizar_topologia_armadura).grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        ttk.Button(arm_buttons_frame, text="Instrucciones", command=self.mostrar_instrucciones_armadura).grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+        ttk.Button(arm_buttons_frame, text="Importar Tablas", command=self.importar_armadura).grid(row=1, column=0, padx=5, pady=5, sticky="ew")
+        ttk.Button(arm_buttons_frame, text="Caso Térmico", command=self.calcular_termica_armadura).grid(row=1, column=1, padx=5, pady=5, sticky="ew")
 
         self.canvas_armadura = tk.Canvas(frame_arm, bg="white", highlightbackground="gray", highlightthickness=1)
         self.canvas_armadura.pack(fill="both", expand=True, padx=5, pady=5)
@@ -1971,7 +1998,7 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         ttk.Entry(frame_nodo, textvariable=self.nodo_y_bast, width=8).grid(row=0, column=3, padx=2, pady=1, sticky="ew")
         ttk.Label(frame_nodo, text="Apoyo:").grid(row=0, column=4, padx=2, pady=1, sticky="w")
         self.nodo_apoyo_bast = ttk.Combobox(frame_nodo, textvariable=self.nodo_apoyo_bast,
-                     values=["Libre", "Fijo", "Móvil"], width=8)
+                     values=["Libre", "Fijo", "Móvil", "Empotrado"], width=8)
         self.nodo_apoyo_bast.grid(row=0, column=5, padx=2, pady=1, sticky="ew")
         self.nodo_apoyo_bast.set("Libre")
         ttk.Label(frame_nodo, text="Pasadores:").grid(row=0, column=6, padx=2, pady=1, sticky="w")
@@ -2028,7 +2055,9 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         bast_buttons_frame.pack(fill="x", pady=5)
         bast_buttons_frame.columnconfigure(0, weight=1)
         bast_buttons_frame.columnconfigure(1, weight=1)
+        bast_buttons_frame.columnconfigure(2, weight=1)
         ttk.Button(bast_buttons_frame, text="Calcular Bastidor", command=self.calcular_bastidor).grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        ttk.Button(bast_buttons_frame, text="Pórtico Rígido", command=self.calcular_portico_rigido).grid(row=0, column=2, padx=5, pady=5, sticky="ew")
 
         # Pequeños botones de ayuda y ejemplo
         frame_ayuda_bast = ttk.Frame(bast_buttons_frame)
@@ -2234,6 +2263,7 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         self.nodos_arm.append({'id': self.id_nodo_actual, 'x': x, 'y': y, 'apoyo': apoyo})
         self.log(f"Nodo {self.id_nodo_actual} agregado en ({x}, {y})\n", "data")
         self.id_nodo_actual += 1
+        self.deformada_arm = None
         self.dibujar_armadura()
 
     def agregar_miembro(self):
@@ -2243,8 +2273,14 @@ I_total = Σ(I_barra_i + A_i * d_i²)
             messagebox.showerror("Error", "Los nodos inicial y final deben existir.")
             return
 
-        self.miembros_arm.append({'inicio': ini, 'fin': fin, 'fuerza': 0.0})
-        self.log(f"Miembro {ini}-{fin} agregado\n", "data")
+        perfil = self.perfil_arm.get()
+        if perfil not in sections.standard_catalog():
+            messagebox.showerror("Error", f"Perfil desconocido: {perfil}")
+            return
+
+        self.miembros_arm.append({'inicio': ini, 'fin': fin, 'fuerza': 0.0, 'perfil': perfil})
+        self.log(f"Miembro {ini}-{fin} ({perfil}) agregado\n", "data")
+        self.deformada_arm = None
         self.dibujar_armadura()
 
     def agregar_carga_armadura(self):
@@ -2257,102 +2293,42 @@ I_total = Σ(I_barra_i + A_i * d_i²)
 
         self.cargas_arm.append({'nodo': nodo, 'Fx': fx, 'Fy': fy})
         self.log(f"Carga en nodo {nodo}: Fx={fx}, Fy={fy}\n", "data")
+        self.deformada_arm = None
         self.dibujar_armadura()
 
     def resolver_articulado(self, nodos, miembros, cargas):
         """Resuelve un conjunto de barras articuladas mediante el método de nodos."""
-        n_miembros = len(miembros)
-        var_map = {}
-        idx = 0
-        for i in range(n_miembros):
-            var_map[f"m{i}"] = idx
-            idx += 1
-
-        for nodo in nodos:
-            if nodo['apoyo'] == 'Fijo':
-                var_map[f"Rx{nodo['id']}"] = idx; idx += 1
-                var_map[f"Ry{nodo['id']}"] = idx; idx += 1
-            elif nodo['apoyo'] == 'Móvil':
-                var_map[f"Ry{nodo['id']}"] = idx; idx += 1
-
-        num_vars = idx
-        num_eqs = len(nodos) * 2
-
-        A = np.zeros((num_eqs, num_vars))
-        b = np.zeros(num_eqs)
+        return truss.resolver_articulado(nodos, miembros, cargas)
 
-        node_lookup = {n['id']: n for n in nodos}
-        loads = {n['id']: {'Fx': 0.0, 'Fy': 0.0} for n in nodos}
-        for c in cargas:
-            loads[c['nodo']]['Fx'] += c['Fx']
-            loads[c['nodo']]['Fy'] += c['Fy']
+    def diagnosticar_articulado(self, nodos, miembros, nombre):
+        """Comprueba estabilidad y grado de indeterminación antes de resolver.
 
-        eq = 0
-        for nodo in nodos:
-            for j, m in enumerate(miembros):
-                if m['inicio'] == nodo['id'] or m['fin'] == nodo['id']:
-                    n2_id = m['fin'] if m['inicio'] == nodo['id'] else m['inicio']
-                    nd1 = node_lookup[nodo['id']]
-                    nd2 = node_lookup[n2_id]
-                    dx = nd2['x'] - nd1['x']
-                    dy = nd2['y'] - nd1['y']
-                    L = (dx**2 + dy**2) ** 0.5
-                    if L == 0:
-                        continue
-                    cos_theta = dx / L
-                    if m['inicio'] == nodo['id']:
-                        A[eq, var_map[f"m{j}"]] += cos_theta
-                    else:
-                        A[eq, var_map[f"m{j}"]] -= cos_theta
-
-            if nodo['apoyo'] == 'Fijo':
-                A[eq, var_map[f"Rx{nodo['id']}"]] = 1
-
-            b[eq] = -loads[nodo['id']]['Fx']
-            eq += 1
-
-            for j, m in enumerate(miembros):
-                if m['inicio'] == nodo['id'] or m['fin'] == nodo['id']:
-                    n2_id = m['fin'] if m['inicio'] == nodo['id'] else m['inicio']
-                    nd1 = node_lookup[nodo['id']]
-                    nd2 = node_lookup[n2_id]
-                    dx = nd2['x'] - nd1['x']
-                    dy = nd2['y'] - nd1['y']
-                    L = (dx**2 + dy**2) ** 0.5
-                    if L == 0:
-                        continue
-                    sin_theta = dy / L
-                    if m['inicio'] == nodo['id']:
-                        A[eq, var_map[f"m{j}"]] += sin_theta
-                    else:
-                        A[eq, var_map[f"m{j}"]] -= sin_theta
-
-            if nodo['apoyo'] in ('Fijo', 'Móvil'):
-                A[eq, var_map[f"Ry{nodo['id']}"]] = 1
-
-            b[eq] = -loads[nodo['id']]['Fy']
-            eq += 1
-
-        if A.shape[0] != A.shape[1]:
-            soluciones, *_ = np.linalg.lstsq(A, b, rcond=None)
-        else:
-            try:
-                soluciones = np.linalg.solve(A, b)
-            except np.linalg.LinAlgError:
-                soluciones, *_ = np.linalg.lstsq(A, b, rcond=None)
-
-        fuerzas = [soluciones[var_map[f"m{i}"]] for i in range(n_miembros)]
-        reacciones = {}
-        for nodo in nodos:
-            if nodo['apoyo'] == 'Fijo':
-                rx = soluciones[var_map[f"Rx{nodo['id']}"]]
-                ry = soluciones[var_map[f"Ry{nodo['id']}"]]
-                reacciones[nodo['id']] = (rx, ry)
-            elif nodo['apoyo'] == 'Móvil':
-                ry = soluciones[var_map[f"Ry{nodo['id']}"]]
-                reacciones[nodo['id']] = (0.0, ry)
+        Devuelve el diagnóstico, o ``None`` si la estructura es un mecanismo
+        (en cuyo caso ya se informó al usuario).
+        """
+        modelo = truss.TrussModel.from_dicts(nodos, miembros)
+        diagnostico = truss.diagnose_truss(modelo)
+        if not diagnostico.is_stable:
+            ids = ", ".join(str(i) for i in modelo.node_ids[diagnostico.mechanism_nodes])
+            messagebox.showerror(
+                "Error",
+                f"{nombre} es inestable ({diagnostico.num_mechanisms} mecanismo(s)). "
+                f"Revise apoyos y miembros en los nodos: {ids}.",
+            )
+            return None
+        return diagnostico
 
-        return fuerzas, reacciones, num_vars, num_eqs
+    def advertir_indeterminacion(self, diagnostico, miembros, nombre):
+        if diagnostico.degree_of_indeterminacy > 0:
+            redundantes = ", ".join(
+                f"{miembros[j]['inicio']}-{miembros[j]['fin']}" for j in diagnostico.redundant_members
+            )
+            messagebox.showwarning(
+                "Advertencia",
+                f"{nombre}: estructura estáticamente indeterminada de grado {diagnostico.degree_of_indeterminacy} "
+                f"(miembros redundantes: {redundantes}). Las fuerzas se obtuvieron por el método de "
+                "rigidez suponiendo EA uniforme en todos los miembros.",
+            )
 
     def calcular_armadura(self):
         try:
@@ -2360,35 +2336,30 @@ I_total = Σ(I_barra_i + A_i * d_i²)
                 messagebox.showwarning("Advertencia", "Agrega nodos y miembros a la armadura primero.")
                 return
 
+            diagnostico = self.diagnosticar_articulado(self.nodos_arm, self.miembros_arm, "La armadura")
+            if diagnostico is None:
+                return
+
             fuerzas, reacciones, num_vars, num_eqs = self.resolver_articulado(
                 self.nodos_arm, self.miembros_arm, self.cargas_arm)
 
             for j, m in enumerate(self.miembros_arm):
                 m['fuerza'] = fuerzas[j]
 
-            self.reacciones_arm = reactions_from_solution
+            self.reacciones_arm = reacciones
+            self.deformada_arm = self.calcular_deformada_armadura()
 
             self.log(f"\n{'='*50}\n", "title")
             self.log("📐 ANÁLISIS DE ARMADURA:\n", "title")
             self.log(f"{'='*50}\n", "title")
-            for j, m in enumerate(self.miembros_arm):
-                tipo = "tensión" if m['fuerza'] >= 0 else "compresión"
-                self.log(f"Miembro {m['inicio']}-{m['fin']}: {m['fuerza']:.2f} N ({tipo})\n", "data")
-
-            for nid, r in self.reacciones_arm.items():
-                self.log(f"Reacciones nodo {nid}: Rx={r[0]:.2f} N, Ry={r[1]:.2f} N\n", "data")
+            self.log(self.resumen_fuerzas_armadura(np.asarray(fuerzas, dtype=float)), "data")
+            self.log("".join(f"Reacciones nodo {nid}: Rx={r[0]:.2f} N, Ry={r[1]:.2f} N\n"
+                             for nid, r in self.reacciones_arm.items()), "data")
+            self.log("🔩 VERIFICACIÓN DE PERFILES (esfuerzo y pandeo de Euler, sin coeficientes parciales):\n", "title")
+            self.log(self.verificacion_perfiles_armadura(np.asarray(fuerzas, dtype=float)), "data")
             
             # Check for static determinacy after setting self.reacciones_arm
-            if num_vars > num_eqs:
-                messagebox.showwarning(
-                    "Advertencia",
-                    "La armadura es estáticamente indeterminada. Puede que no tenga una solución única o sea inestable.",
-                )
-            elif num_vars < num_eqs:
-                messagebox.showwarning(
-                    "Advertencia",
-                    "La armadura es estáticamente sobredeterminada. Puede que no sea soluble con las condiciones dadas.",
-                )
+            self.advertir_indeterminacion(diagnostico, self.miembros_arm, "La armadura")
 
             self.dibujar_armadura()
 
@@ -2397,6 +2368,47 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         except Exception as e:
             messagebox.showerror("Error", f"Error en cálculo de armadura: {e}")
 
+    def resumen_fuerzas_armadura(self, fuerzas):
+        """Fuerzas de los miembros en un solo bloque de texto; resumidas si la armadura es grande."""
+        if len(self.miembros_arm) <= MIEMBROS_DETALLE:
+            return "".join(
+                f"Miembro {m['inicio']}-{m['fin']}: {f:.2f} N ({'tensión' if f >= 0 else 'compresión'})\n"
+                for m, f in zip(self.miembros_arm, fuerzas.tolist()))
+        tension, compresion = fuerzas >= 0, fuerzas < 0
+        return (
+            f"{fuerzas.size} miembros: {np.count_nonzero(tension)} en tensión "
+            f"(máx. {fuerzas.max(initial=0.0):.2f} N), {np.count_nonzero(compresion)} en compresión "
+            f"(máx. {-fuerzas.min(initial=0.0):.2f} N)\n"
+        )
+
+    def verificacion_perfiles_armadura(self, fuerzas):
+        """Tabla de los miembros más solicitados según su perfil."""
+        modelo = truss.TrussModel.from_dicts(self.nodos_arm, self.miembros_arm)
+        perfiles = [m.get('perfil', PERFIL_POR_DEFECTO) for m in self.miembros_arm]
+        chequeo = design.check_members(
+            fuerzas, modelo.member_lengths(),
+            design.MemberSections.from_catalog(sections.standard_catalog(), perfiles))
+        filas = [f"{'Miembro':>10} {'Perfil':>8} {'N [N]':>12} {'σ [MPa]':>9} {'KL/r':>7} {'Util.':>6}\n"]
+        for fila in chequeo.report(FILAS_VERIFICACION):
+            m = self.miembros_arm[fila['member']]
+            modo = " pandeo" if fila['buckling'] else ""
+            filas.append(
+                f"{str(m['inicio']) + '-' + str(m['fin']):>10} {perfiles[fila['member']]:>8} {fila['force']:>12.2f} "
+                f"{fila['stress'] / 1e6:>9.2f} {fila['slenderness']:>7.1f} {fila['utilisation']:>6.2f}{modo}\n")
+        fallan = chequeo.failing.size
+        filas.append(f"Miembros que no cumplen: {fallan} de {fuerzas.size}\n" if fallan
+                     else "Todos los miembros cumplen.\n")
+        return "".join(filas)
+
+    def calcular_deformada_armadura(self):
+        """Deformada amplificada de la armadura (EA por defecto), o None si no hay solución elástica."""
+        try:
+            modelo = truss.TrussModel.from_dicts(self.nodos_arm, self.miembros_arm, self.cargas_arm)
+            u = truss.solve_truss_stiffness(modelo).displacements
+        except Exception:
+            return None
+        return deformed.truss_deformed_shape(modelo, u, scale=deformed.amplification_factor(modelo.coordinates, u))
+
     def ajustar_vista_armadura(self):
         """Calcula la escala y desplazamiento para dibujar la armadura dentro del canvas."""
         if not hasattr(self, 'canvas_armadura') or not self.nodos_arm:
@@ -2441,11 +2453,17 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         self.ajustar_vista_armadura()
         c.delete('all')
 
-        for nodo in self.nodos_arm:
-            x = nodo['x'] * self.escala_arm + self.offset_x_arm
-            y = self.offset_y_arm - nodo['y'] * self.escala_arm
+        coords, extremos, indice = rendering.structure_arrays(self.nodos_arm, self.miembros_arm)
+        pantalla = coords * [self.escala_arm, -self.escala_arm] + [self.offset_x_arm, self.offset_y_arm]
+        # El lienzo no agrupa elementos: las etiquetas se limitan a las que caben (nivel de detalle)
+        vista = (0, c.winfo_width() if c.winfo_width() > 1 else int(c['width']),
+                 0, c.winfo_height() if c.winfo_height() > 1 else int(c['height']))
+
+        con_id = rendering.label_mask(pantalla, vista)
+        for nodo, (x, y), etiqueta in zip(self.nodos_arm, pantalla.tolist(), con_id):
             c.create_oval(x-5, y-5, x+5, y+5, fill='black', tags="nodo")
-            c.create_text(x, y-10, text=str(nodo['id']), fill='black', tags="nodo_id")
+            if etiqueta:
+                c.create_text(x, y-10, text=str(nodo['id']), fill='black', tags="nodo_id")
 
             if nodo['apoyo'] == 'Fijo':
                 c.create_polygon(x-10, y+10, x+10, y+10, x, y, fill='blue', outline='blue', tags="apoyo")
@@ -2458,31 +2476,27 @@ I_total = Σ(I_barra_i + A_i * d_i²)
                 for i in range(-1, 2):
                     c.create_line(x + i*5, y + 20, x + i*5 + 5, y + 25, fill='gray', tags="apoyo")
 
-        for m in self.miembros_arm:
-            n1 = next(n for n in self.nodos_arm if n['id']==m['inicio'])
-            n2 = next(n for n in self.nodos_arm if n['id']==m['fin'])
-
-            x1 = n1['x'] * self.escala_arm + self.offset_x_arm
-            y1 = self.offset_y_arm - n1['y'] * self.escala_arm
-            x2 = n2['x'] * self.escala_arm + self.offset_x_arm
-            y2 = self.offset_y_arm - n2['y'] * self.escala_arm
-
-            color = 'black'
-            if 'fuerza' in m:
-                color = 'red' if m['fuerza'] < 0 else 'blue'
-
-            c.create_line(x1, y1, x2, y2, fill=color, width=2, tags="miembro")
-
-            if 'fuerza' in m:
-                mid_x = (x1+x2)/2
-                mid_y = (y1+y2)/2
-                c.create_text(mid_x, mid_y, text=f"{m['fuerza']:.1f} N", fill=color, font=("Arial", 8, "bold"), tags="miembro_fuerza")
+        if len(extremos):
+            fuerzas = np.array([m.get('fuerza', 0.0) for m in self.miembros_arm], dtype=float)
+            colores = rendering.hex_colors(rendering.force_colors(fuerzas))
+            segmentos = pantalla[extremos]
+            medios = segmentos.mean(axis=1)
+            con_fuerza = rendering.label_mask(medios, vista)
+            for linea, color in zip(segmentos.reshape(-1, 4).tolist(), colores):
+                c.create_line(*linea, fill=color, width=2, tags="miembro")
+            for j in np.flatnonzero(con_fuerza):
+                c.create_text(medios[j, 0], medios[j, 1], text=f"{fuerzas[j]:.1f} N", fill=colores[j],
+                              font=("Arial", 8, "bold"), tags="miembro_fuerza")
+
+        deformada = self.deformada_arm
+        if deformada is not None and len(deformada) == len(self.miembros_arm):
+            puntos = deformada * [self.escala_arm, -self.escala_arm] + [self.offset_x_arm, self.offset_y_arm]
+            for linea in puntos.reshape(len(puntos), -1).tolist():
+                c.create_line(*linea, fill='gray', dash=(4, 2), tags="deformada")
 
         arrow_len = 20
         for carg in self.cargas_arm:
-            nodo = next(n for n in self.nodos_arm if n['id']==carg['nodo'])
-            x = nodo['x'] * self.escala_arm + self.offset_x_arm
-            y = self.offset_y_arm - nodo['y'] * self.escala_arm
+            x, y = pantalla[indice[carg['nodo']]]
 
             fx = carg['Fx']
             fy = carg['Fy']
@@ -2495,7 +2509,7 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         if hasattr(self, 'reacciones_arm'):
             reaction_arrow_len = 25
             for nodo in self.nodos_arm:
-                if nodo['apoyo'] in ('Fijo', 'Móvil'):
+                if nodo['apoyo'] in ('Fijo', 'Móvil') or 'restricciones' in nodo:
                     if nodo['id'] in self.reacciones_arm:
                         rx, ry = self.reacciones_arm[nodo['id']]
                         x_node = nodo['x'] * self.escala_arm + self.offset_x_arm
@@ -2564,7 +2578,7 @@ I_total = Σ(I_barra_i + A_i * d_i²)
                              label=f"Carga: {mag:.1f} N")
                     ax.text(ux*arrow_len*1.1, uy*arrow_len*1.1, f"{mag:.1f}", color='green', ha='center', va='center')
 
-        if nodo['apoyo'] in ('Fijo','Móvil') and hasattr(self,'reacciones_arm'):
+        if (nodo['apoyo'] in ('Fijo','Móvil') or 'restricciones' in nodo) and hasattr(self,'reacciones_arm'):
             if nodo['id'] in self.reacciones_arm:
                 rx, ry = self.reacciones_arm[nodo['id']]
 
@@ -2596,17 +2610,8 @@ I_total = Σ(I_barra_i + A_i * d_i²)
             messagebox.showwarning("Advertencia", "Calcule primero la armadura para aplicar el método de secciones.")
             return
 
-        node_lookup = {n['id']: n for n in self.nodos_arm}
-        miembros_corte = []
-
-        for m in self.miembros_arm:
-            n1 = node_lookup[m['inicio']]
-            n2 = node_lookup[m['fin']]
-            p1 = n1['x'] if eje == 'x' else n1['y']
-            p2 = n2['x'] if eje == 'x' else n2['y']
-
-            if (p1 < corte < p2) or (p2 < corte < p1) or p1 == corte or p2 == corte:
-                miembros_corte.append(m)
+        posiciones = cuts.miembros_cortados(self.nodos_arm, self.miembros_arm, corte, eje)
+        miembros_corte = [self.miembros_arm[j] for j in posiciones]
 
         if not miembros_corte:
             messagebox.showinfo("Sección", "Ningún miembro intersecta el corte especificado.")
@@ -2622,109 +2627,179 @@ I_total = Σ(I_barra_i + A_i * d_i²)
 
         self.dibujar_dcl_seccion(corte, miembros_corte, eje)
 
+    def _dibujar_dcl_seccion_mpl(self, ax, nodos, miembros, cargas, reacciones, corte, miembros_corte, eje,
+                                 flecha, fondo=None, ids=False):
+        """DCL de la parte con coordenada <= corte: un artista por grupo (miembros, nodos, cargas,
+        reacciones, fuerzas del corte) y etiquetas con nivel de detalle."""
+        eje_idx = 0 if eje == 'x' else 1
+        coords, extremos, indice = rendering.structure_arrays(nodos, miembros)
+        estilo = dict(fontsize=7, ha='center', va='center', bbox=fondo)
+        etiquetas = []
+
+        if eje_idx == 0:
+            ax.axvline(corte, color='red', linestyle='--', linewidth=2, label=f'Corte en X={corte:.2f}')
+        else:
+            ax.axhline(corte, color='red', linestyle='--', linewidth=2, label=f'Corte en Y={corte:.2f}')
+
+        lado = coords[:, eje_idx] <= corte
+        if len(extremos):
+            ax.add_collection(LineCollection(coords[extremos[lado[extremos].all(axis=1)]],
+                                             colors='black', linewidths=1.5, alpha=0.7))
+        puntos = coords[lado]
+        if len(puntos):
+            ax.plot(puntos[:, 0], puntos[:, 1], 'ko', markersize=6, linestyle='none')
+            if ids:
+                etiquetas.append((puntos + [0.0, 0.2], [str(n['id']) for n, v in zip(nodos, lado) if v], 'black',
+                                  dict(fontsize=8, ha='center', va='bottom')))
+
+        cargas_lado = [carg for carg in cargas if lado[indice[carg['nodo']]]]
+        if cargas_lado:
+            vectores = np.array([(carg['Fx'], carg['Fy']) for carg in cargas_lado], dtype=float)
+            origenes, flechas, visibles = rendering.arrow_field(
+                coords[[indice[carg['nodo']] for carg in cargas_lado]], vectores, flecha)
+            self._flechas(ax, origenes, flechas, 'green')
+            etiquetas.append((origenes + flechas * 1.1,
+                              [f"{m:.1f}" for m in np.linalg.norm(vectores[visibles], axis=1)], 'green', estilo))
+
+        reacciones_lado = {i: r for i, r in reacciones.items() if i in indice and lado[indice[i]]}
+        origenes, flechas, textos = self._flechas_reaccion(coords, indice, reacciones_lado, flecha, 0.01)
+        self._flechas(ax, origenes, flechas, 'orange')
+        etiquetas.append((origenes + flechas * 1.1, textos, 'orange', estilo))
+
+        if miembros_corte:
+            cortados = np.array([(indice[m['inicio']], indice[m['fin']]) for m in miembros_corte], dtype=int)
+            fuerzas = np.array([m.get('fuerza', 0.0) for m in miembros_corte], dtype=float)
+            # Tensión en el sentido inicio→fin del miembro, compresión en el contrario
+            direcciones = (coords[cortados[:, 1]] - coords[cortados[:, 0]]) * np.where(fuerzas >= 0, 1.0, -1.0)[:, None]
+            origenes, flechas, visibles = rendering.arrow_field(
+                rendering.section_cut_points(coords, cortados, corte, eje_idx), direcciones, flecha)
+            colores = rendering.force_colors(fuerzas)[visibles]
+            self._flechas(ax, origenes, flechas, colores)
+            etiquetas.append((origenes + flechas * 1.1, [f"{abs(f):.1f}" for f in fuerzas[visibles]], colores, estilo))
+
+        ax.set_aspect('equal', adjustable='box')
+        ax.autoscale_view()
+        ax.margins(0.2)
+        for posiciones, textos, colores, estilo_etiqueta in etiquetas:
+            self._etiquetas_nivel_detalle(ax, posiciones, textos, colores, **estilo_etiqueta)
+
     def dibujar_dcl_seccion(self, corte, miembros, eje):
         ventana = tk.Toplevel(self.root)
         ventana.title("DCL Sección")
         fig, ax = plt.subplots(figsize=(6,4))
         plt.style.use("seaborn-v0_8-whitegrid")
-        node_lookup = {n['id']: n for n in self.nodos_arm}
-        arrow_len = 0.8
-        if eje == 'x':
-            for m in self.miembros_arm:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-                if n1['x'] <= corte and n2['x'] <= corte:
-                    ax.plot([n1['x'], n2['x']], [n1['y'], n2['y']], 'k-')
-            for nodo in self.nodos_arm:
-                if nodo['x'] <= corte:
-                    ax.plot(nodo['x'], nodo['y'], 'ko')
-                    for c in self.cargas_arm:
-                        if c['nodo'] == nodo['id']:
-                            mag = np.hypot(c['Fx'], c['Fy'])
-                            if mag:
-                                ux, uy = c['Fx']/mag, -c['Fy']/mag
-                                ax.arrow(nodo['x'], nodo['y'], ux*arrow_len, uy*arrow_len, color='green', head_width=0.1, length_includes_head=True)
-                                ax.text(nodo['x']+ux*arrow_len, nodo['y']+uy*arrow_len, f"{mag:.1f}", color='green')
-                    if nodo['apoyo'] in ('Fijo','Móvil') and hasattr(self,'reacciones_arm'):
-                        rx, ry = self.reacciones_arm.get(nodo['id'], (0,0))
-                        if abs(rx) > 0:
-                            signx = 1 if rx >= 0 else -1
-                            ax.arrow(nodo['x'], nodo['y'], signx*arrow_len, 0,
-                                     color='orange', head_width=0.1,
-                                     length_includes_head=True)
-                            ax.text(nodo['x'] + signx*arrow_len, nodo['y'] + 0.05,
-                                    f"Rx={rx:.1f}", color='orange', ha='center',
-                                    va='bottom')
-                        if abs(ry) > 0:
-                            signy = 1 if ry >= 0 else -1
-                            ax.arrow(nodo['x'], nodo['y'], 0, signy*arrow_len,
-                                     color='orange', head_width=0.1,
-                                     length_includes_head=True)
-                            ax.text(0.1, nodo['y'] + signy*arrow_len,
-                                    f"Ry={ry:.1f}", color='orange', ha='left',
-                                    va='bottom' if signy > 0 else 'top')
-            ax.axvline(corte, color='red', linestyle='--')
-            for m in miembros:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-                t = (corte - n1['x'])/(n2['x']-n1['x'])
-                ycut = n1['y'] + t*(n2['y']-n1['y'])
-                fuerza = m.get('fuerza',0)
-                sign = 1 if fuerza>=0 else -1
-                ax.arrow(corte, ycut, 0, sign*arrow_len, color='purple', head_width=0.1, length_includes_head=True)
-                ax.text(corte, ycut+sign*arrow_len, f"{fuerza:.1f}", color='purple')
-        else:
-            for m in self.miembros_arm:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-                if n1['y'] <= corte and n2['y'] <= corte:
-                    ax.plot([n1['x'], n2['x']], [n1['y'], n2['y']], 'k-')
-            for nodo in self.nodos_arm:
-                if nodo['y'] <= corte:
-                    ax.plot(nodo['x'], nodo['y'], 'ko')
-                    for c in self.cargas_arm:
-                        if c['nodo'] == nodo['id']:
-                            mag = np.hypot(c['Fx'], c['Fy'])
-                            if mag:
-                                ux, uy = c['Fx']/mag, -c['Fy']/mag
-                                ax.arrow(nodo['x'], nodo['y'], ux*arrow_len, uy*arrow_len, color='green', head_width=0.1, length_includes_head=True)
-                                ax.text(nodo['x']+ux*arrow_len, nodo['y']+uy*arrow_len, f"{mag:.1f}", color='green')
-                    if nodo['apoyo'] in ('Fijo','Móvil') and hasattr(self,'reacciones_arm'):
-                        rx, ry = self.reacciones_arm.get(nodo['id'], (0,0))
-                        if abs(rx) > 0:
-                            signx = 1 if rx >= 0 else -1
-                            ax.arrow(nodo['x'], nodo['y'], signx*arrow_len, 0,
-                                     color='orange', head_width=0.1,
-                                     length_includes_head=True)
-                            ax.text(nodo['x'] + signx*arrow_len, nodo['y'] + 0.05,
-                                    f"Rx={rx:.1f}", color='orange', ha='center',
-                                    va='bottom')
-                        if abs(ry) > 0:
-                            signy = 1 if ry >= 0 else -1
-                            ax.arrow(nodo['x'], nodo['y'], 0, signy*arrow_len,
-                                     color='orange', head_width=0.1,
-                                     length_includes_head=True)
-                            ax.text(0.1, (1 if ry > 0 else -1)*arrow_len*1.1,f"{abs(ry):.1f}",color='orange',ha='center',va='center')
-            ax.axhline(corte, color='red', linestyle='--')
-            for m in miembros:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-                t = (corte - n1['y'])/(n2['y']-n1['y'])
-                xcut = n1['x'] + t*(n2['x']-n1['x'])
-                fuerza = m.get('fuerza',0)
-                sign = 1 if fuerza>=0 else -1
-                ax.arrow(xcut, corte, sign*arrow_len, 0, color='purple', head_width=0.1, length_includes_head=True)
-                ax.text(xcut+sign*arrow_len, corte, f"{fuerza:.1f}", color='purple')
-        ax.set_aspect('equal')
+        self._dibujar_dcl_seccion_mpl(ax, self.nodos_arm, self.miembros_arm, self.cargas_arm,
+                                      getattr(self, 'reacciones_arm', {}), corte, miembros, eje, 0.8)
         ax.set_xlabel('x')
         ax.set_ylabel('y')
         ax.set_title('Diagrama de Cuerpo Libre de la Sección')
-        ax.margins(0.2)
         plt.tight_layout()
         canvas = FigureCanvasTkAgg(fig, master=ventana)
         canvas.draw()
         canvas.get_tk_widget().pack(fill='both', expand=True)
 
+    def calcular_termica_armadura(self):
+        """Fuerzas por un cambio uniforme de temperatura, con α y ΔT de la pestaña de deformación térmica.
+
+        La rigidez EA de cada miembro sale de su perfil, ya que las fuerzas
+        térmicas de una armadura hiperestática dependen de ella.
+        """
+        if not self.nodos_arm or not self.miembros_arm:
+            messagebox.showwarning("Advertencia", "Agrega nodos y miembros a la armadura primero.")
+            return
+        alfa, delta_t = self.coef_expansion.get(), self.cambio_temperatura.get()
+        try:
+            catalogo = sections.standard_catalog()
+            filas = [catalogo.index_of(m.get('perfil', PERFIL_POR_DEFECTO)) for m in self.miembros_arm]
+            base = truss.TrussModel.from_dicts(self.nodos_arm, self.miembros_arm)
+            modelo = truss.TrussModel.from_arrays(
+                base.coordinates, base.members, base.restraints, node_ids=base.node_ids,
+                axial_stiffness=catalogo.elastic_modulus[filas] * catalogo.area[filas])
+            resultado = truss.TrussSystem(modelo, strategy="stiffness").solve_imposed(
+                elongations=truss.thermal_elongations(modelo, alfa, delta_t))
+        except (truss.TrussComputationError, np.linalg.LinAlgError, KeyError) as e:
+            messagebox.showerror("Error", f"No se pudo resolver el caso térmico: {e}")
+            return
+
+        self.log(f"\n{'='*50}\n", "title")
+        self.log(f"🌡️ CASO TÉRMICO (α = {alfa:g} 1/°C, ΔT = {delta_t:g} °C):\n", "title")
+        self.log(self.resumen_fuerzas_armadura(resultado.forces[:, 0]), "data")
+        reacciones = resultado.reactions[0]
+        self.log("".join(
+            f"Reacciones nodo {modelo.node_ids[i]}: Rx={reacciones[i, 0]:.2f} N, Ry={reacciones[i, 1]:.2f} N\n"
+            for i in np.flatnonzero(modelo.restraints.any(axis=1))), "data")
+
+    def importar_armadura(self):
+        """Carga la armadura desde las tablas nodos, miembros, apoyos y cargas (.csv o .jsonl) de una carpeta."""
+        carpeta = filedialog.askdirectory(title="Carpeta con las tablas de la armadura")
+        if not carpeta:
+            return
+        rutas = {}
+        for tabla in ("nodos", "miembros", "apoyos", "cargas"):
+            for extension in tablas_io.CSV_SUFFIXES + tablas_io.JSONL_SUFFIXES:
+                ruta = os.path.join(carpeta, tabla + extension)
+                if os.path.exists(ruta):
+                    rutas[tabla] = ruta
+                    break
+        if "nodos" not in rutas or "miembros" not in rutas:
+            messagebox.showerror("Error", "La carpeta debe contener al menos nodos.csv y miembros.csv (o .jsonl).")
+            return
+        try:
+            modelo = tablas_io.read_truss(rutas["nodos"], rutas["miembros"], rutas.get("apoyos"), rutas.get("cargas"))
+        except (tablas_io.ModelImportError, truss.TrussComputationError, OSError) as e:
+            messagebox.showerror("Error", f"No se pudieron importar las tablas: {e}")
+            return
+        if modelo.dim != 2:
+            messagebox.showerror("Error", "Las tablas describen una armadura espacial; esta pestaña solo admite "
+                                 "armaduras planas (sin columna z).")
+            return
+
+        nodos, miembros, cargas = modelo.to_dicts()
+        for nodo in nodos:
+            # Un rodillo solo en x no tiene nombre de apoyo: conserva sus
+            # 'restricciones', que prevalecen sobre 'apoyo' en el cálculo.
+            nodo.setdefault('apoyo', 'Libre')
+        self.nodos_arm[:] = nodos
+        self.miembros_arm[:] = miembros
+        self.cargas_arm[:] = cargas
+        self.reacciones_arm = {}
+        self.deformada_arm = None
+        numericos = [n['id'] for n in nodos if isinstance(n['id'], int)]
+        self.id_nodo_actual = max(numericos, default=len(nodos)) + 1
+        self.log(f"Importados {len(nodos)} nodos, {len(miembros)} miembros y {len(cargas)} nodos cargados "
+                 f"desde {carpeta}\n", "data")
+        self.dibujar_armadura()
+
+    def optimizar_topologia_armadura(self):
+        """Reemplaza los miembros por la armadura de volumen mínimo entre los nodos dados."""
+        if not self.nodos_arm or not self.cargas_arm:
+            messagebox.showwarning("Advertencia", "Agrega nodos, apoyos y cargas antes de optimizar la topología.")
+            return
+        try:
+            modelo = truss.TrussModel.from_dicts(self.nodos_arm, [], self.cargas_arm)
+            base = layout.ground_structure(
+                modelo.coordinates, modelo.restraints, modelo.loads, node_ids=modelo.node_ids)
+            resultado = layout.optimise_layout(base)
+            optima = resultado.layout()
+        except truss.TrussComputationError as e:
+            messagebox.showerror("Error", f"No se pudo optimizar la topología: {e}")
+            return
+
+        ids = optima.node_ids.tolist()
+        usados = set(ids)
+        self.nodos_arm[:] = [n for n in self.nodos_arm if n['id'] in usados]
+        self.miembros_arm[:] = [
+            {'inicio': ids[a], 'fin': ids[b], 'fuerza': 0.0} for a, b in optima.members.tolist()]
+        self.deformada_arm = None
+
+        self.log(f"\n{'='*50}\n", "title")
+        self.log("🧬 OPTIMIZACIÓN DE TOPOLOGÍA:\n", "title")
+        estado = "convergió" if resultado.converged else "no alcanzó la tolerancia"
+        self.log(f"{base.num_members} miembros candidatos, {len(self.miembros_arm)} en la armadura óptima; "
+                 f"{estado} en {resultado.iterations} iteraciones.\n", "data")
+        self.log(f"Volumen mínimo (σ = 1): {resultado.volume:.4f}\n", "data")
+        self.calcular_armadura()
+
     def mostrar_instrucciones_armadura(self):
         texto = (
             "PASOS PARA ANALIZAR UNA ARMADURA:\n"
@@ -2738,7 +2813,13 @@ I_total = Σ(I_barra_i + A_i * d_i²)
             "   Las barras en rojo están en compresión y en azul en tensión.\n"
             "   Las reacciones se muestran en naranja en los apoyos.\n"
             "5. Use 'DCL Nodos' para ver el diagrama de cuerpo libre de cada nodo.\n"
-            "6. Use 'Método de Secciones' para analizar las fuerzas en un corte específico."
+            "6. Use 'Método de Secciones' para analizar las fuerzas en un corte específico.\n"
+            "7. 'Optimizar Topología' une todos los nodos con miembros candidatos y conserva solo\n"
+            "   los de la armadura de menor volumen que soporta las cargas (con apoyos y cargas definidos).\n"
+            "8. 'Importar Tablas' carga una carpeta con nodos, miembros, apoyos y cargas en CSV o JSON-lines\n"
+            "   (columnas id,x,y / inicio,fin / nodo,apoyo / nodo,Fx,Fy).\n"
+            "9. 'Caso Térmico' calcula las fuerzas por un cambio uniforme de temperatura usando α y ΔT\n"
+            "   de la pestaña de deformación térmica y la rigidez EA de los perfiles."
         )
         messagebox.showinfo("Instrucciones Armaduras", texto)
 
@@ -2751,6 +2832,8 @@ I_total = Σ(I_barra_i + A_i * d_i²)
                                 'apoyo': apoyo, 'pasadores': pas})
         self.log(f"Nodo {self.id_nodo_bast} agregado en ({x}, {y}) con {pas} pasadores\n", "data")
         self.id_nodo_bast += 1
+        self.resultantes_bast = {}
+        self.deformada_bast = None
         self.dibujar_bastidor()
 
     def agregar_miembro_bastidor(self):
@@ -2762,6 +2845,8 @@ I_total = Σ(I_barra_i + A_i * d_i²)
 
         self.miembros_bast.append({'inicio': ini, 'fin': fin, 'fuerza': 0.0})
         self.log(f"Miembro {ini}-{fin} agregado\n", "data")
+        self.resultantes_bast = {}
+        self.deformada_bast = None
         self.dibujar_bastidor()
 
     def agregar_carga_bastidor(self):
@@ -2773,6 +2858,8 @@ I_total = Σ(I_barra_i + A_i * d_i²)
             return
         self.cargas_bast.append({'nodo': nodo, 'Fx': fx, 'Fy': fy})
         self.log(f"Carga en nodo {nodo}: Fx={fx}, Fy={fy}\n", "data")
+        self.resultantes_bast = {}
+        self.deformada_bast = None
         self.dibujar_bastidor()
 
     def cargar_ejemplo_bastidor(self):
@@ -2782,6 +2869,8 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         self.miembros_bast.clear()
         self.cargas_bast.clear()
         self.id_nodo_bast = 1
+        self.resultantes_bast = {}
+        self.deformada_bast = None
 
         # Definir nodos (portal simple)
         self.nodos_bast.append({'id': 1, 'x': 0.0, 'y': 0.0,
@@ -2813,24 +2902,20 @@ I_total = Σ(I_barra_i + A_i * d_i²)
                 messagebox.showwarning("Advertencia", "Agrega nodos y miembros a la bastidor primero.")
                 return
 
+            diagnostico = self.diagnosticar_articulado(self.nodos_bast, self.miembros_bast, "El bastidor")
+            if diagnostico is None:
+                return
+
             fuerzas, reacciones, num_vars, num_eqs = self.resolver_articulado(
                 self.nodos_bast, self.miembros_bast, self.cargas_bast)
 
-            if num_vars > num_eqs:
-                messagebox.showwarning(
-                    "Advertencia",
-                    "El bastidor es estáticamente indeterminada. Puede que no tenga una solución única o sea inestable.",
-                )
-            elif num_vars < num_eqs:
-                messagebox.showwarning(
-                    "Advertencia",
-                    "El bastidor es estáticamente sobredeterminada. Puede que no sea soluble con las condiciones dadas.",
-                )
+            self.advertir_indeterminacion(diagnostico, self.miembros_bast, "El bastidor")
 
             for j, m in enumerate(self.miembros_bast):
                 m['fuerza'] = fuerzas[j]
 
             self.reacciones_bast = reacciones
+            self.deformada_bast = None
 
             self.log(f"\n{'='*50}\n", "title")
             self.log("📐 ANÁLISIS DE BASTIDOR:\n", "title")
@@ -2842,6 +2927,8 @@ I_total = Σ(I_barra_i + A_i * d_i²)
             for nid, r in self.reacciones_bast.items():
                 self.log(f"Reacciones nodo {nid}: Rx={r[0]:.2f} N, Ry={r[1]:.2f} N\n", "data")
 
+            self.resultantes_bast = truss.resultantes_nodales(self.nodos_bast, self.miembros_bast)
+
             self.dibujar_bastidor()
 
             # Mostrar fuerzas resultantes en cada nodo y por pasador
@@ -2852,6 +2939,36 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         except Exception as e:
             messagebox.showerror("Error", f"Error en cálculo de bastidor: {e}")
 
+    def calcular_portico_rigido(self):
+        """Analiza el bastidor con uniones rígidas: esfuerzos N, V y M en los extremos."""
+        if not self.nodos_bast or not self.miembros_bast:
+            messagebox.showwarning("Advertencia", "Agrega nodos y miembros a la bastidor primero.")
+            return
+        try:
+            modelo = frame.FrameModel.from_dicts(self.nodos_bast, self.miembros_bast, self.cargas_bast)
+            solucion = frame.solve_frame(modelo)
+        except np.linalg.LinAlgError as e:
+            messagebox.showerror("Error de Cálculo", f"El pórtico es inestable: {e}. Revise los apoyos.")
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en cálculo de pórtico: {e}")
+            return
+
+        lineas = [f"\n{'='*50}\n", "📐 PÓRTICO RÍGIDO (N, V, M en extremos):\n", f"{'='*50}\n"]
+        for m, (N1, V1, M1, N2, V2, M2) in zip(self.miembros_bast, solucion.end_forces):
+            lineas.append(
+                f"Miembro {m['inicio']}-{m['fin']}: N={-N1:.2f} N, V={V1:.2f}/{-V2:.2f} N, "
+                f"M={-M1:.2f}/{M2:.2f} N·m\n"
+            )
+        for i in np.flatnonzero(modelo.restraints.any(axis=1)):
+            rx, ry, mz = solucion.reactions[i]
+            lineas.append(f"Reacciones nodo {modelo.node_ids[i]}: Rx={rx:.2f} N, Ry={ry:.2f} N, Mz={mz:.2f} N·m\n")
+        self.log("".join(lineas), "data")
+
+        escala = deformed.amplification_factor(modelo.coordinates, solucion.displacements)
+        self.deformada_bast = deformed.frame_deformed_shape(modelo, solucion, scale=escala)
+        self.dibujar_bastidor()
+
     def calcular_fuerza_nodo_bastidor(self):
         """Calcula y muestra la suma de fuerzas en un nodo específico."""
         nodo_id = self.nodo_fuerza_bast.get()
@@ -2864,39 +2981,12 @@ I_total = Σ(I_barra_i + A_i * d_i²)
             messagebox.showerror("Error", "El nodo seleccionado no existe.")
             return
 
-        node_lookup = {n['id']: n for n in self.nodos_bast}
-        fx_total = 0.0
-        fy_total = 0.0
-
-        for c in self.cargas_bast:
-            if c['nodo'] == nodo_id:
-                fx_total += c['Fx']
-                fy_total += c['Fy']
-
-        if nodo_id in self.reacciones_bast:
-            rx, ry = self.reacciones_bast[nodo_id]
-            fx_total += rx
-            fy_total += ry
-
-        for m in self.miembros_bast:
-            if m['inicio'] == nodo_id or m['fin'] == nodo_id:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-                dx = n2['x'] - n1['x']
-                dy = n2['y'] - n1['y']
-                L = (dx**2 + dy**2) ** 0.5
-                if L == 0:
-                    continue
-                ux = dx / L
-                uy = dy / L
-                sign = 1 if m['fin'] == nodo_id else -1
-                fx_total += sign * m['fuerza'] * ux
-                fy_total += sign * m['fuerza'] * uy
-
+        fx_total, fy_total = self.obtener_fuerzas_nodo_bastidor(nodo_id)
         self.log(f"\nFuerzas en nodo {nodo_id}: Fx={fx_total:.2f} N, Fy={fy_total:.2f} N\n", "data")
 
         total = (fx_total ** 2 + fy_total ** 2) ** 0.5
-        n_pas = node_lookup[nodo_id].get('pasadores', 1)
+        nodo = next(n for n in self.nodos_bast if n['id'] == nodo_id)
+        n_pas = nodo.get('pasadores', 1)
         if n_pas <= 0:
             n_pas = 1
         fuerza_pasador = total / n_pas
@@ -2904,47 +2994,25 @@ I_total = Σ(I_barra_i + A_i * d_i²)
 
     def obtener_fuerzas_nodo_bastidor(self, nodo_id):
         """Devuelve la resultante Fx,Fy en un nodo del bastidor."""
-        node_lookup = {n['id']: n for n in self.nodos_bast}
-        fx_total = 0.0
-        fy_total = 0.0
-        for c in self.cargas_bast:
-            if c['nodo'] == nodo_id:
-                fx_total += c['Fx']
-                fy_total += c['Fy']
-
-        if nodo_id in self.reacciones_bast:
-            rx, ry = self.reacciones_bast[nodo_id]
-            fx_total += rx
-            fy_total += ry
-
-        for m in self.miembros_bast:
-            if m['inicio'] == nodo_id or m['fin'] == nodo_id:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-                dx = n2['x'] - n1['x']
-                dy = n2['y'] - n1['y']
-                L = (dx**2 + dy**2) ** 0.5
-                if L == 0:
-                    continue
-                ux = dx / L
-                uy = dy / L
-                sign = 1 if m['fin'] == nodo_id else -1
-                fx_total += sign * m['fuerza'] * ux
-                fy_total += sign * m['fuerza'] * uy
-
-        return fx_total, fy_total
+        resultantes = getattr(self, 'resultantes_bast', {})
+        if nodo_id not in resultantes:
+            # Tabla invalidada por una edición: se recalculan todas a la vez.
+            resultantes = self.resultantes_bast = truss.resultantes_nodales(self.nodos_bast, self.miembros_bast)
+        return resultantes[nodo_id]
 
     def mostrar_fuerzas_pasadores(self):
         """Muestra en el registro las fuerzas en cada nodo y por pasador."""
+        lineas = []
         for nodo in self.nodos_bast:
             fx, fy = self.obtener_fuerzas_nodo_bastidor(nodo['id'])
-            self.log(f"Fuerzas en nodo {nodo['id']}: Fx={fx:.2f} N, Fy={fy:.2f} N\n", "data")
             total = (fx**2 + fy**2) ** 0.5
             n_pas = nodo.get('pasadores', 1)
             if n_pas <= 0:
                 n_pas = 1
-            fuerza_pasador = total / n_pas
-            self.log(f"Fuerza por pasador ({n_pas}): {fuerza_pasador:.2f} N\n", "data")
+            lineas.append(f"Fuerzas en nodo {nodo['id']}: Fx={fx:.2f} N, Fy={fy:.2f} N\n")
+            lineas.append(f"Fuerza por pasador ({n_pas}): {total / n_pas:.2f} N\n")
+        # Un único insert en el registro en lugar de dos por nodo.
+        self.log("".join(lineas), "data")
 
     def ajustar_vista_bastidor(self):
         if not hasattr(self, 'canvas_bastidor') or not self.nodos_bast:
@@ -2980,6 +3048,46 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         self.offset_x_bast = margin - min_x * self.escala_bast + (width - 2 * margin - rango_x * self.escala_bast) / 2
         self.offset_y_bast = height - margin + min_y * self.escala_bast - (height - 2 * margin - rango_y * self.escala_bast) / 2
 
+    def _etiquetas_nivel_detalle(self, ax, posiciones, textos, colores, **estilo):
+        """Etiquetas que se recalculan al cambiar la vista: sólo las que caben (rendering.label_mask)."""
+        posiciones = np.asarray(posiciones, dtype=float).reshape(-1, 2)
+        if not len(posiciones):
+            return
+        dibujadas = []
+
+        def actualizar(_ax=None):
+            for texto in dibujadas:
+                texto.remove()
+            dibujadas.clear()
+            for i in np.flatnonzero(rendering.label_mask(posiciones, (*ax.get_xlim(), *ax.get_ylim()))):
+                color = colores if isinstance(colores, str) else colores[i]
+                dibujadas.append(ax.text(posiciones[i, 0], posiciones[i, 1], textos[i], color=color, **estilo))
+
+        ax.callbacks.connect('xlim_changed', actualizar)
+        ax.callbacks.connect('ylim_changed', actualizar)
+        actualizar()
+
+    def _flechas(self, ax, origenes, componentes, color, **estilo):
+        """Todas las flechas de un grupo en un único quiver."""
+        if len(origenes):
+            ax.quiver(origenes[:, 0], origenes[:, 1], componentes[:, 0], componentes[:, 1], color=color,
+                      angles='xy', scale_units='xy', scale=1, **estilo)
+            # quiver no amplía los límites de datos: se incluyen las puntas y sus etiquetas
+            ax.update_datalim(origenes + componentes * 1.2)
+
+    def _flechas_reaccion(self, coords, indice, reacciones, longitud, umbral):
+        """Origen, componente y texto de las flechas Rx/Ry de todos los apoyos."""
+        if not reacciones:
+            return np.empty((0, 2)), np.empty((0, 2)), []
+        ids = list(reacciones)
+        r = np.array([reacciones[i][:2] for i in ids], dtype=float)
+        base = coords[[indice[i] for i in ids]]
+        r[np.abs(r) <= umbral] = 0.0
+        vectores = np.concatenate([r * [1.0, 0.0], r * [0.0, 1.0]])
+        origenes, componentes, visibles = rendering.arrow_field(np.concatenate([base, base]), vectores, longitud)
+        textos = [f"Rx={v:.1f}" for v in r[:, 0]] + [f"Ry={v:.1f}" for v in r[:, 1]]
+        return origenes, componentes, [t for t, v in zip(textos, visibles) if v]
+
     def dibujar_bastidor(self):
         if not hasattr(self, 'canvas_bastidor'):
             return
@@ -2993,79 +3101,62 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         ax.set_ylabel('Coordenada Y')
         ax.set_title('Bastidor')
 
-        node_coords = {} # Para almacenar coordenadas matplotlib para el texto
-        for nodo in self.nodos_bast:
-            x_mpl = nodo['x']
-            y_mpl = nodo['y']
-            node_coords[nodo['id']] = (x_mpl, y_mpl)
-            ax.plot(x_mpl, y_mpl, 'ko', markersize=8) # Nodos
-            ax.text(x_mpl, y_mpl + 0.2, str(nodo['id']), ha='center', va='bottom', fontsize=8)
-
-            # Dibujar apoyos
-            if nodo['apoyo'] == 'Fijo':
-                ax.plot([x_mpl - 0.2, x_mpl + 0.2], [y_mpl - 0.2, y_mpl - 0.2], 'b-', linewidth=2)
-                ax.plot(x_mpl, y_mpl - 0.2, '^', markersize=10, color='blue')
-            elif nodo['apoyo'] == 'Móvil':
-                ax.plot([x_mpl - 0.2, x_mpl + 0.2], [y_mpl - 0.2, y_mpl - 0.2], 'b-', linewidth=2)
-                ax.plot(x_mpl, y_mpl - 0.2, 'o', markersize=10, color='blue')
-
-        for m in self.miembros_bast:
-            n1 = node_coords[m['inicio']]
-            n2 = node_coords[m['fin']]
-
-            color = 'black'
-            if 'fuerza' in m:
-                color = 'red' if m['fuerza'] < 0 else 'blue'
-
-            ax.plot([n1[0], n2[0]], [n1[1], n2[1]], color=color, linewidth=2)
-
-            if 'fuerza' in m:
-                mid_x = (n1[0]+n2[0])/2
-                mid_y = (n1[1]+n2[1])/2
-                # Añadir un fondo blanco al texto de la fuerza del miembro
-                ax.text(mid_x, mid_y, f"{m['fuerza']:.1f} N", color=color, fontsize=8,
-                        ha='center', va='center', bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2'))
+        # Un artista por tipo de elemento (nodos, apoyos, miembros, cargas, reacciones),
+        # no uno por miembro: el redibujado no crece con el número de artistas.
+        coords, extremos, indice = rendering.structure_arrays(self.nodos_bast, self.miembros_bast)
+        fondo = dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')
+        etiquetas = []
+
+        if len(coords):
+            ax.plot(coords[:, 0], coords[:, 1], 'ko', markersize=8, linestyle='none') # Nodos
+            etiquetas.append((coords + [0.0, 0.2], [str(n['id']) for n in self.nodos_bast], 'black',
+                              dict(ha='center', va='bottom', fontsize=8)))
+
+        apoyos = np.array([n['apoyo'] for n in self.nodos_bast], dtype=object)
+        for tipo, marcador in (('Fijo', '^'), ('Móvil', 'o'), ('Empotrado', 's')):
+            base = coords[apoyos == tipo] - [0.0, 0.2]
+            if len(base):
+                ax.add_collection(LineCollection(np.stack([base - [0.2, 0.0], base + [0.2, 0.0]], axis=1),
+                                                 colors='blue', linewidths=2))
+                ax.plot(base[:, 0], base[:, 1], marcador, markersize=10, color='blue', linestyle='none')
+
+        if len(extremos):
+            fuerzas = np.array([m.get('fuerza', 0.0) for m in self.miembros_bast], dtype=float)
+            colores = rendering.force_colors(fuerzas)
+            segmentos = coords[extremos]
+            ax.add_collection(LineCollection(segmentos, colors=colores, linewidths=2))
+            etiquetas.append((segmentos.mean(axis=1), [f"{f:.1f} N" for f in fuerzas], colores,
+                              dict(fontsize=8, ha='center', va='center', bbox=fondo)))
+
+        deformada = self.deformada_bast
+        if deformada is not None and len(deformada) == len(self.miembros_bast):
+            # Toda la deformada en una sola colección de líneas
+            ax.add_collection(LineCollection(deformada, colors='gray', linestyles='dashed', linewidths=1))
 
         arrow_len_scale = 0.5 # Escala para el tamaño de las flechas de carga
-        for carg in self.cargas_bast:
-            nodo = node_coords[carg['nodo']]
-            fx = carg['Fx']
-            fy = carg['Fy']
-            mag = (fx**2 + fy**2) ** 0.5
-            if mag > 0:
-                ux, uy = fx / mag, fy / mag
-                # Ajustar el origen de la flecha para que se vea bien
-                arrow_start_x = nodo[0] - ux * 0.1 # Un pequeño offset para que la flecha no empiece exactamente en el nodo
-                arrow_start_y = nodo[1] - uy * 0.1
-                ax.arrow(arrow_start_x, arrow_start_y, ux * arrow_len_scale, uy * arrow_len_scale,
-                         head_width=0.1, head_length=0.15, fc='green', ec='green',
-                         length_includes_head=True)
-                ax.text(nodo[0] + ux * (arrow_len_scale + 0.1), nodo[1] + uy * (arrow_len_scale + 0.1),
-                        f"{mag:.1f} N", color='green', fontsize=8, ha='center', va='center',
-                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2'))
+        if self.cargas_bast:
+            puntos = coords[[indice[carg['nodo']] for carg in self.cargas_bast]]
+            vectores = np.array([(carg['Fx'], carg['Fy']) for carg in self.cargas_bast], dtype=float)
+            origenes, flechas, visibles = rendering.arrow_field(puntos, vectores, arrow_len_scale)
+            unitarios = flechas / arrow_len_scale
+            # Un pequeño offset para que la flecha no empiece exactamente en el nodo
+            self._flechas(ax, origenes - unitarios * 0.1, flechas, 'green')
+            etiquetas.append((origenes + unitarios * (arrow_len_scale + 0.1),
+                              [f"{m:.1f} N" for m in np.linalg.norm(vectores[visibles], axis=1)], 'green',
+                              dict(fontsize=8, ha='center', va='center', bbox=fondo)))
 
         if hasattr(self, 'reacciones_bast'):
             reaction_arrow_len_scale = 0.6
-            for nodo_id, r in self.reacciones_bast.items():
-                nodo = node_coords[nodo_id]
-                rx, ry = r
-                if abs(rx) > 0.01:
-                    ax.arrow(nodo[0], nodo[1], (1 if rx > 0 else -1) * reaction_arrow_len_scale, 0,
-                             head_width=0.1, head_length=0.15, fc='orange', ec='orange',
-                             length_includes_head=True)
-                    ax.text(nodo[0] + (1 if rx > 0 else -1) * reaction_arrow_len_scale * 1.1, nodo[1],
-                            f"Rx={rx:.1f}", color='orange', fontsize=8, ha='center', va='center',
-                            bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2'))
-                if abs(ry) > 0.01:
-                    ax.arrow(nodo[0], nodo[1], 0, (1 if ry > 0 else -1) * reaction_arrow_len_scale,
-                             head_width=0.1, head_length=0.15, fc='orange', ec='orange',
-                             length_includes_head=True)
-                    ax.text(nodo[0], nodo[1] + (1 if ry > 0 else -1) * reaction_arrow_len_scale * 1.1,
-                            f"Ry={ry:.1f}", color='orange', fontsize=8, ha='center', va='center',
-                            bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2'))
+            origenes, flechas, textos = self._flechas_reaccion(
+                coords, indice, self.reacciones_bast, reaction_arrow_len_scale, 0.01)
+            self._flechas(ax, origenes, flechas, 'orange')
+            etiquetas.append((origenes + flechas * 1.1, textos, 'orange',
+                              dict(fontsize=8, ha='center', va='center', bbox=fondo)))
 
         ax.autoscale_view()
         ax.margins(0.2)
+        for posiciones, textos, colores, estilo in etiquetas:
+            self._etiquetas_nivel_detalle(ax, posiciones, textos, colores, **estilo)
         plt.tight_layout()
 
         # Limpiar el canvas de Tkinter y dibujar la figura de Matplotlib
@@ -3153,18 +3244,8 @@ I_total = Σ(I_barra_i + A_i * d_i²)
             messagebox.showwarning("Advertencia", "Calcule primero el bastidor para aplicar el método de secciones.")
             return
 
-        node_lookup = {n['id']: n for n in self.nodos_bast}
-        miembros_corte = []
-
-        for m in self.miembros_bast:
-            n1 = node_lookup[m['inicio']]
-            n2 = node_lookup[m['fin']]
-
-            p1 = n1['x'] if eje == 'x' else n1['y']
-            p2 = n2['x'] if eje == 'x' else n2['y']
-
-            if (p1 < corte < p2) or (p2 < corte < p1) or p1 == corte or p2 == corte:
-                miembros_corte.append(m)
+        posiciones = cuts.miembros_cortados(self.nodos_bast, self.miembros_bast, corte, eje)
+        miembros_corte = [self.miembros_bast[j] for j in posiciones]
 
         self.log(f"\n{'='*50}\n", "title")
         self.log(f"📐 MÉTODO DE SECCIONES ({eje}={corte:.2f})\n", "title")
@@ -3188,138 +3269,11 @@ I_total = Σ(I_barra_i + A_i * d_i²)
         fig, ax = plt.subplots(figsize=(8, 6))
         plt.style.use("seaborn-v0_8-whitegrid")
 
-        node_lookup = {n['id']: n for n in self.nodos_bast}
-        arrow_scale = 0.8
-
-        if eje == 'x':
-            ax.axvline(corte, color='red', linestyle='--', linewidth=2, label=f'Corte en X={corte:.2f}')
-
-            for m in self.miembros_bast:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-
-                if n1['x'] <= corte and n2['x'] <= corte:
-                    ax.plot([n1['x'], n2['x']], [n1['y'], n2['y']], 'k-', linewidth=1.5, alpha=0.7)
-
-            for nodo in self.nodos_bast:
-                if nodo['x'] <= corte:
-                    ax.plot(nodo['x'], nodo['y'], 'ko', markersize=6)
-                    ax.text(nodo['x'], nodo['y']+0.2, str(nodo['id']), fontsize=8, ha='center', va='bottom')
-
-                    for c in self.cargas_bast:
-                        if c['nodo'] == nodo['id']:
-                            mag_c = np.hypot(c['Fx'], c['Fy'])
-                            if mag_c > 0:
-                                ux_c, uy_c = c['Fx']/mag_c, c['Fy']/mag_c
-                                ax.arrow(nodo['x'], nodo['y'], ux_c*arrow_scale, uy_c*arrow_scale, color='green', head_width=0.08, length_includes_head=True)
-                                ax.text(nodo['x'] + ux_c*arrow_scale*1.1, nodo['y'] + uy_c*arrow_scale*1.1, f"{mag_c:.1f}", color='green', fontsize=7, ha='center', va='center',
-                                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')) # Fondo blanco
-
-                    if nodo['apoyo'] in ('Fijo', 'Móvil') and hasattr(self, 'reacciones_bast'):
-                        if nodo['id'] in self.reacciones_bast:
-                            rx, ry = self.reacciones_bast[nodo['id']]
-                            if abs(rx) > 0.01:
-                                ax.arrow(nodo['x'], nodo['y'], (1 if rx > 0 else -1) * arrow_scale, 0, color='orange', head_width=0.08, length_includes_head=True)
-                                ax.text(nodo['x'] + (1 if rx > 0 else -1) * arrow_scale * 1.1, nodo['y'] + 0.1, f"{abs(rx):.1f}", color='orange', fontsize=7, ha='center', va='center',
-                                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')) # Fondo blanco
-                            if abs(ry) > 0.01:
-                                ax.arrow(nodo['x'], nodo['y'], 0, (1 if ry > 0 else -1) * arrow_scale, color='orange', head_width=0.08, length_includes_head=True)
-                                ax.text(nodo['x'] + 0.1, nodo['y'] + (1 if ry > 0 else -1) * arrow_scale * 1.1, f"{abs(ry):.1f}", color='orange', fontsize=7, ha='center', va='center',
-                                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')) # Fondo blanco
-
-            for m in miembros_cortados:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-
-                if (n2['x'] - n1['x']) == 0:
-                    x_cut = corte
-                    y_cut = (n1['y'] + n2['y']) / 2
-                else:
-                    slope = (n2['y'] - n1['y']) / (n2['x'] - n1['x'])
-                    y_cut = n1['y'] + slope * (corte - n1['x'])
-                    x_cut = corte
-
-                fuerza = m.get('fuerza', 0)
-                color = 'red' if fuerza < 0 else 'blue'
-
-                dx = n2['x'] - n1['x']
-                dy = n2['y'] - n1['y']
-                mag_m = (dx**2 + dy**2)**0.5
-                if mag_m == 0: continue
-                ux_m, uy_m = dx / mag_m, dy / mag_m
-
-                vec_x = ux_m * arrow_scale * (1 if fuerza >= 0 else -1)
-                vec_y = uy_m * arrow_scale * (1 if fuerza >= 0 else -1)
-
-                ax.arrow(x_cut, y_cut, vec_x, vec_y, color=color, head_width=0.08, length_includes_head=True)
-                ax.text(x_cut + vec_x*1.1, y_cut + vec_y*1.1, f"{abs(fuerza):.1f}", color=color, fontsize=7, ha='center', va='center',
-                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')) # Fondo blanco
-
-        elif eje == 'y':
-            ax.axhline(corte, color='red', linestyle='--', linewidth=2, label=f'Corte en Y={corte:.2f}')
+        fondo = dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2') # Fondo blanco
+        self._dibujar_dcl_seccion_mpl(ax, self.nodos_bast, self.miembros_bast, self.cargas_bast,
+                                      getattr(self, 'reacciones_bast', {}), corte, miembros_cortados, eje, 0.8,
+                                      fondo=fondo, ids=True)
 
-            for m in self.miembros_bast:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-
-                if n1['y'] <= corte and n2['y'] <= corte:
-                    ax.plot([n1['x'], n2['x']], [n1['y'], n2['y']], 'k-', linewidth=1.5, alpha=0.7)
-
-            for nodo in self.nodos_bast:
-                if nodo['y'] <= corte:
-                    ax.plot(nodo['x'], nodo['y'], 'ko', markersize=6)
-                    ax.text(nodo['x'], nodo['y']+0.2, str(nodo['id']), fontsize=8, ha='center', va='bottom')
-
-                    for c in self.cargas_bast:
-                        if c['nodo'] == nodo['id']:
-                            mag_c = np.hypot(c['Fx'], c['Fy'])
-                            if mag_c > 0:
-                                ux_c, uy_c = c['Fx']/mag_c, c['Fy']/mag_c
-                                ax.arrow(nodo['x'], nodo['y'], ux_c*arrow_scale, uy_c*arrow_scale, color='green', head_width=0.08, length_includes_head=True)
-                                ax.text(nodo['x'] + ux_c*arrow_scale*1.1, nodo['y'] + uy_c*arrow_scale*1.1, f"{mag_c:.1f}", color='green', fontsize=7, ha='center', va='center',
-                                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')) # Fondo blanco
-
-                    if nodo['apoyo'] in ('Fijo', 'Móvil') and hasattr(self, 'reacciones_bast'):
-                        if nodo['id'] in self.reacciones_bast:
-                            rx, ry = self.reacciones_bast[nodo['id']]
-                            if abs(rx) > 0.01:
-                                ax.arrow(nodo['x'], nodo['y'], (1 if rx > 0 else -1) * arrow_scale, 0, color='orange', head_width=0.08, length_includes_head=True)
-                                ax.text(nodo['x'] + (1 if rx > 0 else -1) * arrow_scale * 1.1, nodo['y'] + 0.1, f"{abs(rx):.1f}", color='orange', fontsize=7, ha='center', va='center',
-                                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')) # Fondo blanco
-                            if abs(ry) > 0.01:
-                                ax.arrow(nodo['x'], nodo['y'], 0, (1 if ry > 0 else -1) * arrow_scale, color='orange', head_width=0.08, length_includes_head=True)
-                                ax.text(0.1, (1 if ry > 0 else -1) * arrow_scale * 1.1, f"{abs(ry):.1f}", color='orange', fontsize=7, ha='center', va='center',
-                                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')) # Fondo blanco
-
-            for m in miembros_cortados:
-                n1 = node_lookup[m['inicio']]
-                n2 = node_lookup[m['fin']]
-
-                if (n2['y'] - n1['y']) == 0:
-                    y_cut = corte
-                    x_cut = (n1['x'] + n2['x']) / 2
-                else:
-                    slope_inv = (n2['x'] - n1['x']) / (n2['y'] - n1['y'])
-                    x_cut = n1['x'] + slope_inv * (corte - n1['y'])
-                    y_cut = corte
-
-                fuerza = m.get('fuerza', 0)
-                color = 'red' if fuerza < 0 else 'blue'
-
-                dx = n2['x'] - n1['x']
-                dy = n2['y'] - n1['y']
-                mag_m = (dx**2 + dy**2)**0.5
-                if mag_m == 0: continue
-                ux_m, uy_m = dx / mag_m, dy / mag_m
-
-                vec_x = ux_m * arrow_scale * (1 if fuerza >= 0 else -1)
-                vec_y = uy_m * arrow_scale * (1 if fuerza >= 0 else -1)
-
-                ax.arrow(x_cut, y_cut, vec_x, vec_y, color=color, head_width=0.08, length_includes_head=True)
-                ax.text(x_cut + vec_x*1.1, y_cut + vec_y*1.1, f"{abs(fuerza):.1f}", color=color, fontsize=7, ha='center', va='center',
-                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')) # Fondo blanco
-
-        ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('Coordenada X')
         ax.set_ylabel('Coordenada Y')
         ax.set_title('Diagrama de Cuerpo Libre de la Sección')
@@ -3343,9 +3297,12 @@ I_total = Σ(I_barra_i + A_i * d_i²)
             "5. Utilice 'DCL Nodos' para visualizar el diagrama de cuerpo libre de cada nodo.\n"
             "6. El botón 'Método de Secciones' permite mostrar el DCL de una porción del bastidor.\n"
             "7. El botón 'Ejemplo' carga un bastidor de muestra y calcula sus resultados automáticamente.\n"
+            "8. 'Pórtico Rígido' resuelve el bastidor con uniones rígidas (apoyos 'Empotrado' incluidos) y "
+            "muestra N, V y M en los extremos de cada miembro.\n"
             "\nLimitaciones: el análisis está pensado para bastidores planos de dos dimensiones, "
             "con miembros de dos fuerzas y uniones mediante pasadores lisos. "
-            "Si el bastidor es indeterminado o inestable, el programa mostrará una advertencia y los resultados pueden no ser únicos."
+            "Si el bastidor es indeterminado se resuelve por el método de rigidez con EA uniforme; "
+            "si es inestable, el programa indica los nodos del mecanismo y no lo resuelve."
         )
         messagebox.showinfo("Instrucciones Bastidores", texto)
 
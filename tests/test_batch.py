@@ -0,0 +1,38 @@
+import math
+
+import numpy as np
+
+from mechanics import MemmapResultSink, PointLoad, compute_beam_diagrams, open_results, run_beam_batch
+
+
+def _configs():
+    configs = [
+        {"length": 8.0 + i % 3, "point_loads": [PointLoad(position=2.0, magnitude=float(i + 1))]}
+        for i in range(12)
+    ]
+    configs[5] = {"length": -2.0}
+    return configs
+
+
+def test_parallel_batch_matches_serial_solver():
+    configs = _configs()
+    result = run_beam_batch(configs, num_points=40, max_workers=2, chunksize=3)
+
+    assert len(result) == 12
+    assert list(result.errors) == [5]
+    assert np.isnan(result.moment[5]).all()
+
+    expected = compute_beam_diagrams(num_points=40, **configs[4])
+    np.testing.assert_allclose(result.moment[4], expected.moment)
+    assert math.isclose(result.reactions[4, 0], expected.reactions["A"])
+
+
+def test_batch_writes_through_sink(tmp_path):
+    configs = _configs()
+    with MemmapResultSink(tmp_path, capacity=16, num_points=40) as sink:
+        run_beam_batch(configs, num_points=40, max_workers=2, chunksize=4, sink=sink)
+
+    stored = open_results(tmp_path)
+    assert len(stored) == 12
+    expected = compute_beam_diagrams(num_points=40, **configs[11])
+    np.testing.assert_allclose(stored.shear[11], expected.shear)
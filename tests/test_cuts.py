@@ -0,0 +1,37 @@
+import numpy as np
+
+from mechanics.cuts import SectionCutIndex, members_crossing_line, miembros_cortados
+from mechanics.truss import TrussModel
+
+
+def _random_model(count=400, seed=3):
+    rng = np.random.default_rng(seed)
+    coordinates = rng.uniform(0.0, 50.0, size=(count, 2))
+    coordinates[::7, 0] = np.round(coordinates[::7, 0])
+    members = rng.integers(0, count, size=(3 * count, 2))
+    members = members[members[:, 0] != members[:, 1]]
+    return TrussModel.from_arrays(coordinates, members, np.zeros_like(coordinates, dtype=bool))
+
+
+def test_interval_index_matches_linear_scan_for_axis_and_inclined_cuts():
+    model = _random_model()
+    for normal in ((1.0, 0.0), (0.0, 1.0), (1.0, 2.0)):
+        index = SectionCutIndex(model, normal)
+        offsets = np.concatenate([np.linspace(-5.0, 80.0, 97), [10.0, 20.0, index.lower.min()]])
+        for offset, found in zip(offsets, index.query_many(offsets)):
+            point = offset * index.normal
+            np.testing.assert_array_equal(found, members_crossing_line(model, point, normal))
+
+
+def test_dictionary_front_end_keeps_desktop_rule():
+    nodos = [
+        {"id": 1, "x": 0.0, "y": 0.0, "apoyo": "Fijo"},
+        {"id": 2, "x": 2.0, "y": 0.0, "apoyo": "Libre"},
+        {"id": 3, "x": 4.0, "y": 0.0, "apoyo": "Móvil"},
+        {"id": 4, "x": 2.0, "y": 2.0, "apoyo": "Libre"},
+    ]
+    miembros = [{"inicio": 1, "fin": 2}, {"inicio": 2, "fin": 3}, {"inicio": 1, "fin": 4}, {"inicio": 4, "fin": 3}, {"inicio": 2, "fin": 4}]
+    # Members touching the cut at an end node count as cut, like the old scan.
+    assert miembros_cortados(nodos, miembros, 2.0, "x") == [0, 1, 2, 3, 4]
+    assert miembros_cortados(nodos, miembros, 1.0, "x") == [0, 2]
+    assert miembros_cortados(nodos, miembros, 1.0, "y") == [2, 3, 4]
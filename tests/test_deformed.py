@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from mechanics.deformed import amplification_factor, frame_deformed_shape, polyline, truss_deformed_shape
+from mechanics.frame import FrameModel, solve_frame
+from mechanics.generators import pratt_truss
+from mechanics.truss import solve_truss_stiffness
+
+
+def test_cantilever_under_uniform_load_follows_the_exact_elastic_curve():
+    q, L, EI = -3.0, 4.0, 2.0e7
+    model = FrameModel.from_arrays(
+        [[0.0, 0.0], [L, 0.0]],
+        [(0, 1)],
+        [[True] * 3, [False] * 3],
+        np.zeros((2, 3)),
+        flexural_stiffness=EI,
+        member_loads=[[0.0, q]],
+    )
+    shape = frame_deformed_shape(model, solve_frame(model), num_points=9)
+
+    x = np.linspace(0.0, L, 9)
+    exact = q * x**2 * (6 * L**2 - 4 * L * x + x**2) / (24 * EI)
+    np.testing.assert_allclose(shape[0, :, 0], x, atol=1e-12)
+    np.testing.assert_allclose(shape[0, :, 1], exact, rtol=1e-9, atol=1e-15)
+
+
+def test_truss_members_end_on_the_scaled_displaced_nodes():
+    model = pratt_truss(4)
+    u = solve_truss_stiffness(model).displacements
+    scale = amplification_factor(model.coordinates, u)
+    segments = truss_deformed_shape(model, u, scale=scale)
+
+    assert segments.shape == (model.num_members, 2, 2)
+    np.testing.assert_allclose(segments[:, 1], (model.coordinates + scale * u)[model.members[:, 1]])
+    assert np.max(np.linalg.norm(scale * u, axis=1)) == pytest.approx(0.05 * 4.0)
+    assert amplification_factor(model.coordinates, np.zeros_like(u)) == 1.0
+
+
+def test_polyline_separates_members_with_nan_rows():
+    segments = np.arange(12, dtype=float).reshape(2, 3, 2)
+    joined = polyline(segments)
+
+    assert joined.shape == (7, 2)
+    assert np.isnan(joined[3]).all()
+    np.testing.assert_array_equal(joined[4:], segments[1])
@@ -0,0 +1,61 @@
+import math
+
+import numpy as np
+import pytest
+
+from mechanics.design import MemberSections, check_members
+from mechanics.generators import pratt_truss
+from mechanics.sections import standard_catalog
+from mechanics.truss import solve_truss_stiffness
+
+
+def test_stress_and_euler_buckling_of_tension_and_compression_members():
+    # 50x50 mm solid steel bars, 2 m long: Ncr = pi^2 E I / L^2 = 270 kN.
+    side, E, fy = 0.05, 210e9, 275e6
+    sections = MemberSections.from_arrays(side**2, side**4 / 12.0, E, fy, [1.0, 1.0, 0.5], num_members=3)
+    checks = check_members([300e3, -200e3, -200e3], [2.0, 2.0, 2.0], sections)
+
+    ncr = math.pi**2 * E * side**4 / 12.0 / 4.0
+    np.testing.assert_allclose(checks.critical_load, [ncr, ncr, 4.0 * ncr])
+    np.testing.assert_allclose(checks.stress, [120e6, -80e6, -80e6])
+    np.testing.assert_allclose(checks.slenderness, [2.0, 2.0, 1.0] / np.sqrt(side**2 / 12.0))
+    np.testing.assert_allclose(checks.utilisation, [120e6 / fy, 200e3 / ncr, 80e6 / fy])
+    np.testing.assert_array_equal(checks.buckling_governs, [False, True, False])
+    np.testing.assert_array_equal(checks.failing, [])
+
+    with pytest.raises(ValueError):
+        check_members([1.0, 2.0], [1.0, 1.0, 1.0], sections)
+    with pytest.raises(ValueError):
+        MemberSections.from_arrays(0.0, 1.0, 1.0, 1.0)
+
+
+def test_catalog_sections_use_the_weak_axis_and_accept_rows():
+    catalog = standard_catalog()
+    names = ["IPE 200", "HEA 100", "IPE 200", "IPE 200"]
+    sections = MemberSections.from_catalog(catalog, names)
+    ipe = catalog.entry("IPE 200")
+    assert sections.num_members == 4
+    assert sections.area[0] == ipe.area and sections.inertia[0] == ipe.iz
+    np.testing.assert_array_equal(sections.area[[0, 2, 3]], ipe.area)
+
+    by_row = MemberSections.from_catalog(catalog, [catalog.index_of(name) for name in names])
+    np.testing.assert_array_equal(by_row.inertia, sections.inertia)
+    with pytest.raises(KeyError):
+        MemberSections.from_catalog(catalog, ["IPE 999"])
+
+
+def test_worst_members_of_a_solved_truss():
+    model = pratt_truss(40, panel_length=2.0, depth=2.5, load=-40e3)
+    forces = solve_truss_stiffness(model).forces
+    sections = MemberSections.from_catalog(standard_catalog(), ["HEA 160"] * model.num_members)
+    checks = check_members(forces, model.member_lengths(), sections)
+
+    ranked = np.sort(checks.utilisation)[::-1]
+    np.testing.assert_allclose(checks.utilisation[checks.worst(15)], ranked[:15])
+    assert checks.worst(0).size == 0 and checks.worst(10**6).size == model.num_members
+
+    report = checks.report(5)
+    np.testing.assert_array_equal(report["member"], checks.worst(5))
+    np.testing.assert_allclose(report["utilisation"], ranked[:5])
+    np.testing.assert_allclose(report["force"], forces[report["member"]])
+    assert checks.failing.size == np.count_nonzero(ranked > 1.0) > 0
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from mechanics.frame import FrameComputationError, FrameModel, FrameSystem, resolver_bastidor, solve_frame
+from mechanics.truss import TrussModel, solve_truss
+
+
+def test_cantilever_tip_load_matches_beam_theory():
+    P, L, EI = 10.0, 3.0, 2.0e7
+    model = FrameModel.from_arrays(
+        [[0.0, 0.0], [L, 0.0]], [(0, 1)], [[True] * 3, [False] * 3], [[0, 0, 0], [0, -P, 0]], flexural_stiffness=EI
+    )
+    solution = solve_frame(model)
+
+    np.testing.assert_allclose(solution.displacements[1, 1:], [-P * L**3 / (3 * EI), -P * L**2 / (2 * EI)])
+    np.testing.assert_allclose(solution.reactions[0], [0.0, P, P * L])
+    diagrams = solution.diagrams(num_points=4)
+    np.testing.assert_allclose(diagrams.moment[0], -P * (L - diagrams.stations[0]), atol=1e-9)
+    np.testing.assert_allclose(diagrams.shear[0], P)
+
+
+def test_member_hinge_and_uniform_load_give_the_gerber_reactions():
+    q = -2.0
+    nodos = [
+        {"id": "A", "x": 0.0, "y": 0.0, "apoyo": "Empotrado"},
+        {"id": "B", "x": 2.0, "y": 0.0, "apoyo": "Libre"},
+        {"id": "C", "x": 4.0, "y": 0.0, "apoyo": "Móvil"},
+    ]
+    miembros = [
+        {"inicio": "A", "fin": "B", "qy": q, "articulado_fin": True},
+        {"inicio": "B", "fin": "C", "qy": q},
+    ]
+    extremos, reacciones = resolver_bastidor(nodos, miembros, [])
+
+    # The hinged span is simply supported by the hinge and the roller.
+    assert reacciones["C"] == pytest.approx((0.0, 2.0, 0.0))
+    assert reacciones["A"] == pytest.approx((0.0, 6.0, 8.0))
+    assert extremos[0][5] == pytest.approx(0.0, abs=1e-9)
+
+    solution = solve_frame(FrameModel.from_dicts(nodos, miembros))
+    moment = solution.diagrams(num_points=3).moment
+    np.testing.assert_allclose(moment[1], [0.0, 1.0, 0.0], atol=1e-9)
+
+
+def test_fully_released_frame_reproduces_truss_forces():
+    coordinates = np.array([[0.0, 0.0], [4.0, 0.0], [2.0, 2.0]])
+    members = [(0, 1), (1, 2), (2, 0)]
+    truss = TrussModel.from_arrays(coordinates, members, [[1, 1], [0, 1], [0, 0]], [[0, 0], [0, 0], [0, -1000]])
+    frame = FrameModel.from_arrays(
+        coordinates,
+        members,
+        [[1, 1, 0], [0, 1, 0], [0, 0, 0]],
+        [[0, 0, 0], [0, 0, 0], [0, -1000, 0]],
+        releases=np.ones((3, 2), dtype=bool),
+    )
+    assert frame.hinged_nodes().tolist() == [0, 1, 2]
+
+    diagrams = solve_frame(frame).diagrams()
+    np.testing.assert_allclose(diagrams.axial[:, 0], solve_truss(truss).forces)
+    np.testing.assert_allclose(diagrams.moment, 0.0, atol=1e-9)
+
+    # A moment on a pin has nothing to resist it.
+    with pytest.raises(FrameComputationError, match="hinged node"):
+        FrameSystem(frame).solve(loads=[[0, 0, 0], [0, 0, 0], [0, -1000, 50.0]])
+
+
+def test_multi_storey_frame_equilibrium_and_reused_factorization():
+    bays, storeys = 8, 12
+    X, Y = np.meshgrid(np.arange(bays + 1) * 5.0, np.arange(storeys + 1) * 3.0)
+    coordinates = np.column_stack([X.ravel(), Y.ravel()])
+    grid = np.arange(coordinates.shape[0]).reshape(storeys + 1, bays + 1)
+    columns = np.column_stack([grid[:-1].ravel(), grid[1:].ravel()])
+    beams = np.column_stack([grid[1:, :-1].ravel(), grid[1:, 1:].ravel()])
+    restraints = np.zeros((coordinates.shape[0], 3), dtype=bool)
+    restraints[grid[0]] = True
+    member_loads = np.zeros((len(columns) + len(beams), 2))
+    member_loads[len(columns):, 1] = -10.0
+    model = FrameModel.from_arrays(coordinates, np.concatenate([columns, beams]), restraints, member_loads=member_loads)
+
+    system = FrameSystem(model, method="cholesky")
+    gravity = system.solve()
+    np.testing.assert_allclose(gravity.reactions[:, :2].sum(axis=0), [0.0, 10.0 * 5.0 * bays * storeys], atol=1e-8)
+    # Member end moments are the ends of the sampled diagrams.
+    diagrams = gravity.diagrams()
+    np.testing.assert_allclose(diagrams.moment[:, 0], -gravity.end_forces[:, 2], atol=1e-6)
+    np.testing.assert_allclose(diagrams.moment[:, -1], gravity.end_forces[:, 5], atol=1e-6)
+
+    wind = np.zeros((model.num_nodes, 3))
+    wind[grid[1:, 0], 0] = 5.0
+    sway = system.solve(wind, np.zeros_like(member_loads))
+    np.testing.assert_allclose(sway.reactions[:, 0].sum(), -5.0 * storeys)
+    assert np.all(sway.displacements[grid[1:, 0], 0] > 0)
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from mechanics.generators import howe_truss, k_truss, pratt_truss, space_grid, warren_truss
+from mechanics.truss import TrussSystem, diagnose_truss, resolver_articulado, solve_truss
+
+
+@pytest.mark.parametrize("generator", [pratt_truss, howe_truss, warren_truss])
+@pytest.mark.parametrize("panels", [2, 5, 8])
+def test_plane_generators_are_stable_determinate_and_in_equilibrium(generator, panels):
+    model = generator(panels, panel_length=2.0, depth=1.5, load=-3.0)
+    diagnostics = diagnose_truss(model)
+    assert diagnostics.is_stable and diagnostics.is_determinate
+
+    solution = solve_truss(model)
+    np.testing.assert_allclose(solution.reactions.sum(axis=0), [0.0, 3.0 * (panels - 1)], atol=1e-9)
+
+
+def test_k_truss_and_space_grid_are_stable_and_carry_their_load():
+    k = k_truss(6)
+    assert diagnose_truss(k).is_stable and diagnose_truss(k).degree_of_indeterminacy == 1
+    assert TrussSystem(k).strategy == "stiffness"
+
+    grid = space_grid(3, 2)
+    assert grid.dim == 3 and diagnose_truss(grid).is_stable
+    result = TrussSystem(grid).solve(grid.loads)
+    np.testing.assert_allclose(result.reactions[0].sum(axis=0), [0.0, 0.0, 6.0], atol=1e-9)
+
+
+def test_to_dicts_round_trips_through_the_desktop_solver():
+    model = howe_truss(4)
+    nodos, miembros, cargas = model.to_dicts()
+    assert nodos[0]["apoyo"] == "Fijo" and nodos[4]["apoyo"] == "Móvil"
+
+    fuerzas, reacciones, _, _ = resolver_articulado(nodos, miembros, cargas)
+    np.testing.assert_allclose(fuerzas, solve_truss(model).forces, atol=1e-9)
+    assert reacciones[0][1] == pytest.approx(1.5) and reacciones[4][1] == pytest.approx(1.5)
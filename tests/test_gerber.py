@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from mechanics import DistributedLoad, PointLoad, compute_beam_diagrams
+from mechanics.gerber import GerberSupport, solve_gerber_beam
+from mechanics.viga import BeamComputationError
+
+
+def test_without_hinges_matches_the_simply_supported_beam():
+    point_loads = [PointLoad(position=2.0, magnitude=10.0)]
+    distributed = [DistributedLoad(start=1.0, end=5.0, intensity=3.0)]
+    result = solve_gerber_beam(
+        length=6.0,
+        supports=[GerberSupport(0.0, "Fijo"), GerberSupport(6.0, "Movil")],
+        point_loads=point_loads,
+        distributed_loads=distributed,
+    )
+    reference = compute_beam_diagrams(length=6.0, point_loads=point_loads, distributed_loads=distributed)
+
+    np.testing.assert_allclose(result.reactions, [reference.reactions["A"], reference.reactions["B"]])
+    np.testing.assert_allclose(result.moment, reference.moment, atol=1e-9)
+    # The last station sits just left of the end support.
+    np.testing.assert_allclose(result.shear[:-1], reference.shear[:-1], atol=1e-9)
+    assert result.shear[-1] == pytest.approx(-reference.reactions["B"])
+
+
+def test_cantilever_with_suspended_span():
+    result = solve_gerber_beam(
+        length=4.0,
+        supports=[(0.0, "Empotrado"), (4.0, "Movil")],
+        hinges=[2.0],
+        distributed_loads=[(0.0, 4.0, 2.0)],
+    )
+    np.testing.assert_allclose(result.reactions, [6.0, 2.0])
+    np.testing.assert_allclose(result.moments, [8.0, 0.0])
+    np.testing.assert_allclose(result.hinge_shears, [-2.0])
+    np.testing.assert_allclose(result.index.moment([0.0, 2.0, 3.0]), [-8.0, 0.0, 1.0], atol=1e-9)
+
+
+def test_fixed_support_at_the_right_end_shows_in_the_diagrams():
+    result = solve_gerber_beam(
+        length=4.0,
+        supports=[(4.0, "Empotrado"), (0.0, "Movil")],
+        hinges=[2.0],
+        distributed_loads=[(0.0, 4.0, 2.0)],
+    )
+    np.testing.assert_allclose(result.reactions, [6.0, 2.0])
+    assert result.positions[-1] == 4.0
+    assert result.moment[-1] == pytest.approx(-8.0)
+    assert result.shear[-1] == pytest.approx(-6.0)
+    assert result.moment[0] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_long_hinged_bridge_has_zero_moment_at_every_hinge():
+    spans, span = 25, 30.0
+    length = spans * span
+    supports = [{"position": i * span, "type": "Fijo" if i == 0 else "Movil"} for i in range(spans + 1)]
+    hinges = [i * span + 6.0 for i in range(1, spans)]
+    result = solve_gerber_beam(
+        length=length,
+        supports=supports,
+        hinges=hinges,
+        distributed_loads=[(0.0, length, 1.0)],
+        point_loads=[(hinges[3], 50.0)],
+        method="banded",
+    )
+    assert result.reactions.sum() == pytest.approx(length + 50.0)
+    np.testing.assert_allclose(result.index.moment(result.hinges), 0.0, atol=1e-8)
+
+
+def test_mechanisms_and_indeterminate_layouts_are_rejected():
+    with pytest.raises(BeamComputationError, match="mechanism"):
+        solve_gerber_beam(length=4.0, supports=[(0.0, "Fijo"), (4.0, "Movil")], hinges=[2.0])
+    with pytest.raises(BeamComputationError, match="mechanism"):
+        solve_gerber_beam(length=4.0, supports=[(0.0, "Fijo"), (1.0, "Movil"), (1.5, "Movil")], hinges=[2.0])
+    with pytest.raises(BeamComputationError, match="indeterminate"):
+        solve_gerber_beam(length=4.0, supports=[(0.0, "Empotrado"), (4.0, "Movil")])
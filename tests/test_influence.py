@@ -0,0 +1,47 @@
+import numpy as np
+
+from mechanics.influence import influence_lines
+from mechanics.truss import TrussModel, solve_truss
+
+
+def _pratt(panels=6, depth=1.5):
+    xs = np.arange(panels + 1, dtype=float)
+    coordinates = np.concatenate([np.column_stack([xs, np.zeros_like(xs)]), np.column_stack([xs, np.full_like(xs, depth)])])
+    top = panels + 1
+    members = (
+        [(i, i + 1) for i in range(panels)]
+        + [(top + i, top + i + 1) for i in range(panels)]
+        + [(i, top + i) for i in range(panels + 1)]
+        + [(i, top + i + 1) for i in range(panels)]
+    )
+    restraints = np.zeros_like(coordinates, dtype=bool)
+    restraints[0] = True
+    restraints[panels, 1] = True
+    return TrussModel.from_arrays(coordinates, members, restraints), list(range(panels + 1))
+
+
+def test_reaction_and_member_influence_lines_match_single_solves():
+    model, chord = _pratt()
+    lines = influence_lines(model, chord)
+
+    # Left reaction of a simply supported span: 1 - x / L.
+    np.testing.assert_allclose(lines.reactions[:, 0, 1], 1.0 - lines.positions / lines.length, atol=1e-12)
+    loads = np.zeros_like(model.coordinates)
+    loads[3, 1] = -1.0
+    single = solve_truss(TrussModel.from_arrays(model.coordinates, model.members, model.restraints, loads))
+    np.testing.assert_allclose(lines.forces[:, 3], single.forces, atol=1e-12)
+    np.testing.assert_allclose(lines.evaluate([3.0, 3.5])[:, 1], 0.5 * (lines.forces[:, 3] + lines.forces[:, 4]))
+
+
+def test_moving_train_envelope_matches_brute_force():
+    model, chord = _pratt()
+    lines = influence_lines(model, chord)
+    axles, spacings = [10.0, 20.0, 20.0], [0.7, 1.3]
+    envelope = lines.moving_load(axles, spacings)
+
+    offsets = np.array([0.0, 0.7, 2.0])
+    leads = np.linspace(0.0, lines.length + offsets[-1], 4001)
+    totals = sum(p * lines.evaluate(leads - d) for p, d in zip(axles, offsets))
+    assert np.all(envelope.maximum >= totals.max(axis=1) - 1e-9)
+    assert np.all(envelope.minimum <= totals.min(axis=1) + 1e-9)
+    np.testing.assert_allclose(envelope.maximum, totals.max(axis=1), atol=0.05)
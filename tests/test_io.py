@@ -0,0 +1,106 @@
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from mechanics.frame import solve_frame
+from mechanics.generators import pratt_truss
+from mechanics.io import ModelImportError, read_frame, read_truss
+from mechanics.truss import solve_truss_stiffness
+
+
+def _write_csv(path, header, rows):
+    with open(path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return path
+
+
+def _write_jsonl(path, rows):
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n")
+    return path
+
+
+def test_csv_truss_matches_the_generated_model(tmp_path):
+    model = pratt_truss(12, panel_length=2.0, depth=1.5, load=-10.0)
+    nodos, miembros, cargas = model.to_dicts()
+    ids = [n["id"] + 100 for n in nodos]
+    nodes = _write_csv(tmp_path / "nodes.csv", ["id", "x", "y"], [(i, n["x"], n["y"]) for i, n in zip(ids, nodos)])
+    members = _write_csv(
+        tmp_path / "members.csv", ["inicio", "fin"], [(m["inicio"] + 100, m["fin"] + 100) for m in miembros]
+    )
+    supports = _write_csv(
+        tmp_path / "supports.csv",
+        ["nodo", "apoyo", "restricciones"],
+        [(i, n.get("apoyo", ""), n.get("restricciones", "")) for i, n in zip(ids, nodos) if n.get("apoyo") != "Libre"],
+    )
+    # The same load split over two rows adds up.
+    loads = _write_csv(
+        tmp_path / "loads.csv",
+        ["nodo", "Fx", "Fy"],
+        [(c["nodo"] + 100, c["Fx"], c["Fy"] / 2) for c in cargas for _ in range(2)],
+    )
+
+    imported = read_truss(nodes, members, supports, loads, chunk_rows=7)
+    np.testing.assert_array_equal(imported.node_ids, ids)
+    np.testing.assert_allclose(imported.coordinates, model.coordinates)
+    np.testing.assert_array_equal(imported.members, model.members)
+    np.testing.assert_array_equal(imported.restraints, model.restraints)
+    np.testing.assert_allclose(imported.loads, model.loads)
+    np.testing.assert_allclose(solve_truss_stiffness(imported).forces, solve_truss_stiffness(model).forces)
+
+
+def test_jsonl_frame_with_text_ids_and_sparse_columns(tmp_path):
+    nodes = _write_jsonl(
+        tmp_path / "nodes.jsonl",
+        [{"id": "A", "x": 0, "y": 0}, {"id": "B", "x": 0, "y": 3.0}, {"id": "C", "x": 4.0, "y": 3.0}],
+    )
+    members = _write_jsonl(
+        tmp_path / "members.jsonl",
+        [
+            {"inicio": "A", "fin": "B"},
+            {"inicio": "B", "fin": "C", "qy": -2.0, "EI": 4.0e7, "articulado_fin": True},
+        ],
+    )
+    supports = _write_jsonl(
+        tmp_path / "supports.jsonl", [{"nodo": "A", "apoyo": "Empotrado"}, {"nodo": "C", "restricciones": "y"}]
+    )
+    loads = _write_jsonl(tmp_path / "loads.jsonl", [{"nodo": "B", "Fx": 5.0, "M": 1.0}])
+
+    model = read_frame(nodes, members, supports, loads, chunk_rows=1)
+    np.testing.assert_array_equal(model.node_ids, ["A", "B", "C"])
+    np.testing.assert_array_equal(model.restraints, [[True, True, True], [False, False, False], [False, True, False]])
+    np.testing.assert_array_equal(model.releases, [[False, False], [False, True]])
+    np.testing.assert_allclose(model.member_loads, [[0.0, 0.0], [0.0, -2.0]])
+    np.testing.assert_allclose(model.flexural_stiffness, [2.0e7, 4.0e7])
+    np.testing.assert_allclose(model.loads[1], [5.0, 0.0, 1.0])
+    assert np.isfinite(solve_frame(model).reactions).all()
+
+
+@pytest.mark.parametrize(
+    "nodes, members, message",
+    [
+        ([(1, 0, 0), (2, 1, 0), (2, 2, 0)], [(1, 2)], "Duplicate node ids: 2"),
+        ([(1, 0, 0), (2, 1, 0)], [(1, 2), (2, 7), (9, 1)], "unknown nodes: 7, 9"),
+        ([(1, 0, 0), (2, 1, 0), (3, 1, 0)], [(1, 2), (2, 3)], "zero-length member(s): 2-3"),
+        ([(1, 0, 0), (2, "abc", 0)], [(1, 2)], "column 'x'"),
+    ],
+)
+def test_validation_names_the_offending_rows(tmp_path, nodes, members, message):
+    node_file = _write_csv(tmp_path / "nodes.csv", ["id", "x", "y"], nodes)
+    member_file = _write_csv(tmp_path / "members.csv", ["inicio", "fin"], members)
+    with pytest.raises(ModelImportError) as info:
+        read_truss(node_file, member_file)
+    assert message in str(info.value)
+
+
+def test_unknown_formats_and_supports_are_rejected(tmp_path):
+    node_file = _write_csv(tmp_path / "nodes.csv", ["id", "x", "y"], [(1, 0, 0), (2, 1, 0)])
+    member_file = _write_csv(tmp_path / "members.csv", ["inicio", "fin"], [(1, 2)])
+    with pytest.raises(ModelImportError, match="format"):
+        read_truss(tmp_path / "nodes.txt", member_file)
+    supports = _write_csv(tmp_path / "supports.csv", ["nodo", "apoyo"], [(1, "Rodillo")])
+    with pytest.raises(ModelImportError, match="(?i)rodillo"):
+        read_truss(node_file, member_file, supports)
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from mechanics.layout import ground_structure, optimise_layout
+from mechanics.truss import TrussComputationError, diagnose_truss, solve_truss_stiffness
+
+
+def test_ground_structure_skips_overlapping_and_long_candidates():
+    coordinates = [[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [1.0, 1.0]]
+    restraints = np.zeros((4, 2), dtype=bool)
+
+    full = ground_structure(coordinates, restraints)
+    pairs = {tuple(sorted(m)) for m in full.members.tolist()}
+    assert pairs == {(0, 1), (1, 2), (0, 3), (1, 3), (2, 3)}
+
+    short = ground_structure(coordinates, restraints, max_length=1.2)
+    assert {tuple(sorted(m)) for m in short.members.tolist()} == {(0, 1), (1, 2), (1, 3)}
+
+
+@pytest.mark.parametrize("compression_limit, volume", [(None, 2.0), (0.5, 4.0)])
+def test_two_bar_truss_reaches_the_analytical_volume(compression_limit, volume):
+    # Supports at (0, 0) and (2, 0), unit downward load at (1, 1): both bars
+    # are at 45° and carry P / sqrt(2) in compression over a length sqrt(2).
+    model = ground_structure(
+        [[0.0, 0.0], [2.0, 0.0], [1.0, 1.0]],
+        [[True, True], [True, True], [False, False]],
+        [[0.0, 0.0], [0.0, 0.0], [0.0, -1.0]],
+    )
+    result = optimise_layout(model, compression_limit=compression_limit)
+
+    assert result.converged
+    assert result.volume == pytest.approx(volume, rel=1e-5)
+    assert result.history[-1] == pytest.approx(result.volume, rel=1e-5)
+    assert result.active().sum() == 2
+    np.testing.assert_allclose(np.sort(result.forces[result.active()]), [-np.sqrt(0.5), -np.sqrt(0.5)], rtol=1e-5)
+
+
+def _cantilever(nx, ny):
+    x, y = np.meshgrid(np.linspace(0.0, 2.0, nx), np.linspace(0.0, 1.0, ny), indexing="ij")
+    coordinates = np.column_stack([x.ravel(), y.ravel()])
+    restraints = np.zeros_like(coordinates, dtype=bool)
+    restraints[coordinates[:, 0] == 0] = True
+    loads = np.zeros_like(coordinates)
+    loads[np.flatnonzero((coordinates[:, 0] == 2.0) & (coordinates[:, 1] == 0.5)), 1] = -1.0
+    return ground_structure(coordinates, restraints, loads)
+
+
+def test_cantilever_layout_is_stable_and_fully_stressed():
+    model = _cantilever(11, 5)
+    result = optimise_layout(model, tension_limit=1.0, compression_limit=0.5)
+    assert result.converged
+
+    optimum = result.layout()
+    assert optimum.num_members <= result.active().sum() < model.num_members // 10
+    assert diagnose_truss(optimum).num_mechanisms == 0
+
+    forces = solve_truss_stiffness(optimum).forces
+    stresses = forces / optimum.axial_stiffness
+    assert stresses.max() == pytest.approx(1.0, rel=1e-3)
+    assert stresses.min() == pytest.approx(-0.5, rel=1e-3)
+
+
+def test_dense_ground_structure_converges_below_the_coarse_volume():
+    # The 21 x 9 grid contains every node of the 11 x 5 one, so its optimum
+    # can only be lighter; member stiffnesses near the optimum span many
+    # orders of magnitude, which the normal-matrix scaling has to absorb.
+    coarse = optimise_layout(_cantilever(11, 5), compression_limit=0.5)
+    model = _cantilever(21, 9)
+    assert model.num_members > 10**4
+
+    result = optimise_layout(model, compression_limit=0.5)
+    assert result.converged
+    assert result.volume <= coarse.volume * (1.0 + 1e-6)
+    assert result.history[-1] == pytest.approx(result.volume, rel=1e-5)
+
+
+def test_unsupported_ground_structure_is_a_mechanism():
+    coordinates = [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]]
+    model = ground_structure(coordinates, np.zeros((3, 2), dtype=bool), [[0.0, 0.0], [1.0, 0.0], [0.0, 0.0]])
+    with pytest.raises(TrussComputationError):
+        optimise_layout(model)
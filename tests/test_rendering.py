@@ -0,0 +1,42 @@
+import numpy as np
+
+from mechanics.rendering import (
+    arrow_field,
+    force_colors,
+    hex_colors,
+    label_mask,
+    section_cut_points,
+    structure_arrays,
+)
+
+
+def test_structure_arrays_and_cut_points():
+    nodos = [{"id": "A", "x": 0.0, "y": 0.0}, {"id": "B", "x": 2.0, "y": 2.0}, {"id": "C", "x": 2.0, "y": 0.0}]
+    miembros = [{"inicio": "A", "fin": "B"}, {"inicio": "C", "fin": "B"}]
+    coords, members, index = structure_arrays(nodos, miembros)
+
+    np.testing.assert_array_equal(members, [[0, 1], [2, 1]])
+    assert index == {"A": 0, "B": 1, "C": 2}
+    # The second member lies on the cut line and is cut at mid-length.
+    np.testing.assert_allclose(section_cut_points(coords, members, 0.5, 0)[0], [0.5, 0.5])
+    np.testing.assert_allclose(section_cut_points(coords, members, 2.0, 0)[1], [2.0, 1.0])
+
+
+def test_force_colours_and_arrows():
+    colours = force_colors([-4.0, 0.0, 2.0])
+    np.testing.assert_allclose(colours, [[1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.5]])
+    assert hex_colors(colours) == ["#ff0000", "#000000", "#000080"]
+
+    origins, components, kept = arrow_field([[0, 0], [1, 1], [2, 2]], [[3, 4], [0, 0], [0, -2]], 0.5)
+    np.testing.assert_array_equal(kept, [True, False, True])
+    np.testing.assert_allclose(origins, [[0, 0], [2, 2]])
+    np.testing.assert_allclose(components, [[0.3, 0.4], [0.0, -0.5]])
+
+
+def test_label_mask_thins_labels_when_zoomed_out():
+    points = np.column_stack([np.arange(1000.0), np.zeros(1000)])
+
+    close = label_mask(points, (0.0, 20.0, -1.0, 1.0), max_labels=60)
+    assert np.flatnonzero(close).tolist() == list(range(21))
+    far = label_mask(points, (0.0, 1000.0, -1.0, 1.0), max_labels=64)
+    assert 0 < far.sum() <= 64
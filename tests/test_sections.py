@@ -0,0 +1,53 @@
+import math
+
+import numpy as np
+
+from mechanics import PointLoad, compute_beam_diagrams
+from mechanics.sections import select_section, standard_catalog
+
+
+def test_catalog_properties_match_published_values():
+    catalog = standard_catalog()
+    ipe = catalog.entry("IPE 300")
+    assert math.isclose(ipe.iy, 8356e-8, rel_tol=2e-3)
+    assert math.isclose(ipe.wy, 557e-6, rel_tol=2e-3)
+    assert math.isclose(ipe.mass, 42.2, rel_tol=5e-3)
+    assert np.all(np.diff(catalog.wy) >= 0)
+
+
+def test_selection_returns_lightest_feasible_profile():
+    catalog = standard_catalog().subset(["IPE", "HEA"])
+    choice = catalog.select(required_wy=500e-6)
+    feasible = catalog.wy >= 500e-6
+    assert choice.wy >= 500e-6
+    assert math.isclose(choice.mass, catalog.mass[feasible].min())
+
+    stiff = catalog.select(required_wy=500e-6, required_iy=20000e-8)
+    assert stiff.iy >= 20000e-8 and stiff.mass >= choice.mass
+
+    rows = catalog.select_many([1e-9, 500e-6, 1.0])
+    assert catalog.names[rows[1]] == choice.name and rows[2] == -1
+
+
+def test_select_section_from_beam_result():
+    diagrams = compute_beam_diagrams(length=6.0, point_loads=[PointLoad(position=3.0, magnitude=40e3)])
+    steel = standard_catalog().subset(["IPE"])
+    choice = select_section(diagrams, steel, allowable_stress=235e6)
+    assert choice.name == "IPE 240"
+    assert select_section(diagrams, steel).wy * 275e6 >= 60e3
+
+
+def test_capacity_selection_matches_a_scan_over_mixed_materials():
+    catalog = standard_catalog()
+    capacity = catalog.wy * catalog.strength
+    assert len(set(catalog.families)) > 1
+    for moment in [0.0, 1e3, 25e3, 180e3, 1e12]:
+        for required_iy in [0.0, 5000e-8]:
+            fits = np.flatnonzero((capacity >= moment) & (catalog.iy >= required_iy))
+            choice = catalog.select(required_moment=moment, required_iy=required_iy)
+            if fits.size == 0:
+                assert choice is None
+            else:
+                assert math.isclose(choice.mass, catalog.mass[fits].min())
+                assert choice.wy * choice.strength >= moment and choice.iy >= required_iy
+
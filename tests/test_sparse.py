@@ -0,0 +1,116 @@
+import numpy as np
+
+from mechanics.sparse import (
+    BandedCholesky,
+    BandedLU,
+    CSRMatrix,
+    CSRPattern,
+    SingularMatrixError,
+    bandwidth,
+    conjugate_gradient,
+    factorize,
+    permute,
+    reverse_cuthill_mckee,
+)
+
+
+def test_coo_assembly_sums_duplicates_and_multiplies():
+    rows = [0, 2, 0, 1, 2, 0]
+    cols = [1, 0, 1, 2, 2, 0]
+    values = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    matrix = CSRMatrix.from_coo(rows, cols, values, (4, 3))
+
+    dense = np.zeros((4, 3))
+    np.add.at(dense, (rows, cols), values)
+    np.testing.assert_array_equal(matrix.toarray(), dense)
+    assert matrix.nnz == 5
+
+    x = np.array([1.0, -2.0, 0.5])
+    block = np.column_stack([x, 2 * x])
+    np.testing.assert_allclose(matrix.matvec(x), dense @ x)
+    np.testing.assert_allclose(matrix @ block, dense @ block)
+    np.testing.assert_array_equal(matrix.T.toarray(), dense.T)
+
+
+def _shuffled_banded_system(n=120, seed=0):
+    rng = np.random.default_rng(seed)
+    dense = sum(np.diag(rng.normal(size=n - abs(k)), k) for k in range(-3, 4))
+    np.fill_diagonal(dense, 0.0)  # forces row interchanges
+    perm = rng.permutation(n)
+    dense = dense[perm][:, perm]
+    rows, cols = np.nonzero(dense)
+    return dense, CSRMatrix.from_coo(rows, cols, dense[rows, cols], dense.shape)
+
+
+def test_banded_factorization_with_rcm_matches_dense_solve():
+    dense, matrix = _shuffled_banded_system()
+    perm = reverse_cuthill_mckee(matrix)
+    assert max(bandwidth(permute(matrix, perm, perm))) < max(bandwidth(matrix))
+
+    rhs = np.random.default_rng(1).normal(size=(dense.shape[0], 3))
+    solver = factorize(matrix, method="banded")
+    np.testing.assert_allclose(dense @ solver.solve(rhs), rhs, atol=1e-9)
+    np.testing.assert_allclose(dense @ solver.solve(rhs[:, 0]), rhs[:, 0], atol=1e-9)
+
+
+def test_conjugate_gradient_and_singular_detection():
+    dense, matrix = _shuffled_banded_system()
+    spd = dense @ dense.T + dense.shape[0] * np.eye(dense.shape[0])
+    rows, cols = np.nonzero(spd)
+    spd_matrix = CSRMatrix.from_coo(rows, cols, spd[rows, cols], spd.shape)
+    rhs = np.arange(dense.shape[0], dtype=float)
+    np.testing.assert_allclose(spd @ conjugate_gradient(spd_matrix, rhs), rhs, atol=1e-6)
+
+    singular = CSRMatrix.from_coo([0, 0, 1, 1], [0, 1, 0, 1], [1.0, 2.0, 2.0, 4.0], (2, 2))
+    try:
+        BandedLU(singular)
+    except SingularMatrixError:
+        pass
+    else:
+        raise AssertionError("Expected a zero pivot")
+
+
+def test_blocked_banded_cholesky_matches_dense_and_rejects_indefinite_matrices():
+    dense, _ = _shuffled_banded_system(n=150)
+    spd = dense @ dense.T + np.eye(dense.shape[0])
+    rows, cols = np.nonzero(spd)
+    matrix = CSRMatrix.from_coo(rows, cols, spd[rows, cols], spd.shape)
+
+    rhs = np.random.default_rng(2).normal(size=(spd.shape[0], 2))
+    # A small block forces several window shifts, including a short last block.
+    perm = reverse_cuthill_mckee(matrix)
+    solver = BandedCholesky(permute(matrix, perm, perm), block=8)
+    x = np.empty_like(rhs)
+    x[perm] = solver.solve(rhs[perm])
+    np.testing.assert_allclose(spd @ x, rhs, atol=1e-9)
+    np.testing.assert_allclose(spd @ factorize(matrix, method="cholesky").solve(rhs), rhs, atol=1e-9)
+
+    indefinite = CSRMatrix.from_coo([0, 0, 1, 1], [0, 1, 0, 1], [1.0, 2.0, 2.0, 1.0], (2, 2))
+    try:
+        BandedCholesky(indefinite)
+    except SingularMatrixError:
+        pass
+    else:
+        raise AssertionError("Expected a non positive definite matrix to be rejected")
+
+
+def test_pattern_refill_matches_assembly_and_reuses_ordering():
+    rng = np.random.default_rng(4)
+    n = 300
+    i = np.concatenate([np.arange(n - 1), rng.integers(0, n, 40)])
+    j = np.concatenate([np.arange(1, n), rng.integers(0, n, 40)])
+    rows = np.concatenate([np.arange(n), i, j])
+    cols = np.concatenate([np.arange(n), j, i])
+    pattern = CSRPattern.from_coo(rows, cols, (n, n))
+
+    for _ in range(2):
+        links = rng.random(i.size)
+        values = np.concatenate([np.full(n, 2.0 * i.size), links, links])
+        expected = CSRMatrix.from_coo(rows, cols, values, (n, n))
+        matrix = pattern.fill(values)
+        np.testing.assert_allclose(matrix.toarray(), expected.toarray())
+
+        ordering = reverse_cuthill_mckee(matrix)
+        b = rng.random(n)
+        x = factorize(matrix, method="cholesky", ordering=ordering).solve(b)
+        np.testing.assert_allclose(matrix @ x, b, atol=1e-10)
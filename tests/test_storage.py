@@ -0,0 +1,41 @@
+import numpy as np
+
+from mechanics import (
+    MemmapResultSink,
+    PointLoad,
+    compute_beam_analysis,
+    compute_beam_diagrams,
+    open_results,
+)
+
+
+def test_sink_round_trip_matches_solver(tmp_path):
+    configs = [
+        {"length": 10.0, "point_loads": [PointLoad(position=5.0, magnitude=20.0)]},
+        {"length": 6.0, "distributed_loads": [(1.0, 4.0, 3.0)], "torsor": 2.0},
+    ]
+    with MemmapResultSink(tmp_path, capacity=4, num_points=50) as sink:
+        sink.append(compute_beam_diagrams(num_points=50, **configs[0]), label="first")
+        sink.append(compute_beam_analysis(num_points=50, **configs[1]), label="second")
+
+    stored = open_results(tmp_path)
+    assert len(stored) == 2
+    assert isinstance(stored.moment, np.memmap)
+    assert [record["label"] for record in stored.records] == ["first", "second"]
+
+    expected = compute_beam_analysis(num_points=50, **configs[1])
+    np.testing.assert_allclose(stored.moment[1], expected["diagrams"]["moment"])
+    np.testing.assert_allclose(stored.torsor[1], expected["torsor"]["values"])
+    assert stored.reaction("A")[0] == 10.0
+
+
+def test_sink_rejects_mismatched_resolution(tmp_path):
+    sink = MemmapResultSink(tmp_path, capacity=1, num_points=20)
+    try:
+        sink.append(compute_beam_diagrams(length=4.0, num_points=30))
+    except ValueError as exc:
+        assert "shape" in str(exc)
+    else:
+        raise AssertionError("Expected a shape mismatch error")
+    finally:
+        sink.close()
@@ -0,0 +1,43 @@
+import math
+
+from mechanics import PointLoad, compute_beam_analysis, compute_beam_diagrams
+from mechanics.stress import composite_section, compute_stress_field, rectangular_section
+
+
+def test_rectangular_section_peaks_match_closed_form():
+    diagrams = compute_beam_diagrams(
+        length=4.0, point_loads=[PointLoad(position=2.0, magnitude=1000.0)], num_points=401
+    )
+    section = rectangular_section(0.1, 0.2)
+    field = compute_stress_field(diagrams, section, num_y=201)
+
+    peak = field.max_normal
+    assert math.isclose(abs(peak.value), 1000.0 / (0.1 * 0.2**2 / 6.0), rel_tol=1e-9)
+    assert math.isclose(peak.x, 2.0)
+    assert peak.y in (0.0, 0.2)
+    # Sagging moment compresses the top fibre.
+    assert field.normal[200, -1] < 0 < field.normal[200, 0]
+
+    assert math.isclose(abs(field.max_shear.value), 1.5 * 500.0 / (0.1 * 0.2), rel_tol=1e-9)
+    assert math.isclose(field.max_shear.y, 0.1)
+
+
+def test_composite_section_matches_desktop_formulas():
+    b1, h1, b2, h2, b3, h3 = 20.0, 2.0, 1.0, 16.0, 12.0, 2.0
+    section = composite_section(b1, h1, b2, h2, b3, h3)
+
+    area = b1 * h1 + b2 * h2 + b3 * h3
+    y_cg = (b1 * h1 * (h2 + h3 + h1 / 2) + b2 * h2 * (h3 + h2 / 2) + b3 * h3 * (h3 / 2)) / area
+    inertia = (
+        b1 * h1**3 / 12 + b1 * h1 * (h2 + h3 + h1 / 2 - y_cg) ** 2
+        + b2 * h2**3 / 12 + b2 * h2 * (h3 + h2 / 2 - y_cg) ** 2
+        + b3 * h3**3 / 12 + b3 * h3 * (h3 / 2 - y_cg) ** 2
+    )
+    assert math.isclose(section.area, area)
+    assert math.isclose(section.centroid, y_cg)
+    assert math.isclose(section.inertia, inertia)
+    assert math.isclose(float(section.first_moment(0.0)), 0.0, abs_tol=1e-9)
+
+    result = compute_beam_analysis(length=6.0, distributed_loads=[(0.0, 6.0, 2.0)], num_points=61)
+    field = compute_stress_field(result, section, num_y=50)
+    assert field.normal.shape == (61, 50)
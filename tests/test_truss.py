@@ -0,0 +1,342 @@
+import math
+
+import numpy as np
+import pytest
+
+from mechanics.cuts import SectionCutIndex, miembros_cortados
+from mechanics.generators import pratt_truss, space_grid
+from mechanics.sparse import bandwidth, permute, row_column_ordering
+from mechanics.truss import (
+    NodeMemberIndex,
+    TrussComputationError,
+    TrussModel,
+    TrussSystem,
+    assemble_equilibrium,
+    diagnose_truss,
+    reduce_truss,
+    resolver_articulado,
+    resultantes_nodales,
+    solve_truss,
+    solve_truss_stiffness,
+    thermal_elongations,
+)
+
+
+NODOS = [
+    {"id": 1, "x": 0.0, "y": 0.0, "apoyo": "Fijo"},
+    {"id": 2, "x": 4.0, "y": 0.0, "apoyo": "Móvil"},
+    {"id": 3, "x": 2.0, "y": 2.0, "apoyo": "Libre"},
+]
+CARGAS = [{"nodo": 3, "Fx": 0.0, "Fy": -1000.0}]
+
+
+def test_dict_front_end_solves_triangle():
+    miembros = [{"inicio": 1, "fin": 2}, {"inicio": 2, "fin": 3}, {"inicio": 1, "fin": 3}]
+    fuerzas, reacciones, num_vars, num_eqs = resolver_articulado(NODOS, miembros, CARGAS)
+
+    assert (num_vars, num_eqs) == (6, 6)
+    assert math.isclose(fuerzas[0], 500.0)
+    assert math.isclose(fuerzas[1], -500.0 * math.sqrt(2.0))
+    assert math.isclose(fuerzas[2], -500.0 * math.sqrt(2.0))
+    assert set(reacciones) == {1, 2}
+    assert np.allclose(reacciones[1], (0.0, 500.0), atol=1e-9)
+    assert np.allclose(reacciones[2], (0.0, 500.0), atol=1e-9)
+
+
+def test_member_orientation_does_not_change_forces():
+    forward = [{"inicio": 1, "fin": 2}, {"inicio": 2, "fin": 3}, {"inicio": 1, "fin": 3}]
+    reverse = [{"inicio": m["fin"], "fin": m["inicio"]} for m in forward]
+    a = solve_truss(TrussModel.from_dicts(NODOS, forward, CARGAS))
+    b = solve_truss(TrussModel.from_dicts(NODOS, reverse, CARGAS))
+    np.testing.assert_allclose(a.forces, b.forces)
+    np.testing.assert_allclose(a.reactions, b.reactions)
+
+
+def test_banded_solve_matches_dense_on_long_truss():
+    panels = 150
+    xs = np.arange(panels + 1, dtype=float)
+    coordinates = np.concatenate([np.column_stack([xs, np.zeros_like(xs)]), np.column_stack([xs, np.ones_like(xs)])])
+    top = panels + 1
+    members = (
+        [(i, i + 1) for i in range(panels)]
+        + [(top + i, top + i + 1) for i in range(panels)]
+        + [(i, top + i) for i in range(panels + 1)]
+        + [(i, top + i + 1) for i in range(panels)]
+    )
+    restraints = np.zeros_like(coordinates, dtype=bool)
+    restraints[0] = True
+    restraints[panels, 1] = True
+    loads = np.zeros_like(coordinates)
+    loads[top:, 1] = -1.0
+    model = TrussModel.from_arrays(coordinates, members, restraints, loads)
+
+    A = assemble_equilibrium(model)
+    assert max(bandwidth(permute(A, *row_column_ordering(A)))) <= 4
+
+    banded = solve_truss(model, method="banded")
+    dense = solve_truss(model, method="dense")
+    assert banded.is_determinate
+    np.testing.assert_allclose(banded.forces, dense.forces, atol=1e-8)
+    np.testing.assert_allclose(banded.reactions.sum(axis=0), [0.0, panels + 1.0], atol=1e-8)
+
+
+def test_indeterminate_truss_uses_stiffness_method():
+    # Three bars meeting at a loaded node: the classic once-redundant case.
+    # With equal EA the vertical bar carries P / (1 + 2 cos^3 45deg).
+    nodos = [
+        {"id": 1, "x": -1.0, "y": 1.0, "apoyo": "Fijo"},
+        {"id": 2, "x": 0.0, "y": 1.0, "apoyo": "Fijo"},
+        {"id": 3, "x": 1.0, "y": 1.0, "apoyo": "Fijo"},
+        {"id": 4, "x": 0.0, "y": 0.0, "apoyo": "Libre"},
+    ]
+    miembros = [{"inicio": n, "fin": 4} for n in (1, 2, 3)]
+    cargas = [{"nodo": 4, "Fx": 0.0, "Fy": -1000.0}]
+    fuerzas, reacciones, num_vars, num_eqs = resolver_articulado(nodos, miembros, cargas)
+
+    assert num_vars > num_eqs
+    vertical = 1000.0 / (1.0 + 2.0 * math.cos(math.pi / 4) ** 3)
+    assert math.isclose(fuerzas[1], vertical)
+    assert math.isclose(fuerzas[0], fuerzas[2])
+    total = np.sum([reacciones[n] for n in (1, 2, 3)], axis=0)
+    np.testing.assert_allclose(total, (0.0, 1000.0), atol=1e-8)
+
+
+def test_stiffness_matches_joints_on_determinate_truss():
+    miembros = [{"inicio": 1, "fin": 2}, {"inicio": 2, "fin": 3}, {"inicio": 1, "fin": 3}]
+    model = TrussModel.from_dicts(NODOS, miembros, CARGAS)
+    joints = solve_truss(model)
+    for method in ("dense", "banded", "cg"):
+        stiffness = solve_truss_stiffness(model, method=method)
+        np.testing.assert_allclose(stiffness.forces, joints.forces, atol=1e-8)
+        np.testing.assert_allclose(stiffness.reactions, joints.reactions, atol=1e-8)
+
+
+def test_system_solves_load_cases_as_one_block():
+    miembros = [{"inicio": 1, "fin": 2}, {"inicio": 2, "fin": 3}, {"inicio": 1, "fin": 3}, {"inicio": 2, "fin": 3}]
+    model = TrussModel.from_dicts(NODOS, miembros)
+    casos = [
+        [{"nodo": 3, "Fx": 0.0, "Fy": -1000.0}],
+        [{"nodo": 3, "Fx": 250.0, "Fy": 0.0}],
+        [{"nodo": 3, "Fx": 250.0, "Fy": -1000.0}, {"nodo": 2, "Fx": -100.0, "Fy": 0.0}],
+    ]
+    loads = np.stack([model.loads_from_dicts(c) for c in casos])
+
+    system = TrussSystem(model)
+    result = system.solve(loads)
+
+    assert system.strategy == "stiffness"
+    assert result.forces.shape == (4, 3)
+    for k, cargas in enumerate(casos):
+        single = solve_truss(TrussModel.from_dicts(NODOS, miembros, cargas))
+        np.testing.assert_allclose(result.forces[:, k], single.forces, atol=1e-9)
+        np.testing.assert_allclose(result.reactions[k], single.reactions, atol=1e-9)
+
+
+def test_diagnostics_find_mechanisms_and_redundant_members():
+    triangle = [{"inicio": 1, "fin": 2}, {"inicio": 2, "fin": 3}, {"inicio": 1, "fin": 3}]
+    assert diagnose_truss(TrussModel.from_dicts(NODOS, triangle)).is_determinate
+
+    braced = diagnose_truss(TrussModel.from_dicts(NODOS, triangle + [{"inicio": 2, "fin": 3}]))
+    assert braced.is_stable and braced.degree_of_indeterminacy == 1
+    assert braced.redundant_members.tolist() in ([1], [3])
+
+    # Node 3 on the line between the supports: all three members collinear.
+    flat = [dict(n, y=0.0) for n in NODOS]
+    collinear = diagnose_truss(TrussModel.from_dicts(flat, triangle))
+    assert collinear.num_mechanisms == 1
+    assert collinear.mechanism_nodes.tolist() == [2]
+    try:
+        collinear.require_stable()
+    except TrussComputationError:
+        pass
+    else:
+        raise AssertionError("Expected an unstable truss")
+
+
+def test_zero_force_reduction_matches_full_solve():
+    # Pratt panel pair with two bare two-member joints hanging off the top
+    # chord and a bottom joint where the vertical is the only non-collinear member.
+    coordinates = np.array(
+        [[0.0, 0.0], [2.0, 0.0], [4.0, 0.0], [0.0, 2.0], [2.0, 2.0], [4.0, 2.0], [2.0, 3.5], [3.0, 3.0]]
+    )
+    members = [(0, 1), (1, 2), (3, 4), (4, 5), (0, 3), (1, 4), (2, 5), (0, 4), (4, 2), (4, 6), (6, 5), (5, 7), (7, 4)]
+    restraints = np.zeros_like(coordinates, dtype=bool)
+    restraints[0] = True
+    restraints[2, 1] = True
+    loads = np.zeros_like(coordinates)
+    loads[3, 1] = loads[5, 1] = -10.0
+    loads[4, 0] = 4.0
+
+    # The extra long diagonal makes the second variant indeterminate, which
+    # exercises the stiffness path and the displacement recovery.
+    for extra, stiffness in (([], None), ([(0, 5)], np.linspace(1.0, 2.0, len(members) + 1))):
+        model = TrussModel.from_arrays(coordinates, members + extra, restraints, loads, axial_stiffness=stiffness)
+        reduced = TrussSystem(model, reduce=True)
+        # Member 5 carries no force either but braces joint 1, so it stays.
+        assert reduced.reduction.zero_force_members.tolist() == [9, 10, 11, 12]
+        assert reduced.reduction.model.num_nodes == 6
+
+        full = TrussSystem(model)
+        assert full.strategy == ("stiffness" if extra else "joints")
+        full = full.solve(loads)
+        result = reduced.solve(loads)
+        np.testing.assert_allclose(result.forces, full.forces, atol=1e-9)
+        np.testing.assert_allclose(result.reactions, full.reactions, atol=1e-9)
+        if full.displacements is not None:
+            np.testing.assert_allclose(result.displacements, full.displacements, atol=1e-9)
+
+
+def test_node_member_index_resultants_match_member_scan():
+    miembros = [
+        {"inicio": 1, "fin": 2, "fuerza": 120.0},
+        {"inicio": 3, "fin": 2, "fuerza": -80.0},
+        {"inicio": 1, "fin": 3, "fuerza": 45.0},
+        {"inicio": 3, "fin": 3, "fuerza": 999.0},
+    ]
+    resultantes = resultantes_nodales(NODOS, miembros)
+
+    coords = {n["id"]: np.array([n["x"], n["y"]]) for n in NODOS}
+    for nodo in NODOS:
+        nid = nodo["id"]
+        expected = np.zeros(2)
+        for m in miembros:
+            vector = coords[m["fin"]] - coords[m["inicio"]]
+            if (m["inicio"] == nid or m["fin"] == nid) and np.linalg.norm(vector) > 0:
+                # A tension member pulls its start towards its end and vice versa.
+                pull = 1 if m["inicio"] == nid else -1
+                expected -= pull * m["fuerza"] * vector / np.linalg.norm(vector)
+        np.testing.assert_allclose(resultantes[nid], expected)
+
+    index = NodeMemberIndex.from_model(TrussModel.from_dicts(NODOS, miembros))
+    assert index.degree.tolist() == [2, 2, 4]
+    assert sorted(index.members_at(1)[0].tolist()) == [0, 1]
+
+
+def test_pin_forces_of_a_solved_portal_equal_loads_plus_reactions():
+    nodos = [
+        {"id": 1, "x": 0.0, "y": 0.0, "apoyo": "Fijo"},
+        {"id": 2, "x": 0.0, "y": 3.0, "apoyo": "Libre"},
+        {"id": 3, "x": 4.0, "y": 3.0, "apoyo": "Libre"},
+        {"id": 4, "x": 4.0, "y": 0.0, "apoyo": "Móvil"},
+    ]
+    miembros = [{"inicio": 1, "fin": 2}, {"inicio": 2, "fin": 3}, {"inicio": 3, "fin": 4}, {"inicio": 1, "fin": 3}]
+    cargas = [{"nodo": 2, "Fx": 1000.0, "Fy": 0.0}]
+    fuerzas, reacciones, _, _ = resolver_articulado(nodos, miembros, cargas)
+    for m, fuerza in zip(miembros, fuerzas):
+        m["fuerza"] = fuerza
+
+    # By hand: the beam 2-3 carries the load in compression into node 3 and
+    # the column 1-2 is unloaded, so the pin at node 2 passes on the load;
+    # moments about node 1 give the support reactions.
+    np.testing.assert_allclose(fuerzas[:2], [0.0, -1000.0], atol=1e-9)
+    np.testing.assert_allclose(reacciones[1], (-1000.0, -750.0), atol=1e-9)
+    np.testing.assert_allclose(reacciones[4], (0.0, 750.0), atol=1e-9)
+
+    resultantes = resultantes_nodales(nodos, miembros)
+    np.testing.assert_allclose(resultantes[2], (1000.0, 0.0), atol=1e-9)
+    np.testing.assert_allclose(resultantes[3], (0.0, 0.0), atol=1e-9)
+    np.testing.assert_allclose(resultantes[1], reacciones[1], atol=1e-9)
+    np.testing.assert_allclose(resultantes[4], reacciones[4], atol=1e-9)
+
+
+def test_space_tripod_from_dicts_with_partial_restraints():
+    nodos = [
+        {"id": "A", "x": 0.0, "y": 0.0, "z": 0.0, "apoyo": "Fijo"},
+        {"id": "B", "x": 4.0, "y": 0.0, "z": 0.0, "restricciones": "yz"},
+        {"id": "C", "x": 2.0, "y": 3.0, "z": 0.0, "restricciones": [False, False, True]},
+        {"id": "D", "x": 2.0, "y": 1.0, "z": 3.0, "apoyo": "Libre"},
+    ]
+    miembros = [
+        {"inicio": a, "fin": b}
+        for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("A", "D"), ("B", "D"), ("C", "D")]
+    ]
+    cargas = [{"nodo": "D", "Fx": 0.0, "Fy": 0.0, "Fz": -900.0}]
+
+    fuerzas, reacciones, num_vars, num_eqs = resolver_articulado(nodos, miembros, cargas)
+    assert num_vars == num_eqs == 12
+    np.testing.assert_allclose(np.sum(list(reacciones.values()), axis=0), [0.0, 0.0, 900.0], atol=1e-9)
+    # Vertical reactions follow from moments about the base edges.
+    assert reacciones["C"][2] == pytest.approx(300.0)
+    assert reacciones["A"][2] == pytest.approx(reacciones["B"][2])
+    assert all(f < 0 for f in fuerzas[3:])
+
+    model = TrussModel.from_dicts(nodos, miembros, cargas)
+    assert model.dim == 3 and model.restraints.sum() == 6
+    again = TrussModel.from_dicts(*model.to_dicts())
+    np.testing.assert_array_equal(again.restraints, model.restraints)
+    np.testing.assert_array_equal(again.loads, model.loads)
+
+
+def test_space_grid_diagnostics_reduction_and_plane_cuts():
+    grid = space_grid(4, 3)
+    diagnostics = diagnose_truss(grid)
+    assert diagnostics.is_stable and diagnostics.degree_of_indeterminacy > 0
+
+    system = TrussSystem(grid, method="banded")
+    assert system.strategy == "stiffness"
+    result = system.solve(grid.loads)
+    np.testing.assert_allclose(result.reactions[0].sum(axis=0), [0.0, 0.0, 12.0], atol=1e-9)
+    reduced = TrussSystem(grid, reduce=True).solve(grid.loads)
+    np.testing.assert_allclose(reduced.forces, result.forces, atol=1e-9)
+    assert reduce_truss(grid).model.num_members <= grid.num_members
+
+    # A horizontal plane between the layers cuts exactly the web members.
+    index = SectionCutIndex(grid, (0.0, 0.0, 1.0))
+    web = np.flatnonzero(np.ptp(grid.coordinates[grid.members][:, :, 2], axis=1) > 0)
+    np.testing.assert_array_equal(index.query(0.5), web)
+    nodos, miembros, _ = grid.to_dicts()
+    assert miembros_cortados(nodos, miembros, 0.5, "z") == web.tolist()
+
+
+def test_thermal_cases_share_one_factorization():
+    # A bar between two pins cannot expand: N = -EA alpha dT.
+    bar = TrussModel.from_arrays([[0.0, 0.0], [3.0, 4.0]], [(0, 1)], np.ones((2, 2), dtype=bool), axial_stiffness=2.0e8)
+    result = TrussSystem(bar, strategy="stiffness").solve_imposed(elongations=thermal_elongations(bar, 12e-6, 30.0))
+    np.testing.assert_allclose(result.forces[0, 0], -2.0e8 * 12e-6 * 30.0)
+    np.testing.assert_allclose(result.reactions[0, 0], 2.0e8 * 12e-6 * 30.0 * np.array([0.6, 0.8]))
+
+    # A determinate truss expands freely; a second pin makes it indeterminate
+    # and the forces scale with every temperature case.
+    model = pratt_truss(8, panel_length=2.0, depth=1.5, load=-10.0)
+    temperatures = np.array([-20.0, -10.0, 10.0, 20.0, 30.0, 40.0])[:, None]
+    free = TrussSystem(model, strategy="stiffness").solve_imposed(
+        elongations=thermal_elongations(model, 12e-6, temperatures)
+    )
+    np.testing.assert_allclose(free.forces, 0.0, atol=1e-9)
+    span = model.coordinates[:, 0].max() - model.coordinates[:, 0].min()
+    np.testing.assert_allclose(np.ptp(free.displacements[:, :, 0], axis=1), 12e-6 * np.abs(temperatures[:, 0]) * span)
+
+    pinned = TrussModel.from_arrays(
+        model.coordinates,
+        model.members,
+        model.restraints | model.restraints.any(axis=1)[:, None],
+        model.loads,
+        axial_stiffness=2.0e8,
+    )
+    system = TrussSystem(pinned, strategy="stiffness")
+    cases = system.solve_imposed(pinned.loads, elongations=thermal_elongations(pinned, 12e-6, temperatures))
+    mechanical = system.solve(pinned.loads)
+    thermal = cases.forces - mechanical.forces
+    np.testing.assert_allclose(thermal, thermal[:, [-1]] / 40.0 * temperatures[:, 0], rtol=1e-7, atol=1e-6)
+    assert np.abs(thermal).max() > 1e3
+    np.testing.assert_allclose(cases.reactions.sum(axis=1) + pinned.loads.sum(axis=0), 0.0, atol=1e-6)
+
+
+def test_support_settlements_match_imposed_displacements():
+    bar = TrussModel.from_arrays([[0.0, 0.0], [2.0, 0.0]], [(0, 1)], np.ones((2, 2), dtype=bool), axial_stiffness=5.0)
+    result = TrussSystem(bar, strategy="stiffness").solve_imposed(settlements=[[0.0, 0.0], [0.01, 0.0]])
+    np.testing.assert_allclose(result.forces[:, 0], [5.0 * 0.01 / 2.0])
+
+    # Settling a support of a determinate truss moves it rigidly.
+    model = pratt_truss(6)
+    roller = np.flatnonzero(model.restraints.sum(axis=1) == 1)[0]
+    settlements = np.zeros((2, model.num_nodes, 2))
+    settlements[1, roller, 1] = -0.02
+    result = TrussSystem(model, strategy="stiffness").solve_imposed(settlements=settlements)
+    np.testing.assert_allclose(result.forces, 0.0, atol=1e-12)
+    np.testing.assert_allclose(result.displacements[1, roller, 1], -0.02)
+
+    with pytest.raises(TrussComputationError):
+        TrussSystem(model, strategy="stiffness").solve_imposed(settlements=np.ones((model.num_nodes, 2)))
+    with pytest.raises(TrussComputationError):
+        TrussSystem(model, strategy="joints").solve_imposed(elongations=np.ones(model.num_members))
@@ -1,6 +1,6 @@
 import math
 
-from mechanics import DistributedLoad, PointLoad, compute_beam_analysis, torsor_at
+from mechanics import DistributedLoad, PointLoad, compute_beam_analysis, compute_beam_diagrams, torsor_at
 
 
 def _almost_equal(a: float, b: float, tol: float = 1e-6) -> bool:
@@ -50,3 +50,29 @@ def test_support_c_requires_position():
         assert "posicion" in str(exc).lower() or "position" in str(exc).lower()
     else:
         raise AssertionError("Expected ValueError for missing support C position")
+
+
+def test_load_index_matches_torsor_at_for_arbitrary_points():
+    point_loads = [PointLoad(position=2.0, magnitude=15.0), PointLoad(position=7.5, magnitude=-4.0)]
+    distributed = [DistributedLoad(start=1.0, end=6.0, intensity=3.0)]
+    diagrams = compute_beam_diagrams(
+        length=10.0,
+        support_c_type="Fijo",
+        support_c_position=5.0,
+        point_loads=point_loads,
+        distributed_loads=distributed,
+        torsor=1.5,
+    )
+    sensors = [0.0, 1.0, 2.0, 3.3, 5.0, 6.0, 7.5, 9.99, 10.0]
+    values = diagrams.index.torsor(sensors)
+    for x, value in zip(sensors, values):
+        expected = torsor_at(
+            x,
+            length=10.0,
+            reactions=diagrams.reactions,
+            torsor_base=1.5,
+            support_c_position=5.0,
+            point_loads=point_loads,
+            distributed_loads=distributed,
+        )
+        assert _almost_equal(value, expected)